@@ -19,6 +19,8 @@ class Bundle(object):
                  related_name=None,
                  objects_saved=None,
                  related_objects_to_save=None,
+                 sparse_fields=None,
+                 expand=None,
                  ):
         self.obj = obj
         self.data = data or {}
@@ -28,6 +30,10 @@ class Bundle(object):
         self.errors = {}
         self.objects_saved = objects_saved or set()
         self.related_objects_to_save = related_objects_to_save or {}
+        # Limits the fields ``full_dehydrate`` fills in, if not ``None``.
+        self.sparse_fields = sparse_fields
+        # The related fields to include in full, as a tree of field names.
+        self.expand = expand
 
     def __repr__(self):
         return "<Bundle for obj: '%s' and with data: '%s'>" % (self.obj, self.data)
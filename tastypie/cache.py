@@ -25,12 +25,42 @@ class NoCache(object):
         """
         return None
 
+    def get_many(self, keys):
+        """
+        Gets several keys at once, returning a dictionary of the ones found.
+
+        Calls ``get`` for each of them. ``SimpleCache`` fetches them with a
+        single round-trip.
+        """
+        found = {}
+
+        for key in keys:
+            value = self.get(key)
+
+            if value is not None:
+                found[key] = value
+
+        return found
+
     def set(self, key, value, timeout=60):
         """
         No-op for setting values in the cache.
         """
         pass
 
+    def set_many(self, data, timeout=None):
+        """
+        Sets several key-values (a dictionary) at once.
+
+        Calls ``set`` for each of them. ``SimpleCache`` stores them with a
+        single round-trip.
+        """
+        for key, value in data.items():
+            if timeout is None:
+                self.set(key, value)
+            else:
+                self.set(key, value, timeout)
+
     def cacheable(self, request, response):
         """
         Returns True or False if the request -> response is capable of being
@@ -70,6 +100,13 @@ class SimpleCache(NoCache):
         """
         return self.cache.get(key, **kwargs)
 
+    def get_many(self, keys):
+        """
+        Gets several keys from the cache at once, returning a dictionary of
+        the ones found.
+        """
+        return self.cache.get_many(keys)
+
     def set(self, key, value, timeout=None):
         """
         Sets a key-value in the cache.
@@ -83,6 +120,18 @@ class SimpleCache(NoCache):
 
         self.cache.set(key, value, timeout)
 
+    def set_many(self, data, timeout=None):
+        """
+        Sets several key-values (a dictionary) in the cache at once.
+
+        Optionally accepts a ``timeout`` in seconds. Defaults to ``None`` which
+        uses the resource's default timeout.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        self.cache.set_many(data, timeout)
+
     def cache_control(self):
         control = {
             'max_age': self.timeout,
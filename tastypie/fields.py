@@ -4,6 +4,7 @@ from dateutil.parser import parse
 from decimal import Decimal
 import re
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
+from django.db.models import Avg, Count, Max, Min, Sum
 from django.utils import datetime_safe, importlib
 from django.utils import six
 from tastypie.bundle import Bundle
@@ -20,12 +21,79 @@ DATE_REGEX = re.compile('^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2}).*?$')
 DATETIME_REGEX = re.compile('^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})(T|\s+)(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}).*?$')
 
 
+def compile_attribute_accessor(attribute, strict=False, ignore_missing=False):
+    """
+    Compiles an ``attribute`` path (which may use ``__`` to look through
+    relations) into a function that walks it on a given object.
+
+    The function returns a ``(value, previous_object, attr)`` tuple, where
+    ``previous_object`` & ``attr`` are the last lookup made, for use in error
+    messages.
+
+    By default, missing attributes count as ``None`` & the walk stops at the
+    first ``None``. If ``ignore_missing`` is set, ``ObjectDoesNotExist`` (an
+    empty reverse relation) also counts as ``None``. If ``strict`` is set,
+    it's a plain chain of ``getattr`` calls that lets any error through.
+    """
+    attrs = tuple(attribute.split('__'))
+
+    if strict:
+        def accessor(obj):
+            previous_object = current_object = obj
+
+            for attr in attrs:
+                previous_object = current_object
+                current_object = getattr(current_object, attr)
+
+            return current_object, previous_object, attr
+
+        return accessor
+
+    if len(attrs) == 1:
+        # The common case, with no relations to look through.
+        if ignore_missing:
+            def accessor(obj):
+                try:
+                    return getattr(obj, attribute, None), obj, attribute
+                except ObjectDoesNotExist:
+                    return None, obj, attribute
+        else:
+            def accessor(obj):
+                return getattr(obj, attribute, None), obj, attribute
+
+        return accessor
+
+    def accessor(obj):
+        previous_object = current_object = obj
+
+        for attr in attrs:
+            previous_object = current_object
+
+            try:
+                current_object = getattr(current_object, attr, None)
+            except ObjectDoesNotExist:
+                if not ignore_missing:
+                    raise
+
+                current_object = None
+
+            if current_object is None:
+                break
+
+        return current_object, previous_object, attr
+
+    return accessor
+
+
 # All the ApiField variants.
 
 class ApiField(object):
     """The base implementation of a field used by the resources."""
     dehydrated_type = 'string'
     help_text = ''
+    # Whether an ``ObjectDoesNotExist`` while following ``attribute`` counts
+    # as an empty value.
+    ignore_missing = False
 
     def __init__(self, attribute=None, default=NOT_PROVIDED, null=False, blank=False, readonly=False, unique=False, help_text=None, use_in='all'):
         """
@@ -69,6 +137,7 @@ class ApiField(object):
         self.instance_name = None
         self._resource = None
         self.attribute = attribute
+        self._attribute_accessors = {}
         self._default = default
         self.null = null
         self.blank = blank
@@ -93,6 +162,22 @@ class ApiField(object):
         """Returns a boolean of whether this field has a default value."""
         return self._default is not NOT_PROVIDED
 
+    def get_attribute_accessor(self, strict=False):
+        """
+        Returns a function which walks the field's ``attribute`` on an object.
+
+        The ``__`` lookups are only split once per ``attribute`` value rather
+        than for every object. See ``compile_attribute_accessor``.
+        """
+        key = (self.attribute, strict)
+
+        try:
+            return self._attribute_accessors[key]
+        except KeyError:
+            accessor = compile_attribute_accessor(self.attribute, strict=strict, ignore_missing=self.ignore_missing)
+            self._attribute_accessors[key] = accessor
+            return accessor
+
     @property
     def default(self):
         """Returns the default value for the field."""
@@ -107,27 +192,15 @@ class ApiField(object):
         resource.
         """
         if self.attribute is not None:
-            # Check for `__` in the field for looking through the relation.
-            attrs = self.attribute.split('__')
-            current_object = bundle.obj
-
-            for attr in attrs:
-                previous_object = current_object
-                current_object = getattr(current_object, attr, None)
+            # Follows any `__` through the relation, stopping at the first
+            # empty value.
+            current_object, previous_object, attr = self.get_attribute_accessor()(bundle.obj)
 
-                if current_object is None:
-                    if self.has_default():
-                        current_object = self._default
-                        # Fall out of the loop, given any further attempts at
-                        # accesses will fail miserably.
-                        break
-                    elif self.null:
-                        current_object = None
-                        # Fall out of the loop, given any further attempts at
-                        # accesses will fail miserably.
-                        break
-                    else:
-                        raise ApiFieldError("The object '%r' has an empty attribute '%s' and doesn't allow a default or null value." % (previous_object, attr))
+            if current_object is None:
+                if self.has_default():
+                    current_object = self._default
+                elif not self.null:
+                    raise ApiFieldError("The object '%r' has an empty attribute '%s' and doesn't allow a default or null value." % (previous_object, attr))
 
             if callable(current_object):
                 current_object = current_object()
@@ -167,12 +240,7 @@ class ApiField(object):
                 return getattr(bundle.obj, self.attribute)
             elif '__' in self.attribute:
                 # Check for `__` in the field for looking through the relation.
-                attrs = self.attribute.split('__')
-                current_object = bundle.obj
-
-                for attr in attrs:
-                    previous_object = current_object
-                    current_object = getattr(current_object, attr, None)
+                current_object = self.get_attribute_accessor()(bundle.obj)[0]
 
                 if current_object is not None:
                     return current_object
@@ -421,6 +489,7 @@ class RelatedField(ApiField):
     dehydrated_type = 'related'
     is_related = True
     self_referential = False
+    ignore_missing = True
     help_text = 'A related resource. Can be either a URI or set of nested resource data.'
 
     def __init__(self, to, attribute, related_name=None, default=NOT_PROVIDED, null=False, blank=False, readonly=False, full=False, unique=False, help_text=None, use_in='all', full_list=True, full_detail=True):
@@ -483,6 +552,7 @@ class RelatedField(ApiField):
         self._resource = None
         self.to = to
         self.attribute = attribute
+        self._attribute_accessors = {}
         self.related_name = related_name
         self._default = default
         self.null = null
@@ -576,7 +646,8 @@ class RelatedField(ApiField):
             bundle = related_resource.build_bundle(
                 obj=related_resource.instance,
                 request=bundle.request,
-                objects_saved=bundle.objects_saved
+                objects_saved=bundle.objects_saved,
+                expand=bundle.expand
             )
             return related_resource.full_dehydrate(bundle)
 
@@ -679,11 +750,30 @@ class RelatedField(ApiField):
         else:
             raise ApiFieldError("The '%s' field was given data that was not a URI, not a dictionary-alike and does not have a 'pk' attribute: %s." % (self.instance_name, value))
 
+    def get_related_expand(self, bundle):
+        """
+        Returns the expansions requested (through ``Resource.get_expansions``)
+        for the related resource of this field, or ``None`` if the field
+        wasn't expanded for the given (parent) bundle.
+        """
+        expand = getattr(bundle, 'expand', None)
+
+        if not expand:
+            return None
+
+        return expand.get(self.instance_name)
+
     def should_full_dehydrate(self, bundle, for_list):
         """
         Based on the ``full``, ``list_full`` and ``detail_full`` returns ``True`` or ``False``
         indicating weather the resource should be fully dehydrated.
+
+        Related bundles that were expanded for the request are always fully
+        dehydrated.
         """
+        if getattr(bundle, 'expand', None) is not None:
+            return True
+
         should_dehydrate_full_resource = False
         if self.full:
             is_details_view = not for_list
@@ -718,17 +808,11 @@ class ToOneField(RelatedField):
 
     def dehydrate(self, bundle, for_list=True):
         foreign_obj = None
+        previous_obj = bundle.obj
+        attr = self.attribute
 
         if isinstance(self.attribute, six.string_types):
-            attrs = self.attribute.split('__')
-            foreign_obj = bundle.obj
-
-            for attr in attrs:
-                previous_obj = foreign_obj
-                try:
-                    foreign_obj = getattr(foreign_obj, attr, None)
-                except ObjectDoesNotExist:
-                    foreign_obj = None
+            foreign_obj, previous_obj, attr = self.get_attribute_accessor()(bundle.obj)
         elif callable(self.attribute):
             foreign_obj = self.attribute(bundle)
 
@@ -739,7 +823,7 @@ class ToOneField(RelatedField):
             return None
 
         self.fk_resource = self.get_related_resource(foreign_obj)
-        fk_bundle = Bundle(obj=foreign_obj, request=bundle.request)
+        fk_bundle = Bundle(obj=foreign_obj, request=bundle.request, expand=self.get_related_expand(bundle))
         return self.dehydrate_related(fk_bundle, self.fk_resource, for_list=for_list)
 
     def hydrate(self, bundle):
@@ -800,19 +884,7 @@ class ToManyField(RelatedField):
         attr = self.attribute
 
         if isinstance(self.attribute, six.string_types):
-            attrs = self.attribute.split('__')
-            the_m2ms = bundle.obj
-
-            for attr in attrs:
-                previous_obj = the_m2ms
-                try:
-                    the_m2ms = getattr(the_m2ms, attr, None)
-                except ObjectDoesNotExist:
-                    the_m2ms = None
-
-                if not the_m2ms:
-                    break
-
+            the_m2ms, previous_obj, attr = self.get_attribute_accessor()(bundle.obj)
         elif callable(self.attribute):
             the_m2ms = self.attribute(bundle)
 
@@ -827,9 +899,11 @@ class ToManyField(RelatedField):
 
         # TODO: Also model-specific and leaky. Relies on there being a
         #       ``Manager`` there.
+        related_expand = self.get_related_expand(bundle)
+
         for m2m in the_m2ms.all():
             m2m_resource = self.get_related_resource(m2m)
-            m2m_bundle = Bundle(obj=m2m, request=bundle.request)
+            m2m_bundle = Bundle(obj=m2m, request=bundle.request, expand=related_expand)
             self.m2m_resources.append(m2m_resource)
             m2m_dehydrated.append(self.dehydrate_related(m2m_bundle, m2m_resource, for_list=for_list))
 
@@ -910,3 +984,140 @@ class TimeField(ApiField):
             value = self.to_time(value)
 
         return value
+
+
+class AggregateField(ApiField):
+    """
+    A read-only field computed in the database by annotating an aggregate
+    over ``lookup`` onto each row of the ``QuerySet``.
+
+    Only ``ModelResource`` applies the annotations (see
+    ``ModelResource.get_annotations``). The value is then read back off the
+    annotated ``attribute``, which defaults to the field's name, so it can
+    be used in ``Meta.filtering`` & ``Meta.ordering`` like a regular column.
+    """
+    is_annotation = True
+    aggregate_class = None
+
+    def __init__(self, lookup, attribute=None, default=NOT_PROVIDED, null=True, help_text=None, use_in='all', **aggregate_kwargs):
+        """
+        Requires a ``lookup``, the ORM path (which may use ``__`` to look
+        through relations) being aggregated. Any extra keyword arguments
+        (like ``distinct``) are handed to the aggregate.
+
+        Aggregate fields are always ``readonly`` & ``blank``. ``null``
+        defaults to ``True``, since most aggregates over no rows are ``NULL``.
+        The remaining options are the same as ``ApiField``.
+        """
+        super(AggregateField, self).__init__(attribute=attribute, default=default, null=null, blank=True, readonly=True, help_text=help_text, use_in=use_in)
+        self.lookup = lookup
+        self.aggregate_kwargs = aggregate_kwargs
+
+    def contribute_to_class(self, cls, name):
+        super(AggregateField, self).contribute_to_class(cls, name)
+
+        if self.attribute is None:
+            self.attribute = name
+
+    def get_aggregate(self):
+        """
+        Returns the aggregate to annotate onto the ``QuerySet`` under the
+        field's ``attribute``.
+        """
+        return self.aggregate_class(self.lookup, **self.aggregate_kwargs)
+
+    def build_filter(self, filter_type, value):
+        """
+        Translates a filter on the field into the ``(filter_type, value)``
+        applied to the annotation. Returns it unchanged by default.
+        """
+        return filter_type, value
+
+
+class CountField(AggregateField):
+    """
+    The number of related rows along ``lookup``.
+
+    Counts distinct rows by default, so several ``CountField`` on different
+    relations don't inflate each other through their joins.
+    """
+    aggregate_class = Count
+    dehydrated_type = 'integer'
+    help_text = 'Integer data. Ex: 2673'
+
+    def __init__(self, lookup, distinct=True, **kwargs):
+        super(CountField, self).__init__(lookup, distinct=distinct, **kwargs)
+
+    def convert(self, value):
+        if value is None:
+            return None
+
+        return int(value)
+
+
+class ExistsField(CountField):
+    """
+    Whether there are any related rows along ``lookup``.
+
+    Filters on the field accept a boolean, which is translated into a
+    comparison against the underlying count.
+    """
+    dehydrated_type = 'boolean'
+    help_text = 'Boolean data. Ex: True'
+
+    def convert(self, value):
+        if value is None:
+            return None
+
+        return bool(value)
+
+    def build_filter(self, filter_type, value):
+        if filter_type == 'exact':
+            if value:
+                return 'gt', 0
+
+            return 'exact', 0
+
+        return filter_type, value
+
+
+class SumField(AggregateField):
+    """
+    The sum of the values along ``lookup``.
+
+    As with any aggregate, combining it with other aggregates over
+    different multi-valued relations repeats rows through the joins.
+    """
+    aggregate_class = Sum
+    help_text = 'The sum of the related values.'
+
+
+class AvgField(AggregateField):
+    """
+    The average of the values along ``lookup``.
+    """
+    aggregate_class = Avg
+    dehydrated_type = 'float'
+    help_text = 'Floating point numeric data. Ex: 26.73'
+
+    def convert(self, value):
+        if value is None:
+            return None
+
+        return float(value)
+
+
+class MinField(AggregateField):
+    """
+    The smallest of the values along ``lookup``.
+    """
+    aggregate_class = Min
+    help_text = 'The smallest of the related values.'
+
+
+class MaxField(AggregateField):
+    """
+    The largest of the values along ``lookup``.
+    """
+    aggregate_class = Max
+    help_text = 'The largest of the related values.'
@@ -1,7 +1,19 @@
 from __future__ import unicode_literals
+import base64
+import binascii
+import datetime
+import decimal
+import hashlib
+import json
 
 from django.conf import settings
+from django.core.cache import get_cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import Model, Q
+from django.db.models.sql.datastructures import EmptyResultSet
 from django.utils import six
+from django.utils.encoding import force_bytes
 
 from tastypie.exceptions import BadRequest
 
@@ -11,6 +23,10 @@ except ImportError:
     from urllib import urlencode
 
 
+# The ways ``total_count`` can be worked out.
+COUNT_MODES = ('exact', 'none', 'cached', 'estimated')
+
+
 class Paginator(object):
     """
     Limits result sets down to sane amounts for passing to the client.
@@ -23,7 +39,14 @@ class Paginator(object):
     ``total_count`` of resources seen and convenience links to the
     ``previous``/``next`` pages of data as available.
     """
-    def __init__(self, request_data, objects, resource_uri=None, limit=None, offset=0, max_limit=1000, collection_name='objects'):
+    # Used by the ``cached`` count mode.
+    count_cache_name = 'default'
+    count_cache_timeout = 300
+    # Used by the ``estimated`` count mode. Below this many rows, the exact
+    # count is cheap enough to run anyway.
+    estimate_threshold = 10000
+
+    def __init__(self, request_data, objects, resource_uri=None, limit=None, offset=0, max_limit=1000, collection_name='objects', count_mode='exact'):
         """
         Instantiates the ``Paginator`` and allows for some configuration.
 
@@ -44,6 +67,10 @@ class Paginator(object):
         Optionally accepts a ``max_limit`` argument, which the upper bound
         limit. Defaults to ``1000``. If you set it to 0 or ``None``, no upper
         bound will be enforced.
+
+        Optionally accepts a ``count_mode`` argument, which controls how the
+        ``total_count`` is worked out. One of ``exact``, ``none``, ``cached``
+        or ``estimated``. Defaults to ``exact``.
         """
         self.request_data = request_data
         self.objects = objects
@@ -52,6 +79,7 @@ class Paginator(object):
         self.offset = offset
         self.resource_uri = resource_uri
         self.collection_name = collection_name
+        self.count_mode = count_mode
 
     def get_limit(self):
         """
@@ -118,6 +146,19 @@ class Paginator(object):
 
         return self.objects[offset:offset + limit]
 
+    def get_slice_with_next(self, limit, offset):
+        """
+        Like ``get_slice``, but fetches one extra result to see if there's
+        a next page, rather than needing the count.
+
+        Returns ``(objects, has_next)``.
+        """
+        if limit == 0:
+            return self.objects[offset:], False
+
+        objects = list(self.objects[offset:offset + limit + 1])
+        return objects[:limit], len(objects) > limit
+
     def get_count(self):
         """
         Returns a count of the total number of objects seen.
@@ -128,6 +169,123 @@ class Paginator(object):
             # If it's not a QuerySet (or it's ilk), fallback to ``len``.
             return len(self.objects)
 
+    def get_count_mode(self):
+        """
+        Determines how the ``total_count`` should be worked out.
+
+        The user may pass ``count_mode=none`` in the GET parameters to skip
+        counting altogether. Otherwise, the object-level ``count_mode`` is
+        used.
+        """
+        count_mode = self.request_data.get('count_mode', self.count_mode)
+
+        if count_mode not in COUNT_MODES:
+            raise BadRequest("Invalid count_mode '%s' provided. Please provide one of: %s." % (count_mode, ', '.join(COUNT_MODES)))
+
+        if count_mode not in ('none', self.count_mode):
+            raise BadRequest("The count_mode '%s' is not allowed here. Please provide either 'none' or '%s'." % (count_mode, self.count_mode))
+
+        return count_mode
+
+    def get_count_cache_key(self):
+        """
+        Returns the cache key for the count of ``objects``, built from the
+        query, so any filtering, authorization limits, etc. get a separate
+        entry.
+
+        Returns ``None`` if ``objects`` isn't a ``QuerySet``.
+        """
+        try:
+            sql, params = self.objects.query.sql_with_params()
+        except AttributeError:
+            return None
+        except EmptyResultSet:
+            # Nothing to count, so ``get_count`` is cheap.
+            return None
+
+        digest = hashlib.md5(force_bytes('%s:%s:%r' % (self.objects.db, sql, params))).hexdigest()
+        return 'tastypie:count:%s' % digest
+
+    def get_cached_count(self):
+        """
+        Returns the count of ``objects``, memoized in the
+        ``count_cache_name`` cache for ``count_cache_timeout`` seconds.
+        """
+        cache_key = self.get_count_cache_key()
+
+        if cache_key is None:
+            return self.get_count()
+
+        cache = get_cache(self.count_cache_name)
+        count = cache.get(cache_key)
+
+        if count is None:
+            count = self.get_count()
+            cache.set(cache_key, count, self.count_cache_timeout)
+
+        return count
+
+    def get_estimated_count(self):
+        """
+        Returns the database query planner's estimate of how many rows
+        ``objects`` holds, which avoids scanning them.
+
+        Only PostgreSQL & MySQL provide an estimate. Returns ``None`` if no
+        estimate is available.
+        """
+        try:
+            using = self.objects.db
+            sql, params = self.objects.query.sql_with_params()
+        except (AttributeError, EmptyResultSet):
+            return None
+
+        connection = connections[using]
+        cursor = connection.cursor()
+
+        try:
+            if connection.vendor == 'postgresql':
+                cursor.execute('EXPLAIN %s' % sql, params)
+                # The first line looks like
+                # ``Seq Scan on ... (cost=0.00..1.06 rows=6 width=52)``.
+                plan = cursor.fetchone()[0]
+                return int(plan.split(' rows=', 1)[1].split()[0])
+
+            if connection.vendor == 'mysql':
+                cursor.execute('EXPLAIN %s' % sql, params)
+                columns = [column[0] for column in cursor.description]
+                return int(cursor.fetchone()[columns.index('rows')])
+        except (IndexError, TypeError, ValueError):
+            return None
+        finally:
+            cursor.close()
+
+        return None
+
+    def add_count(self, meta, count_mode):
+        """
+        Adds the ``total_count`` to the ``meta`` as the ``count_mode``
+        dictates.
+
+        Returns the count, or ``None`` if it wasn't counted.
+        """
+        if count_mode == 'none':
+            return None
+
+        if count_mode == 'cached':
+            count = self.get_cached_count()
+        elif count_mode == 'estimated':
+            count = self.get_estimated_count()
+
+            if count is not None and count >= self.estimate_threshold:
+                meta['total_count_estimated'] = True
+            else:
+                count = self.get_count()
+        else:
+            count = self.get_count()
+
+        meta['total_count'] = count
+        return count
+
     def get_previous(self, limit, offset):
         """
         If a previous page is available, will generate a URL to request that
@@ -149,17 +307,25 @@ class Paginator(object):
         return self._generate_uri(limit, offset+limit)
 
     def _generate_uri(self, limit, offset):
+        return self._build_uri({'limit': limit, 'offset': offset})
+
+    def _build_uri(self, params, strip=('limit', 'offset')):
+        """
+        Builds a URI to the resource from the current request parameters,
+        minus any in ``strip``, plus the given ``params``.
+        """
         if self.resource_uri is None:
             return None
 
         try:
             # QueryDict has a urlencode method that can handle multiple values for the same key
             request_params = self.request_data.copy()
-            if 'limit' in request_params:
-                del request_params['limit']
-            if 'offset' in request_params:
-                del request_params['offset']
-            request_params.update({'limit': limit, 'offset': offset})
+
+            for key in strip:
+                if key in request_params:
+                    del request_params[key]
+
+            request_params.update(params)
             encoded_params = request_params.urlencode()
         except AttributeError:
             request_params = {}
@@ -170,11 +336,11 @@ class Paginator(object):
                 else:
                     request_params[k] = v
 
-            if 'limit' in request_params:
-                del request_params['limit']
-            if 'offset' in request_params:
-                del request_params['offset']
-            request_params.update({'limit': limit, 'offset': offset})
+            for key in strip:
+                if key in request_params:
+                    del request_params[key]
+
+            request_params.update(params)
             encoded_params = urlencode(request_params)
 
         return '%s?%s' % (
@@ -191,13 +357,20 @@ class Paginator(object):
         """
         limit = self.get_limit()
         offset = self.get_offset()
-        count = self.get_count()
-        objects = self.get_slice(limit, offset)
+        count_mode = self.get_count_mode()
         meta = {
             'offset': offset,
             'limit': limit,
-            'total_count': count,
         }
+        count = self.add_count(meta, count_mode)
+
+        if count_mode == 'exact':
+            objects = self.get_slice(limit, offset)
+        else:
+            # The count may be missing or inexact, so look for a next page
+            # directly. Just enough of a count is faked for ``get_next``.
+            objects, has_next = self.get_slice_with_next(limit, offset)
+            count = offset + limit + 1 if has_next else offset
 
         if limit:
             meta['previous'] = self.get_previous(limit, offset)
@@ -207,3 +380,238 @@ class Paginator(object):
             self.collection_name: objects,
             'meta': meta,
         }
+
+
+class CursorPaginator(Paginator):
+    """
+    Limits result sets down to sane amounts, paging by keyset rather than by
+    ``offset``.
+
+    Each page is fetched by filtering on the values of the ordering fields
+    of the last object seen (with the primary key as a tiebreak), so deep
+    pages cost the same as the first one & no ``OFFSET`` is ever issued.
+    Those values are handed to the client as an opaque ``cursor`` in the
+    ``previous``/``next`` URLs.
+
+    Requires ``objects`` to be a ``QuerySet``. The ordering is taken from
+    the ``QuerySet`` itself (i.e. what ``apply_sorting`` chose), falling back
+    to the model's ``Meta.ordering``. The ordering fields should not be
+    nullable.
+    """
+    def get_ordering(self):
+        """
+        Returns the ordering to page by, as a list of ``(field, descending)``
+        pairs, always ending with the primary key.
+        """
+        if not hasattr(self.objects, 'query'):
+            raise ImproperlyConfigured("The CursorPaginator requires a QuerySet, not '%r'." % self.objects)
+
+        query = self.objects.query
+
+        if query.order_by:
+            order_by = query.order_by
+        elif query.default_ordering:
+            order_by = query.get_meta().ordering
+        else:
+            order_by = []
+
+        pk_name = query.get_meta().pk.name
+        ordering = []
+
+        for field_name in order_by:
+            if field_name == '?':
+                raise BadRequest("Randomly ordered results can not be paged with a cursor.")
+
+            descending = field_name.startswith('-')
+            field_name = field_name.lstrip('-')
+
+            if field_name == pk_name:
+                field_name = 'pk'
+
+            ordering.append((field_name, descending))
+
+            if field_name == 'pk':
+                # Unique, so anything after it will never come into play.
+                return ordering
+
+        ordering.append(('pk', False))
+        return ordering
+
+    def get_cursor_values(self, obj, ordering):
+        """
+        Returns the values of the ordering fields on the given object.
+        """
+        values = []
+
+        for field_name, descending in ordering:
+            if isinstance(obj, dict) and field_name in obj:
+                # Rows from ``QuerySet.values``.
+                values.append(obj[field_name])
+                continue
+
+            value = obj
+
+            for attr in field_name.split('__'):
+                value = getattr(value, attr, None)
+
+                if value is None:
+                    break
+
+            if isinstance(value, Model):
+                value = value.pk
+
+            values.append(value)
+
+        return values
+
+    def encode_cursor(self, values, reverse=False):
+        """
+        Turns the ordering values (and the direction to page in) into an
+        opaque, URL-safe string.
+        """
+        data = json.dumps([values, reverse], default=self._encode_cursor_value)
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    def _encode_cursor_value(self, value):
+        # Unlike ``DjangoJSONEncoder``, keeps the full precision, as the values
+        # get compared against the database exactly.
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+
+        if isinstance(value, decimal.Decimal):
+            return six.text_type(value)
+
+        raise TypeError("Can not use '%r' in a cursor." % value)
+
+    def decode_cursor(self, cursor, ordering):
+        """
+        Reverses ``encode_cursor``, returning ``(values, reverse)``.
+
+        Raises ``BadRequest`` if the cursor is malformed or doesn't match the
+        current ordering.
+        """
+        try:
+            values, reverse = json.loads(base64.urlsafe_b64decode(str(cursor)).decode('utf-8'))
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise BadRequest("Invalid cursor '%s' provided." % cursor)
+
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise BadRequest("Invalid cursor '%s' provided." % cursor)
+
+        return values, bool(reverse)
+
+    def get_cursor_filter(self, ordering, values, reverse=False):
+        """
+        Builds the ``Q`` selecting everything after (or with ``reverse``,
+        before) the object the values were taken from.
+        """
+        cursor_filter = Q()
+        equal = {}
+
+        for (field_name, descending), value in zip(ordering, values):
+            if value is None:
+                equal['%s__isnull' % field_name] = True
+                continue
+
+            lookup = 'gt' if descending == reverse else 'lt'
+            kwargs = dict(equal)
+            kwargs['%s__%s' % (field_name, lookup)] = value
+            cursor_filter |= Q(**kwargs)
+            equal[field_name] = value
+
+        return cursor_filter
+
+    def get_slice(self, limit, ordering, values=None, reverse=False):
+        """
+        Fetches up to ``limit`` results after (or with ``reverse``, before)
+        the cursor ``values``, or from the start if there are none.
+
+        Returns ``(objects, has_more)``, where ``has_more`` tells whether
+        there's more data beyond the page in the direction being paged.
+        """
+        order_by = []
+
+        for field_name, descending in ordering:
+            if descending != reverse:
+                field_name = '-%s' % field_name
+
+            order_by.append(field_name)
+
+        objects = self.objects.order_by(*order_by)
+
+        if values is not None:
+            objects = objects.filter(self.get_cursor_filter(ordering, values, reverse))
+
+        if limit == 0:
+            return list(objects), False
+
+        # Fetch one extra to see if there's another page.
+        objects = list(objects[:limit + 1])
+        has_more = len(objects) > limit
+        objects = objects[:limit]
+
+        if reverse:
+            objects.reverse()
+
+        return objects, has_more
+
+    def get_previous(self, limit, ordering, objects, more_before):
+        """
+        If a previous page is available, will generate a URL to request that
+        page. If not available, this returns ``None``.
+        """
+        if not objects or not more_before:
+            return None
+
+        cursor = self.encode_cursor(self.get_cursor_values(objects[0], ordering), reverse=True)
+        return self._generate_cursor_uri(limit, cursor)
+
+    def get_next(self, limit, ordering, objects, more_after):
+        """
+        If a next page is available, will generate a URL to request that
+        page. If not available, this returns ``None``.
+        """
+        if not objects or not more_after:
+            return None
+
+        cursor = self.encode_cursor(self.get_cursor_values(objects[-1], ordering))
+        return self._generate_cursor_uri(limit, cursor)
+
+    def _generate_cursor_uri(self, limit, cursor):
+        return self._build_uri({'limit': limit, 'cursor': cursor}, strip=('limit', 'offset', 'cursor'))
+
+    def page(self):
+        """
+        Generates all pertinent data about the requested page.
+
+        Handles getting the correct ``limit`` & ``cursor``, then fetches
+        the correct set of results and returns all pertinent metadata.
+        """
+        limit = self.get_limit()
+        ordering = self.get_ordering()
+        cursor = self.request_data.get('cursor')
+        values, reverse = None, False
+
+        if cursor:
+            values, reverse = self.decode_cursor(cursor, ordering)
+
+        objects, has_more = self.get_slice(limit, ordering, values, reverse)
+        meta = {
+            'limit': limit,
+        }
+        self.add_count(meta, self.get_count_mode())
+
+        if limit:
+            if reverse:
+                # Paging backwards, so we must have come from a later page.
+                more_before, more_after = has_more, True
+            else:
+                more_before, more_after = values is not None, has_more
+
+            meta['previous'] = self.get_previous(limit, ordering, objects, more_before)
+            meta['next'] = self.get_next(limit, ordering, objects, more_after)
+
+        return {
+            self.collection_name: objects,
+            'meta': meta,
+        }
@@ -1,19 +1,33 @@
 from __future__ import unicode_literals
 from __future__ import with_statement
+import calendar
+from contextlib import contextmanager
 from copy import deepcopy
+import hashlib
+from io import BytesIO
+from itertools import islice
 import logging
+import threading
+import time
+import uuid
 import warnings
 
 from django.conf import settings
 from django.conf.urls import patterns, url
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned, ValidationError
-from django.core.urlresolvers import NoReverseMatch, reverse, resolve, Resolver404, get_script_prefix
+from django.core.urlresolvers import NoReverseMatch, reverse, resolve, Resolver404, get_script_prefix, get_urlconf
 from django.core.signals import got_request_exception
-from django.db import transaction
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, Model, Sum
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.query import prefetch_related_objects, QuerySet, ValuesQuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.db.models.sql.constants import QUERY_TERMS
-from django.http import HttpResponse, HttpResponseNotFound, Http404
+from django.http import HttpResponse, HttpResponseNotFound, Http404, StreamingHttpResponse
 from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.encoding import force_text, smart_bytes
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag, urlquote
 from django.utils.html import escape
 from django.utils import six
 
@@ -51,6 +65,15 @@ class NOT_AVAILABLE:
         return 'No such data is available.'
 
 
+# The state of the ``BaseModelResource.atomic`` blocks in this thread: the
+# cache generations bumped inside them, to be bumped again once the outermost
+# one commits (``None`` outside of them).
+_atomic_blocks = threading.local()
+
+# The resource classes whose response cache invalidation is connected.
+_response_cache_connected = set()
+
+
 class ResourceOptions(object):
     """
     A configuration class for ``Resource``.
@@ -85,6 +108,26 @@ class ResourceOptions(object):
     always_return_data = False
     collection_name = 'objects'
     detail_uri_name = 'pk'
+    plan_related_queries = True
+    count_mode = 'exact'
+    stream_list = False
+    stream_chunk_size = 100
+    stream_deserialize = False
+    use_values = False
+    bulk_create = False
+    bulk_batch_size = 500
+    clear_m2m_on_save = False
+    last_modified_field = None
+    last_modified_tracks_deletes = False
+    version_field = None
+    etag_from_content = False
+    cache_responses = False
+    cache_dehydrated = False
+    sparse_fields_param = None
+    sparse_fields_allowed = None
+    expand_param = None
+    expand_allowed = []
+    max_expand_depth = 2
 
     def __new__(cls, meta=None):
         overrides = {}
@@ -142,6 +185,10 @@ class DeclarativeMetaclass(type):
         new_class = super(DeclarativeMetaclass, cls).__new__(cls, name, bases, attrs)
         opts = getattr(new_class, 'Meta', None)
         new_class._meta = ResourceOptions(opts)
+        # Shared by all instances, as related fields instantiate the
+        # resource per object.
+        new_class._meta._uri_templates = {}
+        new_class._meta._dehydration_plans = {}
 
         if not getattr(new_class._meta, 'resource_name', None):
             # No ``resource_name`` provided. Attempt to auto-name the resource.
@@ -176,10 +223,14 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
     """
     def __init__(self, api_name=None):
         self.fields = deepcopy(self.base_fields)
+        self._bound_dehydration_plans = {}
 
         if not api_name is None:
             self._meta.api_name = api_name
 
+        if self._meta.cache_responses and not self.__class__ in _response_cache_connected:
+            self.connect_response_cache_invalidation()
+
     def __getattr__(self, name):
         if name in self.fields:
             return self.fields[name]
@@ -302,7 +353,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         return [
             url(r"^(?P<resource_name>%s)%s$" % (self._meta.resource_name, trailing_slash()), self.wrap_view('dispatch_list'), name="api_dispatch_list"),
             url(r"^(?P<resource_name>%s)/schema%s$" % (self._meta.resource_name, trailing_slash()), self.wrap_view('get_schema'), name="api_get_schema"),
-            url(r"^(?P<resource_name>%s)/set/(?P<%s_list>.*?)%s$" % (self._meta.resource_name, self._meta.detail_uri_name, trailing_slash()), self.wrap_view('get_multiple'), name="api_get_multiple"),
+            url(r"^(?P<resource_name>%s)/set(?:/(?P<%s_list>.*?))?%s$" % (self._meta.resource_name, self._meta.detail_uri_name, trailing_slash()), self.wrap_view('get_multiple'), name="api_get_multiple"),
             url(r"^(?P<resource_name>%s)/(?P<%s>.*?)%s$" % (self._meta.resource_name, self._meta.detail_uri_name, trailing_slash()), self.wrap_view('dispatch_detail'), name="api_dispatch_detail"),
         ]
 
@@ -381,6 +432,42 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         deserialized = self._meta.serializer.deserialize(data, format=request.META.get('CONTENT_TYPE', 'application/json'))
         return deserialized
 
+    def can_stream_deserialize(self, request):
+        """
+        Returns whether list data sent with the request should be
+        deserialized a piece at a time, which needs ``Meta.stream_deserialize``
+        & a format the ``Serializer`` can read that way.
+
+        Only writes that are undone if invalid data is read part way through
+        (see ``writes_are_atomic``) stream, & resources overriding
+        ``alter_deserialized_list_data`` (which expects all of the data)
+        don't.
+        """
+        if not self._meta.stream_deserialize or not self.writes_are_atomic():
+            return False
+
+        if six.get_unbound_function(type(self).alter_deserialized_list_data) is not six.get_unbound_function(Resource.alter_deserialized_list_data):
+            return False
+
+        return self._meta.serializer.can_deserialize_stream(request.META.get('CONTENT_TYPE', 'application/json'))
+
+    def deserialize_stream(self, request, format='application/json'):
+        """
+        Like ``deserialize``, but reads the body of the request a piece at a
+        time rather than loading (& copying) all of it first.
+
+        Returns an iterator of the ``(key, value)`` pairs of the data, with
+        lists as iterators of their items. See
+        ``Serializer.deserialize_stream``.
+        """
+        if hasattr(request, 'read') and not hasattr(request, '_body'):
+            stream = request
+        else:
+            # The body has been read already.
+            stream = BytesIO(smart_bytes(request.body))
+
+        return self._meta.serializer.deserialize_stream(stream, format=request.META.get('CONTENT_TYPE', 'application/json'))
+
     def alter_list_data_to_serialize(self, request, data):
         """
         A hook to alter list data just before it gets serialized & sent to the user.
@@ -459,6 +546,16 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         self.is_authenticated(request)
         self.throttle_check(request)
 
+        cache_key = None
+
+        if self._meta.cache_responses and request_method == 'get':
+            cache_key = self.get_response_cache_key(request, request_type, **kwargs)
+            cached_response = self._meta.cache.get(cache_key)
+
+            if cached_response is not None:
+                self.log_throttled_access(request)
+                return self.build_cached_response(request, cached_response)
+
         # All clear. Process the request.
         request = convert_post_to_put(request)
         response = method(request, **kwargs)
@@ -472,6 +569,13 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         if not isinstance(response, HttpResponse):
             return http.HttpNoContent()
 
+        if cache_key is not None and response.status_code == 200 and not getattr(response, 'streaming', False):
+            self._meta.cache.set(cache_key, {
+                'content': response.content,
+                'content_type': response['Content-Type'],
+                'headers': dict([(header, response[header]) for header in ('ETag', 'Last-Modified') if response.has_header(header)]),
+            })
+
         return response
 
     def remove_api_resource_names(self, url_dict):
@@ -678,7 +782,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         return auth_result
 
-    def build_bundle(self, obj=None, data=None, request=None, objects_saved=None):
+    def build_bundle(self, obj=None, data=None, request=None, objects_saved=None, sparse_fields=None, expand=None):
         """
         Given either an object, a data dictionary or both, builds a ``Bundle``
         for use throughout the ``dehydrate/hydrate`` cycle.
@@ -694,7 +798,9 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             obj=obj,
             data=data,
             request=request,
-            objects_saved=objects_saved
+            objects_saved=objects_saved,
+            sparse_fields=sparse_fields,
+            expand=expand
         )
 
     def build_filters(self, filters=None):
@@ -719,6 +825,41 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         return obj_list
 
+    def apply_query_plan(self, obj_list, for_list=True, sparse_fields=None, expand=None):
+        """
+        Allows for the eager loading of related data before the objects are
+        dehydrated.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return obj_list
+
+    def apply_values(self, obj_list, for_list=True, sparse_fields=None):
+        """
+        Allows for fetching plain rows of data, rather than full objects,
+        when the fields don't need anything more.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return obj_list
+
+    def apply_sparse_fields(self, obj_list, sparse_fields=None):
+        """
+        Allows for only loading the data the ``sparse_fields`` need.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return obj_list
+
     def get_bundle_detail_data(self, bundle):
         """
         Convenience method to return the ``detail_uri_name`` attribute off
@@ -782,10 +923,80 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             url_name = 'api_dispatch_detail'
 
         try:
-            return self._build_reverse_url(url_name, kwargs=self.resource_uri_kwargs(bundle_or_obj))
+            return self._build_templated_url(url_name, kwargs=self.resource_uri_kwargs(bundle_or_obj))
         except NoReverseMatch:
             return ''
 
+    def _build_templated_url(self, name, kwargs=None):
+        """
+        Builds the same URL as ``_build_reverse_url``, but only calls it once
+        per combination of URL name/static kwargs.
+
+        The result is compiled into a string template (minus the script
+        prefix), which subsequent calls fill in with the quoted kwargs. If a
+        template can't be made (for instance, because the URL pattern
+        restricts what the kwargs may look like), this falls back to
+        ``_build_reverse_url`` on every call.
+        """
+        kwargs = kwargs or {}
+        static_names = ('api_name', 'resource_name')
+        variable_names = tuple(sorted([key for key in kwargs if not key in static_names]))
+        cache_key = (
+            get_urlconf() or settings.ROOT_URLCONF,
+            trailing_slash(),
+            getattr(self._meta, 'urlconf_namespace', None),
+            name,
+            kwargs.get('api_name'),
+            kwargs.get('resource_name'),
+            variable_names,
+        )
+
+        try:
+            template = self._meta._uri_templates[cache_key]
+        except KeyError:
+            template = self._compile_url_template(name, kwargs, variable_names)
+            self._meta._uri_templates[cache_key] = template
+
+        if template is None:
+            return self._build_reverse_url(name, kwargs=kwargs)
+
+        uri = urlquote(get_script_prefix()) + template % dict((key, urlquote(force_text(kwargs[key]))) for key in variable_names)
+
+        # Same as ``reverse``, don't allow construction of scheme relative urls.
+        if uri.startswith('//'):
+            uri = '/%%2F%s' % uri[2:]
+
+        return uri
+
+    def _compile_url_template(self, name, kwargs, variable_names):
+        # The markers include a ``/`` & ``.`` so that only URL patterns
+        # accepting arbitrary values (like the default ``.*?``) reverse.
+        # Anything stricter falls back to reversing every time, so values are
+        # still checked against the pattern.
+        markers = dict((key, 'tastypie.marker.%d/' % i) for i, key in enumerate(variable_names))
+        marked_kwargs = kwargs.copy()
+        marked_kwargs.update(markers)
+
+        try:
+            url = self._build_reverse_url(name, kwargs=marked_kwargs)
+        except NoReverseMatch:
+            return None
+
+        prefix = urlquote(get_script_prefix())
+
+        if not url.startswith(prefix):
+            return None
+
+        template = url[len(prefix):].replace('%', '%%')
+
+        for key, marker in markers.items():
+            if template.count(marker) != 1:
+                return None
+
+            template = template.replace(marker, '%%(%s)s' % key)
+
+        return template
+
     def get_via_uri(self, uri, request=None):
         """
         This pulls apart the salient bits of the URI and populates the
@@ -796,6 +1007,39 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         If you need custom behavior based on other portions of the URI,
         simply override this method.
         """
+        bundle = self.build_bundle(request=request)
+        return self.obj_get(bundle=bundle, **self.get_uri_kwargs(uri))
+
+    def get_via_uris(self, uris, request=None):
+        """
+        Like ``get_via_uri``, but for many URIs at once.
+
+        Returns a dictionary of the URIs to their objects. URIs with no
+        matching object are left out, while invalid URIs raise ``NotFound``.
+
+        ``ModelResource`` includes a version that fetches all the objects
+        with a single query.
+        """
+        objects = {}
+
+        for uri in uris:
+            if uri in objects:
+                continue
+
+            try:
+                objects[uri] = self.get_via_uri(uri, request=request)
+            except (ObjectDoesNotExist, MultipleObjectsReturned):
+                pass
+
+        return objects
+
+    def get_uri_kwargs(self, uri):
+        """
+        Resolves a URI against this resource's URLs, returning the kwargs
+        which identify the object (ready for ``obj_get``).
+
+        Raises ``NotFound`` if the URI isn't a link to this resource.
+        """
         prefix = get_script_prefix()
         chomped_uri = uri
 
@@ -823,45 +1067,290 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         except Resolver404:
             raise NotFound("The URL provided '%s' was not a link to a valid resource." % uri)
 
-        bundle = self.build_bundle(request=request)
-        return self.obj_get(bundle=bundle, **self.remove_api_resource_names(kwargs))
+        return self.remove_api_resource_names(kwargs)
 
     # Data preparation.
 
+    def get_sparse_fields(self, request):
+        """
+        Reads the fields the client asked for from the
+        ``Meta.sparse_fields_param`` request parameter (a comma-separated
+        list, or repeated).
+
+        Returns ``None`` (all fields) if the option is off or the parameter
+        isn't there. Otherwise, returns a ``frozenset`` of the field names,
+        always including ``resource_uri``. Raises ``BadRequest`` for names
+        which aren't fields or aren't in ``Meta.sparse_fields_allowed``.
+        """
+        param = self._meta.sparse_fields_param
+
+        if not param or not param in request.GET:
+            return None
+
+        if hasattr(request.GET, 'getlist'):
+            values = request.GET.getlist(param)
+        else:
+            values = [request.GET[param]]
+
+        sparse_fields = set()
+
+        for value in values:
+            for field_name in value.split(','):
+                field_name = field_name.strip()
+
+                if not field_name:
+                    continue
+
+                if not field_name in self.fields:
+                    raise BadRequest("The '%s' field is not a field of this resource." % field_name)
+
+                if self._meta.sparse_fields_allowed is not None and not field_name in self._meta.sparse_fields_allowed:
+                    raise BadRequest("The '%s' field can not be selected." % field_name)
+
+                sparse_fields.add(field_name)
+
+        if 'resource_uri' in self.fields:
+            sparse_fields.add('resource_uri')
+
+        return frozenset(sparse_fields)
+
+    def get_expansions(self, request):
+        """
+        Reads the related fields the client wants included in full from the
+        ``Meta.expand_param`` request parameter (a comma-separated list, or
+        repeated), following related resources with dotted paths (like
+        ``notes.author``).
+
+        Returns ``None`` if the option is off or the parameter isn't there.
+        Otherwise, returns a tree of the expanded field names, as nested
+        dictionaries. Raises ``BadRequest`` for paths which aren't related
+        fields, aren't in ``Meta.expand_allowed`` (unless it's ``ALL``) or
+        are deeper than ``Meta.max_expand_depth``.
+        """
+        param = self._meta.expand_param
+
+        if not param or not param in request.GET:
+            return None
+
+        if hasattr(request.GET, 'getlist'):
+            values = request.GET.getlist(param)
+        else:
+            values = [request.GET[param]]
+
+        expand = {}
+
+        for value in values:
+            for path in value.split(','):
+                path = path.strip()
+
+                if not path:
+                    continue
+
+                bits = path.split('.')
+
+                if len(bits) > self._meta.max_expand_depth:
+                    raise BadRequest("The '%s' expansion is deeper than the %s levels allowed." % (path, self._meta.max_expand_depth))
+
+                if self._meta.expand_allowed != ALL and not path in self._meta.expand_allowed:
+                    raise BadRequest("The '%s' expansion is not allowed." % path)
+
+                resource = self
+                branch = expand
+
+                for field_name in bits:
+                    field_object = resource.fields.get(field_name)
+
+                    if field_object is None or not getattr(field_object, 'is_related', False):
+                        raise BadRequest("The '%s' expansion does not name a related field." % path)
+
+                    resource = field_object.to_class()
+                    branch = branch.setdefault(field_name, {})
+
+        return expand
+
     def full_dehydrate(self, bundle, for_list=False):
         """
         Given a bundle with an object instance, extract the information from it
         to populate the resource.
-        """
-        use_in = ['all', 'list' if for_list else 'detail']
 
+        Only the ``bundle.sparse_fields`` are filled in, if set.
+        """
         # Dehydrate each field.
-        for field_name, field_object in self.fields.items():
+        for field_name, field_object, use_in, method in self.get_dehydration_plan(for_list=for_list, sparse_fields=bundle.sparse_fields):
             # If it's not for use in this mode, skip
-            field_use_in = getattr(field_object, 'use_in', 'all')
-            if callable(field_use_in):
-                if not field_use_in(bundle):
-                    continue
-            else:
-                if field_use_in not in use_in:
-                    continue
-
-            # A touch leaky but it makes URI resolution work.
-            if getattr(field_object, 'dehydrated_type', None) == 'related':
-                field_object.api_name = self._meta.api_name
-                field_object.resource_name = self._meta.resource_name
+            if use_in is not None and not use_in(bundle):
+                continue
 
             bundle.data[field_name] = field_object.dehydrate(bundle, for_list=for_list)
 
             # Check for an optional method to do further dehydration.
-            method = getattr(self, "dehydrate_%s" % field_name, None)
-
-            if method:
+            if method is not None:
                 bundle.data[field_name] = method(bundle)
 
         bundle = self.dehydrate(bundle)
         return bundle
 
+    def full_dehydrate_list(self, bundles, for_list=False):
+        """
+        Runs ``full_dehydrate`` for each of the bundles, then
+        ``batch_dehydrate`` for all of them together.
+
+        Returns the list of bundles.
+        """
+        bundles = [self.full_dehydrate(bundle, for_list=for_list) for bundle in bundles]
+        return self.batch_dehydrate(bundles, for_list=for_list)
+
+    def batch_dehydrate(self, bundles, for_list=False):
+        """
+        Fills in the fields computed for many bundles at once, after they've
+        been through ``full_dehydrate``.
+
+        The nested bundles of ``full`` related fields go through their
+        resource's ``batch_dehydrate`` first, all of a field's together (see
+        ``batch_dehydrate_related``). Then, for each field being dehydrated
+        with a ``batch_dehydrate_FOO`` method, that method is handed all the
+        bundles & must return a list of the values, in the same order.
+        ``dehydrate_list`` runs last.
+        """
+        if not bundles:
+            return bundles
+
+        plan = self.get_dehydration_plan(for_list=for_list, sparse_fields=bundles[0].sparse_fields)
+        self.batch_dehydrate_related(bundles, plan)
+
+        for field_name, field_object, use_in, method in plan:
+            batch_method = getattr(self, "batch_dehydrate_%s" % field_name, None)
+
+            if batch_method is None:
+                continue
+
+            for bundle, value in zip(bundles, batch_method(bundles)):
+                if use_in is None or use_in(bundle):
+                    bundle.data[field_name] = value
+
+        return self.dehydrate_list(bundles)
+
+    def batch_dehydrate_related(self, bundles, plan):
+        """
+        Runs the related resources' ``batch_dehydrate`` over the nested
+        bundles of the related fields in the dehydration ``plan``, once per
+        field (& related model) for all of the ``bundles``, putting the
+        bundles it returns in their place.
+        """
+        for field_name, field_object, use_in, method in plan:
+            if not getattr(field_object, 'is_related', False):
+                continue
+
+            # Where each nested bundle sits, grouped by the related model
+            # (which picks the related resource).
+            positions = {}
+
+            for bundle in bundles:
+                value = bundle.data.get(field_name)
+
+                if isinstance(value, Bundle):
+                    positions.setdefault(type(value.obj), []).append((bundle.data, field_name))
+                elif isinstance(value, list):
+                    for index, item in enumerate(value):
+                        if isinstance(item, Bundle):
+                            positions.setdefault(type(item.obj), []).append((value, index))
+
+            for model_positions in positions.values():
+                nested = [container[key] for container, key in model_positions]
+                related_resource = field_object.get_related_resource(nested[0].obj)
+                # Related data is always dehydrated as a detail.
+                dehydrated = related_resource.batch_dehydrate(nested, for_list=False)
+
+                for (container, key), nested_bundle in zip(model_positions, dehydrated):
+                    container[key] = nested_bundle
+
+    def dehydrate_list(self, bundles):
+        """
+        A hook to allow a final manipulation of the data of many bundles at
+        once (all the objects of a page, for instance), once
+        ``full_dehydrate`` has run for each of them.
+
+        Useful for annotating data that needs a query (or other lookup), so
+        it can be done once for the whole list, rather than per object.
+
+        Must return the list of bundles.
+        """
+        return bundles
+
+    def get_dehydration_plan(self, for_list=False, sparse_fields=None):
+        """
+        Returns the fields ``full_dehydrate`` should run, in order, as a tuple
+        of ``(field_name, field_object, use_in, method)``.
+
+        Fields whose ``use_in`` rules them out for this mode (or which aren't
+        in ``sparse_fields``, if given) are already dropped. ``use_in`` is only
+        present (otherwise ``None``) when it's a callable that must be checked
+        per bundle & ``method`` is the bound ``dehydrate_FOO`` method if there
+        is one.
+
+        The field names & methods are worked out once per resource class,
+        then bound to this instance's fields on first use. Only the full plan
+        is kept, since ``sparse_fields`` comes from the client; it's filtered
+        for each request.
+        """
+        if sparse_fields is not None:
+            plan = self.get_dehydration_plan(for_list=for_list)
+            return tuple(entry for entry in plan if entry[0] in sparse_fields)
+
+        key = (for_list, self._meta.api_name, self._meta.resource_name)
+
+        try:
+            return self._bound_dehydration_plans[key]
+        except KeyError:
+            pass
+
+        field_names = tuple(self.fields.keys())
+        spec_key = (for_list, field_names)
+        spec = self._meta._dehydration_plans.get(spec_key)
+
+        if spec is None:
+            spec = []
+            use_in = ['all', 'list' if for_list else 'detail']
+
+            for field_name in field_names:
+                field_use_in = getattr(self.fields[field_name], 'use_in', 'all')
+
+                if not callable(field_use_in) and field_use_in not in use_in:
+                    continue
+
+                # Look on the class, so we don't fall into ``__getattr__``.
+                method_name = "dehydrate_%s" % field_name
+
+                if getattr(self.__class__, method_name, None) is None:
+                    method_name = None
+
+                spec.append((field_name, method_name))
+
+            spec = tuple(spec)
+            self._meta._dehydration_plans[spec_key] = spec
+
+        plan = []
+
+        for field_name, method_name in spec:
+            field_object = self.fields[field_name]
+            field_use_in = getattr(field_object, 'use_in', 'all')
+
+            # A touch leaky but it makes URI resolution work.
+            if getattr(field_object, 'dehydrated_type', None) == 'related':
+                field_object.api_name = self._meta.api_name
+                field_object.resource_name = self._meta.resource_name
+
+            plan.append((
+                field_name,
+                field_object,
+                field_use_in if callable(field_use_in) else None,
+                getattr(self, method_name) if method_name else None,
+            ))
+
+        plan = tuple(plan)
+        self._bound_dehydration_plans[key] = plan
+        return plan
+
     def dehydrate(self, bundle):
         """
         A hook to allow a final manipulation of data once all fields/methods
@@ -1021,7 +1510,19 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         Creates a unique-enough cache key.
 
-        This is based off the current api_name/resource_name/args/kwargs.
+        This is based off the current api_name/resource_name/args/kwargs, plus
+        the generation of the resource's cached data (so that
+        ``bump_cache_generation`` can expire all of it at once).
+        """
+        return self.build_cache_key(self.get_cache_generation(), *args, **kwargs)
+
+    def build_cache_key(self, generation, *args, **kwargs):
+        """
+        Does the work of ``generate_cache_key``, given the generation of the
+        resource's cached data.
+
+        Used by the ``cached_*`` methods, which fetch that generation along
+        with the others they need.
         """
         smooshed = []
 
@@ -1029,106 +1530,361 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             smooshed.append("%s=%s" % (key, value))
 
         # Use a list plus a ``.join()`` because it's faster than concatenation.
-        return "%s:%s:%s:%s" % (self._meta.api_name, self._meta.resource_name, ':'.join(args), ':'.join(sorted(smooshed)))
+        return "%s:%s:%s:%s:%s" % (self._meta.api_name, self._meta.resource_name, generation, ':'.join(args), ':'.join(sorted(smooshed)))
 
-    # Data access methods.
-
-    def get_object_list(self, request):
+    def uses_cache_generations(self):
         """
-        A hook to allow making returning the list of available objects.
+        Returns whether the cache generations are tracked at all.
 
-        This needs to be implemented at the user level.
-
-        ``ModelResource`` includes a full working version specific to Django's
-        ``Models``.
+        They aren't for a cache class that doesn't store anything (one that
+        keeps the ``get`` of ``NoCache``, the default), where every
+        generation is ``'0'`` & bumping one does nothing.
         """
-        raise NotImplementedError()
+        return six.get_unbound_function(type(self._meta.cache).get) is not six.get_unbound_function(NoCache.get)
 
-    def apply_authorization_limits(self, request, object_list):
+    def generate_generation_cache_key(self, *args):
         """
-        Deprecated.
+        Creates the cache key a generation token is stored under.
 
-        FIXME: REMOVE BEFORE 1.0
+        No arguments are for the whole resource, ``'list'`` for the lists &
+        ``'detail', <identifier>`` for a single object.
         """
-        return self._meta.authorization.apply_limits(request, object_list)
+        return "%s:%s:generation:%s" % (self._meta.api_name, self._meta.resource_name, ':'.join([force_text(arg) for arg in args]))
 
-    def can_create(self):
+    def get_cache_generation(self, *args):
         """
-        Checks to ensure ``post`` is within ``allowed_methods``.
+        Returns the current token of a generation of cached data (see
+        ``generate_generation_cache_key`` for the arguments), starting a new
+        generation if there isn't one.
         """
-        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
-        return 'post' in allowed
+        return self.get_cache_generations(args)[0]
 
-    def can_update(self):
+    def get_cache_generations(self, *scopes):
         """
-        Checks to ensure ``put`` is within ``allowed_methods``.
+        Like ``get_cache_generation``, but for several scopes at once (each
+        a tuple of its arguments), fetched with a single ``get_many``.
 
-        Used when hydrating related data.
+        Returns a list of the tokens, in the same order.
         """
-        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
-        return 'put' in allowed
+        if not self.uses_cache_generations():
+            return ['0'] * len(scopes)
 
-    def can_delete(self):
-        """
-        Checks to ensure ``delete`` is within ``allowed_methods``.
-        """
-        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
-        return 'delete' in allowed
+        cache_keys = [self.generate_generation_cache_key(*scope) for scope in scopes]
+        found = self._meta.cache.get_many(cache_keys)
+        generations = []
 
-    def apply_filters(self, request, applicable_filters):
-        """
-        A hook to alter how the filters are applied to the object list.
+        for cache_key, scope in zip(cache_keys, scopes):
+            generation = found.get(cache_key)
 
-        This needs to be implemented at the user level.
+            if generation is None:
+                generation = self.bump_cache_generation(*scope)
 
-        ``ModelResource`` includes a full working version specific to Django's
-        ``Models``.
-        """
-        raise NotImplementedError()
+            generations.append(generation)
 
-    def obj_get_list(self, bundle, **kwargs):
+        return generations
+
+    def bump_cache_generation(self, *args):
         """
-        Fetches the list of objects available on the resource.
+        Starts a new generation of cached data (see
+        ``generate_generation_cache_key`` for the arguments), so every key
+        made with the old one is expired by a single cache write.
 
-        This needs to be implemented at the user level.
+        Inside a ``BaseModelResource.atomic`` block, the generation is bumped
+        again once the block commits (& where Django has
+        ``transaction.on_commit``, the same goes for any other transaction),
+        so data cached by concurrent requests before then is expired too.
 
-        ``ModelResource`` includes a full working version specific to Django's
-        ``Models``.
+        Returns the new token.
         """
-        raise NotImplementedError()
+        if not self.uses_cache_generations():
+            return '0'
 
-    def cached_obj_get_list(self, bundle, **kwargs):
-        """
-        A version of ``obj_get_list`` that uses the cache as a means to get
-        commonly-accessed data faster.
-        """
-        cache_key = self.generate_cache_key('list', **kwargs)
-        obj_list = self._meta.cache.get(cache_key)
+        generation = uuid.uuid4().hex
+        self._meta.cache.set(self.generate_generation_cache_key(*args), generation)
+        pending = getattr(_atomic_blocks, 'cache_bumps', None)
 
-        if obj_list is None:
-            obj_list = self.obj_get_list(bundle=bundle, **kwargs)
-            self._meta.cache.set(cache_key, obj_list)
+        if pending is not None:
+            pending.add((self, args))
+        elif hasattr(transaction, 'on_commit') and transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: self.bump_cache_generation(*args))
 
-        return obj_list
+        return generation
 
-    def obj_get(self, bundle, **kwargs):
+    def bump_object_cache_generations(self, *identifiers):
         """
-        Fetches an individual object on the resource.
+        Expires the cached lists & the cached copies of the objects with the
+        given ``Meta.detail_uri_name`` identifiers, after they've been changed.
+        """
+        self.bump_cache_generation('list')
 
-        This needs to be implemented at the user level. If the object can not
-        be found, this should raise a ``NotFound`` exception.
+        for identifier in set([force_text(identifier) for identifier in identifiers if identifier is not None]):
+            self.bump_cache_generation('detail', identifier)
 
-        ``ModelResource`` includes a full working version specific to Django's
-        ``Models``.
+    def get_response_cache_key(self, request, request_type, **kwargs):
+        """
+        Creates the cache key for a ``GET`` response, used when
+        ``Meta.cache_responses = True``.
+
+        Varies on the URL, the (normalised) query string, the negotiated
+        format, the requesting user & any other headers the cache class
+        ``varies`` on. The generation of the lists is included too, so any
+        write through the resource expires the responses.
+        """
+        if hasattr(request.GET, 'lists'):
+            query = sorted(request.GET.lists())
+        else:
+            query = sorted([(key, [value]) for key, value in request.GET.items()])
+
+        varies = [request.META.get('HTTP_%s' % header.upper().replace('-', '_'), '') for header in getattr(self._meta.cache, 'varies', []) if header.lower() != 'accept']
+        bits = [
+            request_type,
+            ':'.join(['%s=%s' % (key, value) for key, value in sorted(self.remove_api_resource_names(kwargs).items())]),
+            '&'.join(['%s=%s' % (key, ','.join(values)) for key, values in query]),
+            self.determine_format(request),
+            self.get_request_identity(request),
+        ]
+        bits.extend(varies)
+        digest = hashlib.md5('\n'.join([force_text(bit) for bit in bits]).encode('utf-8')).hexdigest()
+        generation, list_generation = self.get_cache_generations((), ('list',))
+        return self.build_cache_key(generation, 'response', request_type, list_generation, digest)
+
+    def get_request_identity(self, request):
+        """
+        Returns who's making the request, for the cache keys of data that may
+        vary by user: the user's primary key, or ``'anonymous'``.
+        """
+        user = getattr(request, 'user', None)
+
+        if user is not None and user.is_authenticated():
+            return force_text(user.pk)
+
+        return 'anonymous'
+
+    def invalidate_cached_responses(self):
+        """
+        Expires every cached response (& any other cached data) for the
+        resource, by starting a new generation of it.
+        """
+        self.bump_cache_generation()
+
+    def build_cached_response(self, request, cached_response):
+        """
+        Rebuilds a ``HttpResponse`` from the data stored by ``dispatch``.
+
+        Answers conditional requests matching the stored ``ETag`` with
+        ``HttpNotModified`` (304 Not Modified).
+        """
+        headers = cached_response['headers']
+        response = None
+
+        if 'ETag' in headers:
+            response = self.get_not_modified_response(request, etag=parse_etags(headers['ETag'])[0])
+
+        if response is None:
+            response = HttpResponse(content=cached_response['content'], content_type=cached_response['content_type'])
+
+        for header, value in headers.items():
+            response[header] = value
+
+        return response
+
+    def get_response_cache_models(self):
+        """
+        Returns the models whose changes expire the cached responses.
+
+        By default, that's the ``Meta.object_class`` & those of the related
+        fields' resources (if they're Django models).
+        """
+        candidates = [self._meta.object_class]
+
+        for field_object in self.fields.values():
+            if getattr(field_object, 'is_related', False):
+                candidates.append(field_object.to_class._meta.object_class)
+
+        return set([model for model in candidates if isinstance(model, type) and issubclass(model, Model)])
+
+    def connect_response_cache_invalidation(self):
+        """
+        Connects the ``post_save``, ``post_delete`` & ``m2m_changed`` signals
+        of the models from ``get_response_cache_models`` to
+        ``invalidate_cached_responses``.
+
+        Called when the first instance of the resource class is created with
+        ``Meta.cache_responses = True``, so that writes from any process (not
+        just those serving ``GET`` requests) expire the responses. The
+        receivers are bound to each model (& the ``through`` models of their
+        many-to-many relations), so other writes don't reach them.
+        """
+        cache_models = tuple(self.get_response_cache_models())
+        dispatch_uid = 'tastypie.response_cache.%s.%s' % (self.__class__.__module__, self.__class__.__name__)
+        through_models = set()
+
+        def invalidate(sender, **kwargs):
+            self.invalidate_cached_responses()
+
+        def invalidate_m2m(sender, instance, action, model, **kwargs):
+            if action.startswith('post_') and (isinstance(instance, cache_models) or model in cache_models):
+                self.invalidate_cached_responses()
+
+        for model in cache_models:
+            model_uid = '%s.%s.%s' % (dispatch_uid, model._meta.app_label, model._meta.object_name)
+            post_save.connect(invalidate, sender=model, weak=False, dispatch_uid=model_uid)
+            post_delete.connect(invalidate, sender=model, weak=False, dispatch_uid=model_uid)
+
+            for field in model._meta.many_to_many:
+                through_models.add(field.rel.through)
+
+            for related in model._meta.get_all_related_many_to_many_objects():
+                through_models.add(related.field.rel.through)
+
+        for through in through_models:
+            m2m_changed.connect(invalidate_m2m, sender=through, weak=False, dispatch_uid='%s.%s.%s' % (dispatch_uid, through._meta.app_label, through._meta.object_name))
+
+        _response_cache_connected.add(self.__class__)
+
+    # Data access methods.
+
+    def get_object_list(self, request):
+        """
+        A hook to allow making returning the list of available objects.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        raise NotImplementedError()
+
+    def apply_authorization_limits(self, request, object_list):
+        """
+        Deprecated.
+
+        FIXME: REMOVE BEFORE 1.0
+        """
+        return self._meta.authorization.apply_limits(request, object_list)
+
+    def can_create(self):
+        """
+        Checks to ensure ``post`` is within ``allowed_methods``.
+        """
+        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
+        return 'post' in allowed
+
+    def can_update(self):
+        """
+        Checks to ensure ``put`` is within ``allowed_methods``.
+
+        Used when hydrating related data.
+        """
+        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
+        return 'put' in allowed
+
+    def can_delete(self):
+        """
+        Checks to ensure ``delete`` is within ``allowed_methods``.
+        """
+        allowed = set(self._meta.list_allowed_methods + self._meta.detail_allowed_methods)
+        return 'delete' in allowed
+
+    def apply_filters(self, request, applicable_filters):
+        """
+        A hook to alter how the filters are applied to the object list.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
         """
         raise NotImplementedError()
 
+    def obj_get_list(self, bundle, **kwargs):
+        """
+        Fetches the list of objects available on the resource.
+
+        This needs to be implemented at the user level.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        raise NotImplementedError()
+
+    def cached_obj_get_list(self, bundle, **kwargs):
+        """
+        A version of ``obj_get_list`` that uses the cache as a means to get
+        commonly-accessed data faster.
+
+        Expired by ``bump_cache_generation('list')``.
+        """
+        generation, list_generation = self.get_cache_generations((), ('list',))
+        cache_key = self.build_cache_key(generation, 'list', list_generation, **kwargs)
+        obj_list = self._meta.cache.get(cache_key)
+
+        if obj_list is None:
+            obj_list = self.obj_get_list(bundle=bundle, **kwargs)
+            self._meta.cache.set(cache_key, obj_list)
+
+        return obj_list
+
+    def obj_get(self, bundle, **kwargs):
+        """
+        Fetches an individual object on the resource.
+
+        This needs to be implemented at the user level. If the object can not
+        be found, this should raise a ``NotFound`` exception.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        raise NotImplementedError()
+
+    def obj_get_multiple(self, bundle, identifiers):
+        """
+        Fetches the objects for many ``Meta.detail_uri_name`` identifiers at
+        once.
+
+        Returns a dictionary of the identifiers to their objects. Identifiers
+        with no (authorized) object are left out.
+
+        By default, calls ``obj_get`` for each identifier in turn.
+        ``ModelResource`` includes a version that fetches all the objects
+        with a single query.
+        """
+        objects = {}
+
+        for identifier in identifiers:
+            if identifier in objects:
+                continue
+
+            try:
+                objects[identifier] = self.obj_get(bundle=bundle, **{self._meta.detail_uri_name: identifier})
+            except (ObjectDoesNotExist, Unauthorized):
+                pass
+
+        return objects
+
     def cached_obj_get(self, bundle, **kwargs):
         """
         A version of ``obj_get`` that uses the cache as a means to get
         commonly-accessed data faster.
+
+        Lookups by ``Meta.detail_uri_name`` are expired by
+        ``bump_cache_generation('detail', <identifier>)``, any others by
+        ``bump_cache_generation('list')``. The ``bundle.sparse_fields`` are
+        part of the key, since ``obj_get`` only loads their columns.
         """
-        cache_key = self.generate_cache_key('detail', **kwargs)
+        if self._meta.detail_uri_name in kwargs:
+            scope = ('detail', kwargs[self._meta.detail_uri_name])
+        else:
+            scope = ('list',)
+
+        generation, scope_generation = self.get_cache_generations((), scope)
+        bits = ['detail', scope_generation]
+
+        if bundle.sparse_fields is not None:
+            # Only some of the columns are loaded.
+            bits.append(','.join(sorted(bundle.sparse_fields)))
+
+        cache_key = self.build_cache_key(generation, *bits, **kwargs)
         cached_bundle = self._meta.cache.get(cache_key)
 
         if cached_bundle is None:
@@ -1137,6 +1893,138 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         return cached_bundle
 
+    def get_dehydrated_cache_key(self, bundle, for_list=False):
+        """
+        Creates the cache key for the dehydrated data of ``bundle.obj``, used
+        by ``cached_full_dehydrate``.
+
+        Based off the object's ``Meta.detail_uri_name`` identifier (& its
+        cache generation), ``for_list``, the ``bundle.sparse_fields``, the
+        ``bundle.expand`` expansions & whatever ``get_dehydrated_cache_vary``
+        returns. Returns ``None`` for objects with no identifier, which
+        aren't cached.
+        """
+        return self.get_dehydrated_cache_keys([bundle], for_list=for_list)[0]
+
+    def get_dehydrated_cache_keys(self, bundles, for_list=False):
+        """
+        ``get_dehydrated_cache_key`` for several bundles, fetching all the
+        cache generations they need with a single ``get_many``.
+
+        Returns a list of the keys, in the same order.
+        """
+        identifiers = []
+
+        for bundle in bundles:
+            identifier = getattr(bundle.obj, self._meta.detail_uri_name, None)
+            identifiers.append(force_text(identifier) if identifier is not None else None)
+
+        unique_identifiers = sorted(set([identifier for identifier in identifiers if identifier is not None]))
+        generations = self.get_cache_generations((), *[('detail', identifier) for identifier in unique_identifiers])
+        generation = generations[0]
+        detail_generations = dict(zip(unique_identifiers, generations[1:]))
+        cache_keys = []
+
+        for bundle, identifier in zip(bundles, identifiers):
+            if identifier is None:
+                cache_keys.append(None)
+            else:
+                cache_keys.append(self._build_dehydrated_cache_key(bundle, for_list, identifier, generation, detail_generations[identifier]))
+
+        return cache_keys
+
+    def _build_dehydrated_cache_key(self, bundle, for_list, identifier, generation, detail_generation):
+        sparse_fields = ','.join(sorted(bundle.sparse_fields)) if bundle.sparse_fields is not None else '*'
+        expansions = []
+        pending = [('', bundle.expand or {})]
+
+        while pending:
+            path, branch = pending.pop()
+
+            for field_name, children in branch.items():
+                expansions.append(path + field_name)
+                pending.append((path + field_name + '.', children))
+
+        varies = [force_text(bit) for bit in self.get_dehydrated_cache_vary(bundle)]
+        return self.build_cache_key(generation, 'dehydrated', detail_generation, 'list' if for_list else 'detail', identifier, sparse_fields, ','.join(sorted(expansions)), *varies)
+
+    def get_dehydrated_cache_vary(self, bundle):
+        """
+        Returns a list of the things about ``bundle.request`` the dehydrated
+        data depends on, to keep the cached copies for different requests
+        apart.
+
+        By default, that's the requesting user (``get_request_identity``),
+        since ``dehydrate`` hooks, ``use_in`` callables & authorization may
+        all look at them. Return more for data that depends on anything else
+        in the request, or an empty list if it doesn't vary at all, so that
+        the entries are shared between users.
+        """
+        return [self.get_request_identity(bundle.request)]
+
+    def cacheable_dehydrated_data(self, data):
+        """
+        Copies dehydrated data into something that can be stored in the
+        cache, swapping the nested bundles of related resources for bundles
+        holding just their data (no objects or requests).
+        """
+        if isinstance(data, Bundle):
+            stripped = Bundle(data=self.cacheable_dehydrated_data(data.data))
+            stripped.request = None
+            return stripped
+        elif isinstance(data, dict):
+            return dict([(key, self.cacheable_dehydrated_data(value)) for key, value in data.items()])
+        elif isinstance(data, (list, tuple)):
+            return [self.cacheable_dehydrated_data(value) for value in data]
+
+        return data
+
+    def cached_full_dehydrate_list(self, bundles, for_list=False):
+        """
+        A version of ``full_dehydrate_list`` that, with
+        ``Meta.cache_dehydrated = True``, stores the dehydrated data per
+        object & serves it from the cache afterwards.
+
+        The entries are expired along with the object's cache generation
+        (by ``obj_update`` & ``obj_delete``). Changes to the objects of
+        nested ``full`` related resources aren't tracked.
+
+        They're kept per user (see ``get_dehydrated_cache_vary``), as the
+        data may depend on who's asking.
+
+        The whole list takes one ``get_many`` for the cache generations, one
+        for the entries & one ``set_many`` for the misses.
+        """
+        if not self._meta.cache_dehydrated:
+            return self.full_dehydrate_list(bundles, for_list=for_list)
+
+        cache_keys = self.get_dehydrated_cache_keys(bundles, for_list=for_list)
+        found = self._meta.cache.get_many([cache_key for cache_key in cache_keys if cache_key is not None])
+        missing = []
+
+        for cache_key, bundle in zip(cache_keys, bundles):
+            data = found.get(cache_key) if cache_key is not None else None
+
+            if data is not None:
+                bundle.data = data
+            else:
+                missing.append((cache_key, bundle))
+
+        if missing:
+            self.full_dehydrate_list([bundle for cache_key, bundle in missing], for_list=for_list)
+            to_cache = dict([(cache_key, self.cacheable_dehydrated_data(bundle.data)) for cache_key, bundle in missing if cache_key is not None])
+
+            if to_cache:
+                self._meta.cache.set_many(to_cache)
+
+        return bundles
+
+    def cached_full_dehydrate(self, bundle, for_list=False):
+        """
+        ``cached_full_dehydrate_list`` for a single bundle.
+        """
+        return self.cached_full_dehydrate_list([bundle], for_list=for_list)[0]
+
     def obj_create(self, bundle, **kwargs):
         """
         Creates a new object based on the provided data.
@@ -1160,6 +2048,43 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         raise NotImplementedError()
 
+    def obj_create_list(self, bundles, **kwargs):
+        """
+        Creates a new object for each of the provided bundles.
+
+        By default, calls ``obj_create`` for each bundle in turn, calling
+        ``rollback`` on the ones already created if one of them fails (unless
+        ``writes_are_atomic``).
+
+        ``ModelResource`` includes a version that can write the whole list
+        with bulk inserts (see ``Meta.bulk_create``).
+        """
+        bundles_seen = []
+
+        for bundle in bundles:
+            # Attempt to be transactional, deleting any previously created
+            # objects if validation fails.
+            try:
+                self.obj_create(bundle=bundle, **kwargs)
+                bundles_seen.append(bundle)
+            except ImmediateHttpResponse:
+                if not self.writes_are_atomic():
+                    self.rollback(bundles_seen)
+
+                raise
+
+        return bundles_seen
+
+    def writes_are_atomic(self):
+        """
+        Returns whether the writes being made are in a transaction that
+        undoes them if the request fails, so there's no need for ``rollback``
+        & list data can be deserialized a piece at a time.
+
+        ``ModelResource`` returns ``True`` inside its ``atomic`` blocks.
+        """
+        return False
+
     def obj_delete_list(self, bundle, **kwargs):
         """
         Deletes an entire list of objects.
@@ -1193,6 +2118,18 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         raise NotImplementedError()
 
+    def obj_delete_many(self, bundles):
+        """
+        Deletes the objects of the provided bundles.
+
+        By default, calls ``obj_delete`` for each bundle in turn.
+
+        ``ModelResource`` includes a version that deletes them all with a
+        single query.
+        """
+        for bundle in bundles:
+            self.obj_delete(bundle=bundle)
+
     def create_response(self, request, data, response_class=HttpResponse, **response_kwargs):
         """
         Extracts the common "which-format/serialize/return-response" cycle.
@@ -1203,6 +2140,131 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         serialized = self.serialize(request, data, desired_format)
         return response_class(content=serialized, content_type=build_content_type(desired_format), **response_kwargs)
 
+    def create_streaming_response(self, request, data, response_class=StreamingHttpResponse, **response_kwargs):
+        """
+        Like ``create_response``, but serializes the data a piece at a time
+        as the response is sent.
+
+        Any iterators at the top level of ``data`` (like the collection of a
+        list response) are only consumed as the content is written out.
+        """
+        desired_format = self.determine_format(request)
+        serialized = self._meta.serializer.serialize_stream(data, desired_format)
+        return response_class(serialized, content_type=build_content_type(desired_format), **response_kwargs)
+
+    def generate_etag(self, request, *bits):
+        """
+        Creates an ``ETag`` from the ``bits`` (which make up the version of
+        the data), the resource, the requested path & query string and the
+        negotiated format.
+        """
+        key_bits = [self._meta.api_name, self._meta.resource_name, request.get_full_path(), self.determine_format(request)]
+        key_bits.extend(bits)
+        return hashlib.md5(':'.join([force_text(bit) for bit in key_bits]).encode('utf-8')).hexdigest()
+
+    def get_detail_validators(self, request, obj):
+        """
+        Returns an ``(etag, last_modified)`` pair for a single object, used
+        for conditional ``GET`` requests. Either may be ``None``.
+
+        By default, reads ``Meta.version_field`` & ``Meta.last_modified_field``
+        off the object. The ``ETag`` is built from the version (or from the
+        modification time, if there's no version field).
+        """
+        last_modified = None
+        version = None
+
+        if self._meta.last_modified_field:
+            last_modified = getattr(obj, self._meta.last_modified_field, None)
+
+        if self._meta.version_field:
+            version = getattr(obj, self._meta.version_field, None)
+        elif last_modified is not None:
+            version = last_modified.isoformat()
+
+        if version is None:
+            return None, last_modified
+
+        return self.generate_etag(request, version), last_modified
+
+    def get_list_validators(self, request, objects):
+        """
+        Returns an ``(etag, last_modified)`` pair for a list of objects, used
+        for conditional ``GET`` requests. Either may be ``None``.
+
+        This should be cheaper than fetching the objects (an aggregate query,
+        for instance). By default, returns ``(None, None)``.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return None, None
+
+    def get_not_modified_response(self, request, etag=None, last_modified=None):
+        """
+        Checks the ``If-None-Match`` (or, failing that, the
+        ``If-Modified-Since``) header of the request against the provided
+        validators.
+
+        Returns a ``HttpNotModified`` (304 Not Modified) if the client's copy
+        is current, otherwise ``None``.
+        """
+        not_modified = False
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+
+        if if_none_match:
+            if etag is not None:
+                not_modified = if_none_match.strip() == '*' or etag in parse_etags(if_none_match)
+        elif if_modified_since and last_modified is not None:
+            since = parse_http_date_safe(if_modified_since)
+            not_modified = since is not None and self._http_timestamp(last_modified) <= since
+
+        if not not_modified:
+            return None
+
+        return self.patch_validators(http.HttpNotModified(), etag, last_modified)
+
+    def patch_validators(self, response, etag=None, last_modified=None):
+        """
+        Adds the ``ETag`` & ``Last-Modified`` headers to the response.
+        """
+        if etag is not None:
+            response['ETag'] = quote_etag(etag)
+
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(self._http_timestamp(last_modified))
+
+        return response
+
+    def conditional_response(self, request, response, etag=None, last_modified=None):
+        """
+        Finishes a response for a conditional ``GET``, adding the validators.
+
+        If there's no ``etag`` & ``Meta.etag_from_content = True``, the
+        ``ETag`` is a hash of the serialized content. This can only save
+        sending the content (a ``HttpNotModified`` is returned in its place
+        if the client's copy is current), not the work of building it.
+        """
+        if etag is None and self._meta.etag_from_content and response.status_code == 200 and not getattr(response, 'streaming', False):
+            etag = hashlib.md5(response.content).hexdigest()
+            not_modified = self.get_not_modified_response(request, etag=etag, last_modified=last_modified)
+
+            if not_modified is not None:
+                return not_modified
+
+        return self.patch_validators(response, etag, last_modified)
+
+    def _http_timestamp(self, value):
+        """
+        Converts a ``datetime`` (or ``date``) into a timestamp for HTTP
+        headers. Naive values are taken to be in local time.
+        """
+        if getattr(value, 'tzinfo', None) is not None and value.utcoffset() is not None:
+            return calendar.timegm(value.utctimetuple())
+
+        return time.mktime(value.timetuple())
+
     def error_response(self, request, errors, response_class=None):
         """
         Extracts the common "which-format/serialize/return-error-response"
@@ -1280,27 +2342,86 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Calls ``obj_get_list`` to provide the data, then handles that result
         set and serializes it.
 
-        Should return a HttpResponse (200 OK).
+        Should return a HttpResponse (200 OK), or ``HttpNotModified`` (304 Not
+        Modified) for a conditional request if the client's copy is current.
         """
         # TODO: Uncached for now. Invalidation that works for everyone may be
         #       impossible.
+        sparse_fields = self.get_sparse_fields(request)
+        expand = self.get_expansions(request)
         base_bundle = self.build_bundle(request=request)
         objects = self.obj_get_list(bundle=base_bundle, **self.remove_api_resource_names(kwargs))
         sorted_objects = self.apply_sorting(objects, options=request.GET)
 
-        paginator = self._meta.paginator_class(request.GET, sorted_objects, resource_uri=self.get_resource_uri(), limit=self._meta.limit, max_limit=self._meta.max_limit, collection_name=self._meta.collection_name)
+        # Answer conditional requests before fetching anything else. The
+        # latest modification time of a list doesn't change when objects are
+        # removed from it, so ``If-Modified-Since`` isn't trusted unless it's
+        # been said to.
+        etag, last_modified = self.get_list_validators(request, sorted_objects)
+
+        if self._meta.last_modified_tracks_deletes:
+            not_modified = self.get_not_modified_response(request, etag, last_modified)
+        else:
+            not_modified = self.get_not_modified_response(request, etag)
+
+        if not_modified is not None:
+            return not_modified
+
+        sorted_objects = self.apply_query_plan(sorted_objects, for_list=True, sparse_fields=sparse_fields, expand=expand)
+        sorted_objects = self.apply_values(sorted_objects, for_list=True, sparse_fields=sparse_fields)
+        sorted_objects = self.apply_sparse_fields(sorted_objects, sparse_fields=sparse_fields)
+
+        paginator_kwargs = {}
+
+        # Only pass ``count_mode`` when it's in use, so paginators written
+        # before it existed still work.
+        if self._meta.count_mode != 'exact':
+            paginator_kwargs['count_mode'] = self._meta.count_mode
+
+        paginator = self._meta.paginator_class(request.GET, sorted_objects, resource_uri=self.get_resource_uri(), limit=self._meta.limit, max_limit=self._meta.max_limit, collection_name=self._meta.collection_name, **paginator_kwargs)
         to_be_serialized = paginator.page()
 
+        if self._meta.stream_list and self._meta.serializer.can_stream(self.determine_format(request)):
+            # Dehydrate the bundles only as they get serialized.
+            to_be_serialized[self._meta.collection_name] = self.iter_dehydrated_bundles(request, to_be_serialized[self._meta.collection_name], sparse_fields=sparse_fields, expand=expand)
+            to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
+            return self.conditional_response(request, self.create_streaming_response(request, to_be_serialized), etag, last_modified)
+
         # Dehydrate the bundles in preparation for serialization.
-        bundles = []
+        bundles = [self.build_bundle(obj=obj, request=request, sparse_fields=sparse_fields, expand=expand) for obj in to_be_serialized[self._meta.collection_name]]
+        to_be_serialized[self._meta.collection_name] = self.full_dehydrate_list(bundles, for_list=True)
+        to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
+        return self.conditional_response(request, self.create_response(request, to_be_serialized), etag, last_modified)
 
-        for obj in to_be_serialized[self._meta.collection_name]:
-            bundle = self.build_bundle(obj=obj, request=request)
-            bundles.append(self.full_dehydrate(bundle, for_list=True))
+    def iter_dehydrated_bundles(self, request, objects, for_list=True, sparse_fields=None, expand=None):
+        """
+        Lazily builds & dehydrates a bundle for each of the ``objects``.
 
-        to_be_serialized[self._meta.collection_name] = bundles
-        to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
-        return self.create_response(request, to_be_serialized)
+        ``QuerySet`` data is read with ``iterator``, ``Meta.stream_chunk_size``
+        objects at a time (running any ``prefetch_related`` & the
+        ``batch_dehydrate`` per chunk), so only one chunk is held in memory
+        at once.
+        """
+        prefetch_lookups = getattr(objects, '_prefetch_related_lookups', None)
+
+        if hasattr(objects, 'iterator'):
+            objects = objects.iterator()
+
+        objects = iter(objects)
+
+        while True:
+            chunk = list(islice(objects, self._meta.stream_chunk_size))
+
+            if not chunk:
+                break
+
+            if prefetch_lookups:
+                prefetch_related_objects(chunk, prefetch_lookups)
+
+            bundles = [self.build_bundle(obj=obj, request=request, sparse_fields=sparse_fields, expand=expand) for obj in chunk]
+
+            for bundle in self.full_dehydrate_list(bundles, for_list=for_list):
+                yield bundle
 
     def get_detail(self, request, **kwargs):
         """
@@ -1309,9 +2430,12 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Calls ``cached_obj_get/obj_get`` to provide the data, then handles that result
         set and serializes it.
 
-        Should return a HttpResponse (200 OK).
+        Should return a HttpResponse (200 OK), or ``HttpNotModified`` (304 Not
+        Modified) for a conditional request if the client's copy is current.
         """
-        basic_bundle = self.build_bundle(request=request)
+        sparse_fields = self.get_sparse_fields(request)
+        expand = self.get_expansions(request)
+        basic_bundle = self.build_bundle(request=request, sparse_fields=sparse_fields)
 
         try:
             obj = self.cached_obj_get(bundle=basic_bundle, **self.remove_api_resource_names(kwargs))
@@ -1320,10 +2444,16 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         except MultipleObjectsReturned:
             return http.HttpMultipleChoices("More than one resource is found at this URI.")
 
-        bundle = self.build_bundle(obj=obj, request=request)
-        bundle = self.full_dehydrate(bundle)
+        etag, last_modified = self.get_detail_validators(request, obj)
+        not_modified = self.get_not_modified_response(request, etag, last_modified)
+
+        if not_modified is not None:
+            return not_modified
+
+        bundle = self.build_bundle(obj=obj, request=request, sparse_fields=sparse_fields, expand=expand)
+        bundle = self.cached_full_dehydrate(bundle)
         bundle = self.alter_detail_data_to_serialize(request, bundle)
-        return self.create_response(request, bundle)
+        return self.conditional_response(request, self.create_response(request, bundle), etag, last_modified)
 
     def post_list(self, request, **kwargs):
         """
@@ -1335,8 +2465,16 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         If a new resource is created, return ``HttpCreated`` (201 Created).
         If ``Meta.always_return_data = True``, there will be a populated body
         of serialized data.
+
+        If ``Meta.bulk_create = True``, a collection of objects (under
+        ``Meta.collection_name``) may be sent instead, which is created with
+        ``obj_create_list``. The ``Location`` is then the list's URI.
         """
         deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
+
+        if self._meta.bulk_create and isinstance(deserialized, dict) and self._meta.collection_name in deserialized:
+            return self.post_list_bulk(request, deserialized, **kwargs)
+
         deserialized = self.alter_deserialized_detail_data(request, deserialized)
         bundle = self.build_bundle(data=dict_strip_unicode_keys(deserialized), request=request)
         updated_bundle = self.obj_create(bundle, **self.remove_api_resource_names(kwargs))
@@ -1345,10 +2483,34 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         if not self._meta.always_return_data:
             return http.HttpCreated(location=location)
         else:
-            updated_bundle = self.full_dehydrate(updated_bundle)
+            updated_bundle = self.full_dehydrate_list([updated_bundle])[0]
             updated_bundle = self.alter_detail_data_to_serialize(request, updated_bundle)
             return self.create_response(request, updated_bundle, response_class=http.HttpCreated, location=location)
 
+    def post_list_bulk(self, request, deserialized, **kwargs):
+        """
+        Creates a collection of new resources/objects with the provided data.
+
+        Used by ``post_list`` when ``Meta.bulk_create = True`` & the data
+        holds a collection.
+
+        Return ``HttpCreated`` (201 Created), with the list's URI as the
+        location & the created collection serialized in the body if
+        ``Meta.always_return_data = True``.
+        """
+        deserialized = self.alter_deserialized_list_data(request, deserialized)
+        bundles = [self.build_bundle(data=dict_strip_unicode_keys(object_data), request=request) for object_data in deserialized[self._meta.collection_name]]
+        bundles_seen = self.obj_create_list(bundles, **self.remove_api_resource_names(kwargs))
+        location = self.get_resource_uri()
+
+        if not self._meta.always_return_data:
+            return http.HttpCreated(location=location)
+        else:
+            to_be_serialized = {}
+            to_be_serialized[self._meta.collection_name] = self.full_dehydrate_list(bundles_seen, for_list=True)
+            to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
+            return self.create_response(request, to_be_serialized, response_class=http.HttpCreated, location=location)
+
     def post_detail(self, request, **kwargs):
         """
         Creates a new subcollection of the resource under a resource.
@@ -1364,8 +2526,9 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         Replaces a collection of resources with another collection.
 
-        Calls ``delete_list`` to clear out the collection then ``obj_create``
-        with the provided the data to create the new collection.
+        Calls ``delete_list`` to clear out the collection then
+        ``obj_create_list`` with the provided the data to create the new
+        collection.
 
         Return ``HttpNoContent`` (204 No Content) if
         ``Meta.always_return_data = False`` (default).
@@ -1373,36 +2536,69 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Return ``HttpAccepted`` (200 OK) if
         ``Meta.always_return_data = True``.
         """
-        deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
-        deserialized = self.alter_deserialized_list_data(request, deserialized)
+        streaming = self.can_stream_deserialize(request)
+
+        if streaming:
+            # Read up to the collection before deleting anything, then only
+            # read the objects as they're created.
+            pairs = self.deserialize_stream(request, format=request.META.get('CONTENT_TYPE', 'application/json'))
+            deserialized = {}
+
+            for key, value in pairs:
+                if key == self._meta.collection_name:
+                    deserialized[key] = value
+                    break
+        else:
+            deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
+
+            deserialized = self.alter_deserialized_list_data(request, deserialized)
 
         if not self._meta.collection_name in deserialized:
             raise BadRequest("Invalid data sent.")
 
         basic_bundle = self.build_bundle(request=request)
         self.obj_delete_list_for_update(bundle=basic_bundle, **self.remove_api_resource_names(kwargs))
-        bundles_seen = []
 
-        for object_data in deserialized[self._meta.collection_name]:
-            bundle = self.build_bundle(data=dict_strip_unicode_keys(object_data), request=request)
+        if streaming:
+            bundles_seen = self._put_list_stream(request, deserialized[self._meta.collection_name], **kwargs)
 
-            # Attempt to be transactional, deleting any previously created
-            # objects if validation fails.
-            try:
-                self.obj_create(bundle=bundle, **self.remove_api_resource_names(kwargs))
-                bundles_seen.append(bundle)
-            except ImmediateHttpResponse:
-                self.rollback(bundles_seen)
-                raise
+            # Read the rest, so that invalid data after the collection undoes
+            # the request too.
+            for key, value in pairs:
+                pass
+        else:
+            bundles = [self.build_bundle(data=dict_strip_unicode_keys(object_data), request=request) for object_data in deserialized[self._meta.collection_name]]
+            bundles_seen = self.obj_create_list(bundles, **self.remove_api_resource_names(kwargs))
 
         if not self._meta.always_return_data:
             return http.HttpNoContent()
         else:
             to_be_serialized = {}
-            to_be_serialized[self._meta.collection_name] = [self.full_dehydrate(bundle, for_list=True) for bundle in bundles_seen]
+            to_be_serialized[self._meta.collection_name] = self.full_dehydrate_list(bundles_seen, for_list=True)
             to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
             return self.create_response(request, to_be_serialized)
 
+    def _put_list_stream(self, request, object_list, **kwargs):
+        """
+        Creates the objects of a streamed ``PUT`` to the list with
+        ``obj_create_list``, ``Meta.stream_chunk_size`` at a time as they're
+        read.
+
+        The bundles are only kept if they're returned (with
+        ``Meta.always_return_data``).
+        """
+        bundles_seen = []
+        object_list = iter(object_list)
+
+        for chunk in iter(lambda: list(islice(object_list, self._meta.stream_chunk_size)), []):
+            bundles = [self.build_bundle(data=dict_strip_unicode_keys(object_data), request=request) for object_data in chunk]
+            bundles = self.obj_create_list(bundles, **self.remove_api_resource_names(kwargs))
+
+            if self._meta.always_return_data:
+                bundles_seen.extend(bundles)
+
+        return bundles_seen
+
     def put_detail(self, request, **kwargs):
         """
         Either updates an existing resource or creates a new one with the
@@ -1432,7 +2628,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             if not self._meta.always_return_data:
                 return http.HttpNoContent()
             else:
-                updated_bundle = self.full_dehydrate(updated_bundle)
+                updated_bundle = self.full_dehydrate_list([updated_bundle])[0]
                 updated_bundle = self.alter_detail_data_to_serialize(request, updated_bundle)
                 return self.create_response(request, updated_bundle)
         except (NotFound, MultipleObjectsReturned):
@@ -1442,7 +2638,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             if not self._meta.always_return_data:
                 return http.HttpCreated(location=location)
             else:
-                updated_bundle = self.full_dehydrate(updated_bundle)
+                updated_bundle = self.full_dehydrate_list([updated_bundle])[0]
                 updated_bundle = self.alter_detail_data_to_serialize(request, updated_bundle)
                 return self.create_response(request, updated_bundle, response_class=http.HttpCreated, location=location)
 
@@ -1531,33 +2727,105 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         other than ``objects`` (default).
         """
         request = convert_post_to_patch(request)
-        deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
+        collection_name = self._meta.collection_name
+        deleted_collection_name = 'deleted_%s' % collection_name
+
+        if self.can_stream_deserialize(request):
+            # The objects are handled ``Meta.stream_chunk_size`` at a time, as
+            # they're read.
+            pairs = self.deserialize_stream(request, format=request.META.get('CONTENT_TYPE', 'application/json'))
+            chunk_size = self._meta.stream_chunk_size
+        else:
+            deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
+
+            if collection_name not in deserialized:
+                raise BadRequest("Invalid data sent: missing '%s'" % collection_name)
+
+            pairs = [(collection_name, deserialized[collection_name]), (deleted_collection_name, deserialized.get(deleted_collection_name, []))]
+            chunk_size = None
+
+        bundles_seen = []
+        deleted_collection = []
+        collection_found = False
+
+        for key, value in pairs:
+            if key == collection_name:
+                collection_found = True
+
+                if chunk_size is None:
+                    chunks = [value]
+                else:
+                    value = iter(value)
+                    chunks = iter(lambda: list(islice(value, chunk_size)), [])
+
+                for chunk in chunks:
+                    bundles = self._patch_list_objects(request, chunk)
+
+                    if self._meta.always_return_data:
+                        bundles_seen.extend(bundles)
+            elif key == deleted_collection_name:
+                deleted_collection = list(value)
+
+        if not collection_found:
+            raise BadRequest("Invalid data sent: missing '%s'" % collection_name)
+
+        if deleted_collection:
+            if 'delete' not in self._meta.detail_allowed_methods:
+                raise ImmediateHttpResponse(response=http.HttpMethodNotAllowed())
+
+            deleted_objects = self.get_via_uris(deleted_collection, request=request)
+            bundles_to_delete = []
+
+            uris_seen = set()
+
+            for uri in deleted_collection:
+                # URIs listed more than once are only deleted once.
+                if uri in uris_seen:
+                    continue
+
+                if not uri in deleted_objects:
+                    raise NotFound("The object referenced by '%s' could not be found." % uri)
+
+                uris_seen.add(uri)
+                bundles_to_delete.append(self.build_bundle(obj=deleted_objects[uri], request=request))
+
+            self.obj_delete_many(bundles_to_delete)
 
-        collection_name = self._meta.collection_name
-        deleted_collection_name = 'deleted_%s' % collection_name
-        if collection_name not in deserialized:
-            raise BadRequest("Invalid data sent: missing '%s'" % collection_name)
+        if not self._meta.always_return_data:
+            return http.HttpAccepted()
+        else:
+            to_be_serialized = {}
+            to_be_serialized['objects'] = self.full_dehydrate_list(bundles_seen, for_list=True)
+            to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
+            return self.create_response(request, to_be_serialized, response_class=http.HttpAccepted)
 
-        if len(deserialized[collection_name]) and 'put' not in self._meta.detail_allowed_methods:
+    def _patch_list_objects(self, request, object_list):
+        """
+        Creates or updates in-place each of the ``object_list`` sent in a
+        ``PATCH`` to the list, returning their bundles.
+        """
+        if len(object_list) and 'put' not in self._meta.detail_allowed_methods:
             raise ImmediateHttpResponse(response=http.HttpMethodNotAllowed())
 
         bundles_seen = []
 
-        for data in deserialized[collection_name]:
+        # Look up all the referenced objects at once.
+        existing_objects = self.get_via_uris([data['resource_uri'] for data in object_list if "resource_uri" in data], request=request)
+
+        for data in object_list:
             # If there's a resource_uri then this is either an
             # update-in-place or a create-via-PUT.
             if "resource_uri" in data:
                 uri = data.pop('resource_uri')
+                obj = existing_objects.get(uri)
 
-                try:
-                    obj = self.get_via_uri(uri, request=request)
-
+                if obj is not None:
                     # The object does exist, so this is an update-in-place.
                     bundle = self.build_bundle(obj=obj, request=request)
                     bundle = self.full_dehydrate(bundle, for_list=True)
                     bundle = self.alter_detail_data_to_serialize(request, bundle)
                     self.update_in_place(request, bundle, data)
-                except (ObjectDoesNotExist, MultipleObjectsReturned):
+                else:
                     # The object referenced by resource_uri doesn't exist,
                     # so this is a create-by-PUT equivalent.
                     data = self.alter_deserialized_detail_data(request, data)
@@ -1572,24 +2840,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
             bundles_seen.append(bundle)
 
-        deleted_collection = deserialized.get(deleted_collection_name, [])
-
-        if deleted_collection:
-            if 'delete' not in self._meta.detail_allowed_methods:
-                raise ImmediateHttpResponse(response=http.HttpMethodNotAllowed())
-
-            for uri in deleted_collection:
-                obj = self.get_via_uri(uri, request=request)
-                bundle = self.build_bundle(obj=obj, request=request)
-                self.obj_delete(bundle=bundle)
-
-        if not self._meta.always_return_data:
-            return http.HttpAccepted()
-        else:
-            to_be_serialized = {}
-            to_be_serialized['objects'] = [self.full_dehydrate(bundle, for_list=True) for bundle in bundles_seen]
-            to_be_serialized = self.alter_list_data_to_serialize(request, to_be_serialized)
-            return self.create_response(request, to_be_serialized, response_class=http.HttpAccepted)
+        return bundles_seen
 
     def patch_detail(self, request, **kwargs):
         """
@@ -1627,7 +2878,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         if not self._meta.always_return_data:
             return http.HttpAccepted()
         else:
-            bundle = self.full_dehydrate(bundle)
+            bundle = self.full_dehydrate_list([bundle])[0]
             bundle = self.alter_detail_data_to_serialize(request, bundle)
             return self.create_response(request, bundle, response_class=http.HttpAccepted)
 
@@ -1669,31 +2920,49 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Returns a serialized list of resources based on the identifiers
         from the URL.
 
-        Calls ``obj_get`` to fetch only the objects requested. This method
-        only responds to HTTP GET.
+        Calls ``obj_get_multiple`` to fetch only the objects requested, in
+        the order they were requested. This method responds to HTTP GET &
+        POST. A POST sends the identifiers in the body instead (either as a
+        list or under ``<detail_uri_name>_list``), so long lists aren't
+        limited by the length of the URL.
 
         Should return a HttpResponse (200 OK).
         """
-        self.method_check(request, allowed=['get'])
+        self.method_check(request, allowed=['get', 'post'])
         self.is_authenticated(request)
         self.throttle_check(request)
 
-        # Rip apart the list then iterate.
         kwarg_name = '%s_list' % self._meta.detail_uri_name
-        obj_identifiers = kwargs.get(kwarg_name, '').split(';')
+
+        if request.method == 'POST':
+            deserialized = self.deserialize(request, request.body, format=request.META.get('CONTENT_TYPE', 'application/json'))
+
+            if isinstance(deserialized, dict):
+                deserialized = deserialized.get(kwarg_name)
+
+            if not isinstance(deserialized, (list, tuple)):
+                raise BadRequest("Invalid data sent: expected a list of identifiers (or one under '%s')." % kwarg_name)
+
+            obj_identifiers = [force_text(identifier) for identifier in deserialized]
+        else:
+            # Rip apart the list.
+            obj_identifiers = (kwargs.get(kwarg_name) or '').split(';')
+
         objects = []
         not_found = []
-        base_bundle = self.build_bundle(request=request)
+        sparse_fields = self.get_sparse_fields(request)
+        expand = self.get_expansions(request)
+        base_bundle = self.build_bundle(request=request, sparse_fields=sparse_fields, expand=expand)
+        found = self.obj_get_multiple(base_bundle, obj_identifiers)
 
         for identifier in obj_identifiers:
-            try:
-                obj = self.obj_get(bundle=base_bundle, **{self._meta.detail_uri_name: identifier})
-                bundle = self.build_bundle(obj=obj, request=request)
-                bundle = self.full_dehydrate(bundle, for_list=True)
-                objects.append(bundle)
-            except (ObjectDoesNotExist, Unauthorized):
+            if not identifier in found:
                 not_found.append(identifier)
+                continue
+
+            objects.append(self.build_bundle(obj=found[identifier], request=request, sparse_fields=sparse_fields, expand=expand))
 
+        objects = self.cached_full_dehydrate_list(objects, for_list=True)
         object_list = {
             self._meta.collection_name: objects,
         }
@@ -1739,6 +3008,29 @@ class ModelDeclarativeMetaclass(DeclarativeMetaclass):
         return new_class
 
 
+class ValuesRow(dict):
+    """
+    A row of data fetched by ``ModelResource.apply_values``, standing in for
+    a model instance. The columns can be read as attributes as well.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class ValuesRowQuerySet(ValuesQuerySet):
+    """
+    A ``ValuesQuerySet`` that produces ``ValuesRow`` objects.
+    """
+    def iterator(self):
+        for row in super(ValuesRowQuerySet, self).iterator():
+            yield ValuesRow(row)
+
+
 class BaseModelResource(Resource):
     """
     A subclass of ``Resource`` designed to work with Django's ``Models``.
@@ -1945,91 +3237,553 @@ class BaseModelResource(Resource):
         if filters is None:
             filters = {}
 
-        qs_filters = {}
+        qs_filters = {}
+
+        if getattr(self._meta, 'queryset', None) is not None:
+            # Get the possible query terms from the current QuerySet.
+            query_terms = self._meta.queryset.query.query_terms
+        else:
+            query_terms = QUERY_TERMS
+
+        for filter_expr, value in filters.items():
+            filter_bits = filter_expr.split(LOOKUP_SEP)
+            field_name = filter_bits.pop(0)
+            filter_type = 'exact'
+
+            if not field_name in self.fields:
+                # It's not a field we know about. Move along citizen.
+                continue
+
+            if len(filter_bits) and filter_bits[-1] in query_terms:
+                filter_type = filter_bits.pop()
+
+            lookup_bits = self.check_filtering(field_name, filter_type, filter_bits)
+            value = self.filter_value_to_python(value, field_name, filters, filter_expr, filter_type)
+
+            if getattr(self.fields[field_name], 'is_annotation', False):
+                filter_type, value = self.fields[field_name].build_filter(filter_type, value)
+
+            db_field_name = LOOKUP_SEP.join(lookup_bits)
+            qs_filter = "%s%s%s" % (db_field_name, LOOKUP_SEP, filter_type)
+            qs_filters[qs_filter] = value
+
+        return dict_strip_unicode_keys(qs_filters)
+
+    def apply_sorting(self, obj_list, options=None):
+        """
+        Given a dictionary of options, apply some ORM-level sorting to the
+        provided ``QuerySet``.
+
+        Looks for the ``order_by`` key and handles either ascending (just the
+        field name) or descending (the field name with a ``-`` in front).
+
+        The field name should be the resource field, **NOT** model field.
+        """
+        if options is None:
+            options = {}
+
+        parameter_name = 'order_by'
+
+        if not 'order_by' in options:
+            if not 'sort_by' in options:
+                # Nothing to alter the order. Return what we've got.
+                return obj_list
+            else:
+                warnings.warn("'sort_by' is a deprecated parameter. Please use 'order_by' instead.")
+                parameter_name = 'sort_by'
+
+        order_by_args = []
+
+        if hasattr(options, 'getlist'):
+            order_bits = options.getlist(parameter_name)
+        else:
+            order_bits = options.get(parameter_name)
+
+            if not isinstance(order_bits, (list, tuple)):
+                order_bits = [order_bits]
+
+        for order_by in order_bits:
+            order_by_bits = order_by.split(LOOKUP_SEP)
+
+            field_name = order_by_bits[0]
+            order = ''
+
+            if order_by_bits[0].startswith('-'):
+                field_name = order_by_bits[0][1:]
+                order = '-'
+
+            if not field_name in self.fields:
+                # It's not a field we know about. Move along citizen.
+                raise InvalidSortError("No matching '%s' field for ordering on." % field_name)
+
+            if not field_name in self._meta.ordering:
+                raise InvalidSortError("The '%s' field does not allow ordering." % field_name)
+
+            if self.fields[field_name].attribute is None:
+                raise InvalidSortError("The '%s' field has no 'attribute' for ordering with." % field_name)
+
+            order_by_args.append("%s%s" % (order, LOOKUP_SEP.join([self.fields[field_name].attribute] + order_by_bits[1:])))
+
+        return obj_list.order_by(*order_by_args)
+
+    def _resolve_relation(self, model, attr):
+        """
+        Given a model & an attribute name, returns a tuple of the related model
+        & whether the relation is single-valued (``select_related``-able).
+
+        Returns ``(None, False)`` if the attribute isn't a relation the ORM
+        can follow.
+        """
+        opts = model._meta
+
+        try:
+            field = opts.get_field(attr)
+        except FieldDoesNotExist:
+            field = None
+
+        if field is not None:
+            if getattr(field, 'rel', None) is None:
+                return None, False
+
+            return field.rel.to, not field in opts.many_to_many
+
+        # Reverse relations are keyed on the accessor, which is what
+        # ``ApiField.attribute`` uses.
+        for related in opts.get_all_related_objects() + opts.get_all_related_many_to_many_objects():
+            if related.get_accessor_name() == attr:
+                return related.model, not related.field.rel.multiple
+
+        return None, False
+
+    def _plan_related_queries(self, plan, model, prefix, prefetching, for_list, seen, sparse_fields=None, expand=None):
+        use_in = ['all', 'list' if for_list else 'detail']
+
+        for field_name, field_object in self.fields.items():
+            if not getattr(field_object, 'is_related', False):
+                continue
+
+            if sparse_fields is not None and not field_name in sparse_fields:
+                continue
+
+            if not isinstance(field_object.attribute, six.string_types):
+                continue
+
+            if not callable(field_object.use_in) and not field_object.use_in in use_in:
+                continue
+
+            current_model = model
+            path = prefix
+            field_prefetching = prefetching
+
+            for attr in field_object.attribute.split(LOOKUP_SEP):
+                related_model, single = self._resolve_relation(current_model, attr)
+
+                if related_model is None:
+                    break
+
+                path = LOOKUP_SEP.join([bit for bit in (path, attr) if bit])
+                field_prefetching = field_prefetching or not single
+
+                if field_prefetching:
+                    plan['prefetch_related'].add(path)
+                else:
+                    plan['select_related'].add(path)
+
+                current_model = related_model
+            else:
+                # The related resource is only nested (and so only touches
+                # its own relations) if ``full`` applies in this mode, or if
+                # it was expanded for the request.
+                field_expand = expand.get(field_name) if expand else None
+
+                if field_expand is None:
+                    if not field_object.full:
+                        continue
+
+                    full = field_object.full_list if for_list else field_object.full_detail
+
+                    if not (callable(full) or full):
+                        continue
+
+                related_resource = field_object.to_class()
+
+                if not isinstance(related_resource, BaseModelResource):
+                    continue
+
+                # Expansions are limited in depth, so they can't loop.
+                if related_resource.__class__ in seen and field_expand is None:
+                    continue
+
+                # Nested resources are always dehydrated in detail mode.
+                related_resource._plan_related_queries(plan, current_model, path, field_prefetching, False, seen | set([related_resource.__class__]), expand=field_expand)
+
+    def build_query_plan(self, for_list=True, sparse_fields=None, expand=None):
+        """
+        Builds the ``select_related``/``prefetch_related`` lookups needed to
+        dehydrate the related fields of this resource without a query per
+        object.
+
+        Walks the ``RelatedField`` instances usable in the requested mode,
+        descending into related resources that will be included in full.
+        Only the related fields in ``sparse_fields`` are used, if given. The
+        related resources in the ``expand`` tree (from ``get_expansions``) are
+        descended into as if they were ``full``.
+        Single-valued relations are joined via ``select_related``; anything
+        reached through a to-many relation is fetched via
+        ``prefetch_related``.
+
+        Returns a dictionary with ``select_related`` & ``prefetch_related``
+        keys, each a sorted list of lookups. Useful for inspecting what will
+        be applied.
+        """
+        plan = {
+            'select_related': set(),
+            'prefetch_related': set(),
+        }
+
+        if self._meta.object_class is not None:
+            self._plan_related_queries(plan, self._meta.object_class, '', False, for_list, set([self.__class__]), sparse_fields, expand)
+
+        return dict((key, sorted(lookups)) for key, lookups in plan.items())
+
+    def apply_query_plan(self, obj_list, for_list=True, prefetch=True, sparse_fields=None, expand=None):
+        """
+        An ORM-specific implementation of ``apply_query_plan``.
+
+        Applies the lookups from ``build_query_plan`` to the provided
+        ``QuerySet``. Does nothing if ``Meta.plan_related_queries`` is
+        ``False`` or if ``obj_list`` isn't a ``QuerySet``.
+
+        Optionally accepts ``prefetch=False`` to only apply the
+        ``select_related`` portion of the plan.
+        """
+        if not self._meta.plan_related_queries:
+            return obj_list
+
+        if not hasattr(obj_list, 'prefetch_related'):
+            return obj_list
+
+        plan = self.build_query_plan(for_list=for_list, sparse_fields=sparse_fields, expand=expand)
+        select_related = plan['select_related']
+
+        if select_related and obj_list.query.select_related is not True:
+            # Django replaces (rather than extends) any existing
+            # ``select_related`` lookups, so carry those over.
+            existing = []
+            pending = [('', obj_list.query.select_related or {})]
+
+            while pending:
+                path, lookups = pending.pop()
+
+                for name, children in lookups.items():
+                    lookup = LOOKUP_SEP.join([bit for bit in (path, name) if bit])
+                    existing.append(lookup)
+                    pending.append((lookup, children))
+
+            obj_list = obj_list.select_related(*sorted(set(existing + select_related)))
+
+        if prefetch and plan['prefetch_related']:
+            obj_list = obj_list.prefetch_related(*plan['prefetch_related'])
+
+        return obj_list
+
+    def get_list_validators(self, request, objects):
+        """
+        An ORM-specific implementation of ``get_list_validators``.
+
+        Uses a single aggregate query over the (filtered & sorted) objects:
+        the count & the largest primary key (to notice removals &
+        additions), plus the latest ``Meta.last_modified_field`` and/or the
+        sum & maximum of ``Meta.version_field``. Only changes to the rows of
+        the resource's own model are noticed.
+        """
+        if not (self._meta.last_modified_field or self._meta.version_field) or not isinstance(objects, QuerySet):
+            return None, None
+
+        aggregates = {
+            'count': Count('pk'),
+            'pk_max': Max('pk'),
+        }
+
+        if self._meta.last_modified_field:
+            aggregates['last_modified'] = Max(self._meta.last_modified_field)
+
+        if self._meta.version_field:
+            aggregates['version_sum'] = Sum(self._meta.version_field)
+            aggregates['version_max'] = Max(self._meta.version_field)
+
+        values = objects.order_by().aggregate(**aggregates)
+        last_modified = values.get('last_modified')
+        etag = self.generate_etag(request, *['%s=%s' % (name, values[name]) for name in sorted(values)])
+        return etag, last_modified
+
+    def get_values_plan(self, for_list=True, sparse_fields=None):
+        """
+        Works out whether the fields can be dehydrated straight from rows of
+        column data, without building model instances.
+
+        Returns ``None`` if any field needs more than a plain model column.
+        That's any related field, ``__`` lookup, callable/non-column
+        ``attribute``, field with its own ``dehydrate``, or ``dehydrate_FOO``
+        method (other than the stock one for ``resource_uri``). The same goes
+        for resources that override ``dehydrate`` or ``full_dehydrate``.
+        Otherwise, returns a tuple of ``(field_name, field_object, use_in,
+        method, column)``, following ``get_dehydration_plan``.
+
+        As there, only the full plan is kept. With ``sparse_fields``, it's
+        filtered, unless it's ``None`` (the left out fields might be the ones
+        ruling it out), in which case the plan is worked out again.
+        """
+        if sparse_fields is not None:
+            plan = self.get_values_plan(for_list=for_list)
+
+            if plan is None:
+                return self._build_values_plan(for_list, sparse_fields)
+
+            return tuple(entry for entry in plan if entry[0] in sparse_fields)
+
+        key = ('values', for_list, self._meta.api_name, self._meta.resource_name)
+
+        try:
+            return self._bound_dehydration_plans[key]
+        except KeyError:
+            pass
+
+        plan = self._build_values_plan(for_list)
+        self._bound_dehydration_plans[key] = plan
+        return plan
+
+    def _build_values_plan(self, for_list, sparse_fields=None):
+        cls = self.__class__
+
+        if self._meta.object_class is None:
+            return None
+
+        if six.get_unbound_function(cls.dehydrate) is not six.get_unbound_function(Resource.dehydrate):
+            return None
+
+        if six.get_unbound_function(cls.full_dehydrate) is not six.get_unbound_function(BaseModelResource.full_dehydrate):
+            return None
+
+        plain_dehydrates = (
+            six.get_unbound_function(fields.ApiField.dehydrate),
+            six.get_unbound_function(fields.TimeField.dehydrate),
+        )
+        stock_uri_method = six.get_unbound_function(Resource.dehydrate_resource_uri)
+        model_opts = self._meta.object_class._meta
+        plan = []
+
+        for field_name, field_object, use_in, method in self.get_dehydration_plan(for_list=for_list, sparse_fields=sparse_fields):
+            if getattr(field_object, 'is_related', False):
+                return None
+
+            if six.get_unbound_function(type(field_object).dehydrate) not in plain_dehydrates:
+                return None
+
+            if method is not None:
+                if field_name != 'resource_uri' or six.get_unbound_function(cls.dehydrate_resource_uri) is not stock_uri_method:
+                    return None
+
+            column = field_object.attribute
+
+            if column is not None:
+                if not isinstance(column, six.string_types) or LOOKUP_SEP in column:
+                    return None
+
+                try:
+                    model_field = model_opts.get_field(column)
+                except FieldDoesNotExist:
+                    return None
+
+                if model_field.rel is not None:
+                    return None
+
+            plan.append((field_name, field_object, use_in, method, column))
+
+        return tuple(plan)
+
+    def apply_values(self, obj_list, for_list=True, sparse_fields=None):
+        """
+        An ORM-specific implementation of ``apply_values``.
+
+        If ``Meta.use_values`` is on & ``get_values_plan`` allows it, returns
+        a ``QuerySet`` that only fetches the columns the fields (plus the
+        detail URI, the primary key & the ordering) need, as ``ValuesRow``
+        objects.
+        ``full_dehydrate`` then converts those values directly.
+
+        Otherwise, returns ``obj_list`` as is.
+        """
+        if not self._meta.use_values:
+            return obj_list
+
+        if not isinstance(obj_list, QuerySet) or isinstance(obj_list, ValuesQuerySet):
+            return obj_list
+
+        if obj_list._prefetch_related_lookups:
+            return obj_list
+
+        plan = self.get_values_plan(for_list=for_list, sparse_fields=sparse_fields)
+
+        if plan is None:
+            return obj_list
+
+        columns = set(column for field_name, field_object, use_in, method, column in plan if column is not None)
+        columns.add(self._meta.detail_uri_name)
+
+        # Let the paginator see the values it orders by (the primary key is
+        # the tie-breaker for cursors).
+        columns.add('pk')
+        query = obj_list.query
+        order_by = query.order_by or (query.default_ordering and query.get_meta().ordering) or []
+
+        for field_name in order_by:
+            if field_name != '?':
+                columns.add(field_name.lstrip('-'))
+
+        return obj_list._clone(klass=ValuesRowQuerySet, setup=True, _fields=sorted(columns))
+
+    def get_sparse_columns(self, sparse_fields):
+        """
+        Works out the model fields the ``sparse_fields`` read, to load with
+        ``QuerySet.only``.
+
+        Returns ``None`` (load every column) if any of them might read more
+        than its ``attribute``. That's a callable/non-model ``attribute``, a
+        non-related field with its own ``dehydrate``, or a ``dehydrate_FOO``
+        method (other than the stock one for ``resource_uri``). The same goes
+        for resources that override ``dehydrate`` or ``full_dehydrate``.
+        Many-to-many & reverse relations need no column, so they're left out.
+        """
+        cls = self.__class__
+
+        if self._meta.object_class is None:
+            return None
+
+        if six.get_unbound_function(cls.dehydrate) is not six.get_unbound_function(Resource.dehydrate):
+            return None
+
+        if six.get_unbound_function(cls.full_dehydrate) is not six.get_unbound_function(BaseModelResource.full_dehydrate):
+            return None
 
-        if getattr(self._meta, 'queryset', None) is not None:
-            # Get the possible query terms from the current QuerySet.
-            query_terms = self._meta.queryset.query.query_terms
-        else:
-            query_terms = QUERY_TERMS
+        plain_dehydrates = (
+            six.get_unbound_function(fields.ApiField.dehydrate),
+            six.get_unbound_function(fields.TimeField.dehydrate),
+        )
+        stock_uri_method = six.get_unbound_function(Resource.dehydrate_resource_uri)
+        model_opts = self._meta.object_class._meta
+        columns = set([model_opts.pk.name, self._meta.detail_uri_name])
 
-        for filter_expr, value in filters.items():
-            filter_bits = filter_expr.split(LOOKUP_SEP)
-            field_name = filter_bits.pop(0)
-            filter_type = 'exact'
+        # Conditional requests read these off the object.
+        for validator_name in (self._meta.version_field, self._meta.last_modified_field):
+            if validator_name:
+                try:
+                    columns.add(model_opts.get_field(validator_name).name)
+                except FieldDoesNotExist:
+                    return None
 
-            if not field_name in self.fields:
-                # It's not a field we know about. Move along citizen.
+        for field_name in sparse_fields:
+            field_object = self.fields[field_name]
+            method = getattr(cls, "dehydrate_%s" % field_name, None)
+
+            if method is not None:
+                if field_name != 'resource_uri' or six.get_unbound_function(method) is not stock_uri_method:
+                    return None
+
+            if not getattr(field_object, 'is_related', False) and six.get_unbound_function(type(field_object).dehydrate) not in plain_dehydrates:
+                return None
+
+            attribute = field_object.attribute
+
+            if attribute is None or getattr(field_object, 'is_annotation', False):
+                # Annotations come with the query rather than a column.
                 continue
 
-            if len(filter_bits) and filter_bits[-1] in query_terms:
-                filter_type = filter_bits.pop()
+            if not isinstance(attribute, six.string_types):
+                return None
 
-            lookup_bits = self.check_filtering(field_name, filter_type, filter_bits)
-            value = self.filter_value_to_python(value, field_name, filters, filter_expr, filter_type)
+            attribute = attribute.split(LOOKUP_SEP)[0]
 
-            db_field_name = LOOKUP_SEP.join(lookup_bits)
-            qs_filter = "%s%s%s" % (db_field_name, LOOKUP_SEP, filter_type)
-            qs_filters[qs_filter] = value
+            try:
+                model_field = model_opts.get_field(attribute)
+            except FieldDoesNotExist:
+                # Reverse relations are looked up by the primary key.
+                if self._resolve_relation(self._meta.object_class, attribute)[0] is None:
+                    return None
 
-        return dict_strip_unicode_keys(qs_filters)
+                continue
 
-    def apply_sorting(self, obj_list, options=None):
-        """
-        Given a dictionary of options, apply some ORM-level sorting to the
-        provided ``QuerySet``.
+            if model_field in model_opts.many_to_many:
+                continue
 
-        Looks for the ``order_by`` key and handles either ascending (just the
-        field name) or descending (the field name with a ``-`` in front).
+            columns.add(attribute)
 
-        The field name should be the resource field, **NOT** model field.
+        return sorted(columns)
+
+    def apply_sparse_fields(self, obj_list, sparse_fields=None):
         """
-        if options is None:
-            options = {}
+        An ORM-specific implementation of ``apply_sparse_fields``.
 
-        parameter_name = 'order_by'
+        Loads only the columns from ``get_sparse_columns`` (plus any the
+        ``QuerySet`` already joins through ``select_related``) with
+        ``QuerySet.only``. Does nothing for ``ValuesQuerySet`` objects, which
+        pick their own columns.
+        """
+        if sparse_fields is None:
+            return obj_list
 
-        if not 'order_by' in options:
-            if not 'sort_by' in options:
-                # Nothing to alter the order. Return what we've got.
-                return obj_list
-            else:
-                warnings.warn("'sort_by' is a deprecated parameter. Please use 'order_by' instead.")
-                parameter_name = 'sort_by'
+        if not isinstance(obj_list, QuerySet) or isinstance(obj_list, ValuesQuerySet):
+            return obj_list
 
-        order_by_args = []
+        columns = self.get_sparse_columns(sparse_fields)
 
-        if hasattr(options, 'getlist'):
-            order_bits = options.getlist(parameter_name)
-        else:
-            order_bits = options.get(parameter_name)
+        if columns is None:
+            return obj_list
 
-            if not isinstance(order_bits, (list, tuple)):
-                order_bits = [order_bits]
+        select_related = obj_list.query.select_related
 
-        for order_by in order_bits:
-            order_by_bits = order_by.split(LOOKUP_SEP)
+        if select_related is True:
+            return obj_list
 
-            field_name = order_by_bits[0]
-            order = ''
+        if select_related:
+            columns = sorted(set(columns) | set(select_related.keys()))
 
-            if order_by_bits[0].startswith('-'):
-                field_name = order_by_bits[0][1:]
-                order = '-'
+        return obj_list.only(*columns)
 
-            if not field_name in self.fields:
-                # It's not a field we know about. Move along citizen.
-                raise InvalidSortError("No matching '%s' field for ordering on." % field_name)
+    def full_dehydrate(self, bundle, for_list=False):
+        """
+        Given a bundle with an object instance, extract the information from it
+        to populate the resource.
 
-            if not field_name in self._meta.ordering:
-                raise InvalidSortError("The '%s' field does not allow ordering." % field_name)
+        ``ValuesRow`` objects from ``apply_values`` have their column data
+        converted directly.
+        """
+        if not isinstance(bundle.obj, ValuesRow):
+            return super(BaseModelResource, self).full_dehydrate(bundle, for_list=for_list)
 
-            if self.fields[field_name].attribute is None:
-                raise InvalidSortError("The '%s' field has no 'attribute' for ordering with." % field_name)
+        row = bundle.obj
 
-            order_by_args.append("%s%s" % (order, LOOKUP_SEP.join([self.fields[field_name].attribute] + order_by_bits[1:])))
+        for field_name, field_object, use_in, method, column in self.get_values_plan(for_list=for_list, sparse_fields=bundle.sparse_fields):
+            if use_in is not None and not use_in(bundle):
+                continue
 
-        return obj_list.order_by(*order_by_args)
+            if column is None:
+                bundle.data[field_name] = field_object.dehydrate(bundle, for_list=for_list)
+            else:
+                value = row[column]
+
+                if value is None:
+                    if field_object.has_default():
+                        value = field_object.default
+                    elif not field_object.null:
+                        raise fields.ApiFieldError("The object '%r' has an empty attribute '%s' and doesn't allow a default or null value." % (row, column))
+
+                bundle.data[field_name] = field_object.convert(value)
+
+            if method is not None:
+                bundle.data[field_name] = method(bundle)
+
+        return self.dehydrate(bundle)
 
     def apply_filters(self, request, applicable_filters):
         """
@@ -2045,8 +3799,35 @@ class BaseModelResource(Resource):
         An ORM-specific implementation of ``get_object_list``.
 
         Returns a queryset that may have been limited by other overrides.
+
+        Annotates the aggregates from ``get_annotations``, if any, so that
+        the aggregate fields can be dehydrated, filtered & sorted on.
+        """
+        return self.apply_annotations(self._meta.queryset._clone())
+
+    def get_annotations(self):
+        """
+        Returns the aggregates of the resource's ``AggregateField`` fields,
+        keyed by the ``attribute`` they're annotated as.
+        """
+        annotations = {}
+
+        for field_object in self.fields.values():
+            if getattr(field_object, 'is_annotation', False):
+                annotations[field_object.attribute] = field_object.get_aggregate()
+
+        return annotations
+
+    def apply_annotations(self, obj_list):
+        """
+        Annotates the aggregates from ``get_annotations`` onto ``obj_list``.
         """
-        return self._meta.queryset._clone()
+        annotations = self.get_annotations()
+
+        if annotations:
+            obj_list = obj_list.annotate(**annotations)
+
+        return obj_list
 
     def obj_get_list(self, bundle, **kwargs):
         """
@@ -2076,10 +3857,15 @@ class BaseModelResource(Resource):
         A ORM-specific implementation of ``obj_get``.
 
         Takes optional ``kwargs``, which are used to narrow the query to find
-        the instance.
+        the instance. With ``bundle.sparse_fields``, only their columns are
+        loaded (see ``apply_sparse_fields``).
         """
         try:
             object_list = self.get_object_list(bundle.request).filter(**kwargs)
+            # Prefetched data would go stale across the write paths that
+            # share ``obj_get``, so only join the single-valued relations.
+            object_list = self.apply_query_plan(object_list, for_list=False, prefetch=False)
+            object_list = self.apply_sparse_fields(object_list, sparse_fields=bundle.sparse_fields)
             stringified_kwargs = ', '.join(["%s=%s" % (k, v) for k, v in kwargs.items()])
 
             if len(object_list) <= 0:
@@ -2093,6 +3879,133 @@ class BaseModelResource(Resource):
         except ValueError:
             raise NotFound("Invalid resource lookup data provided (mismatched type).")
 
+    def get_via_uris(self, uris, request=None):
+        """
+        A ORM-specific implementation of ``get_via_uris``.
+
+        URIs which identify their object by ``Meta.detail_uri_name`` alone
+        are looked up with a single ``__in`` query, which is checked with
+        ``authorized_read_list``. Any others go through ``get_via_uri``.
+
+        Like ``get_via_uri``, objects which exist but may not be read are
+        handled by ``unauthorized_result`` (rather than being reported as
+        missing), which takes a second query only if some weren't found.
+        """
+        detail_uri_name = self._meta.detail_uri_name
+        uri_identifiers = {}
+        other_uris = []
+
+        for uri in uris:
+            kwargs = self.get_uri_kwargs(uri)
+
+            if list(kwargs.keys()) == [detail_uri_name]:
+                uri_identifiers[uri] = kwargs[detail_uri_name]
+            else:
+                other_uris.append(uri)
+
+        identifier_values = self._detail_values(uri_identifiers.values())
+
+        if identifier_values is None:
+            return super(BaseModelResource, self).get_via_uris(uris, request=request)
+
+        objects = super(BaseModelResource, self).get_via_uris(other_uris, request=request)
+
+        if not uri_identifiers:
+            return objects
+
+        bundle = self.build_bundle(request=request)
+        object_list = self.get_object_list(request).filter(**{'%s__in' % detail_uri_name: set(identifier_values.values())})
+        found = self._index_by_detail_value(self.authorized_read_list(object_list, bundle))
+        missing = set()
+
+        for uri, identifier in uri_identifiers.items():
+            value = identifier_values[identifier]
+
+            if found.get(value) is not None:
+                objects[uri] = found[value]
+            elif value not in found:
+                missing.add(value)
+
+        if missing and object_list.filter(**{'%s__in' % detail_uri_name: missing}).exists():
+            self.unauthorized_result(Unauthorized("You are not allowed to access all of those objects."))
+
+        return objects
+
+    def obj_get_multiple(self, bundle, identifiers):
+        """
+        A ORM-specific implementation of ``obj_get_multiple``.
+
+        Fetches all the objects with a single ``__in`` query (plus the
+        related data from ``apply_query_plan``), then checks each of them
+        with ``authorized_read_detail``.
+        """
+        detail_uri_name = self._meta.detail_uri_name
+        identifier_values = self._detail_values(identifiers)
+
+        if identifier_values is None:
+            return super(BaseModelResource, self).obj_get_multiple(bundle, identifiers)
+
+        object_list = self.get_object_list(bundle.request).filter(**{'%s__in' % detail_uri_name: set(identifier_values.values())})
+        object_list = self.apply_query_plan(object_list, for_list=True, sparse_fields=bundle.sparse_fields, expand=bundle.expand)
+        object_list = self.apply_sparse_fields(object_list, sparse_fields=bundle.sparse_fields)
+        found = self._index_by_detail_value(object_list)
+        objects = {}
+
+        for identifier, value in identifier_values.items():
+            obj = found.get(value)
+
+            if obj is None:
+                continue
+
+            try:
+                self.authorized_read_detail(object_list, self.build_bundle(obj=obj, request=bundle.request))
+            except Unauthorized:
+                continue
+
+            objects[identifier] = obj
+
+        return objects
+
+    def _detail_values(self, identifiers):
+        """
+        Converts identifiers (as found in URLs) for ``Meta.detail_uri_name``
+        to the Python values of the model field.
+
+        Returns ``None`` if ``Meta.detail_uri_name`` isn't a model field.
+        """
+        detail_uri_name = self._meta.detail_uri_name
+        opts = self._meta.object_class._meta
+
+        try:
+            model_field = opts.pk if detail_uri_name == 'pk' else opts.get_field(detail_uri_name)
+        except FieldDoesNotExist:
+            return None
+
+        values = {}
+
+        for identifier in identifiers:
+            try:
+                values[identifier] = model_field.to_python(identifier)
+            except ValidationError:
+                raise NotFound("Invalid resource lookup data provided (mismatched type).")
+
+        return values
+
+    def _index_by_detail_value(self, objects):
+        """
+        Maps the ``Meta.detail_uri_name`` value of each of the objects to the
+        object.
+
+        Like ``obj_get``, values matching several objects map to ``None``.
+        """
+        found = {}
+
+        for obj in objects:
+            value = getattr(obj, self._meta.detail_uri_name)
+            found[value] = None if value in found else obj
+
+        return found
+
     def obj_create(self, bundle, **kwargs):
         """
         A ORM-specific implementation of ``obj_create``.
@@ -2103,7 +4016,186 @@ class BaseModelResource(Resource):
             setattr(bundle.obj, key, value)
 
         bundle = self.full_hydrate(bundle)
-        return self.save(bundle)
+        bundle = self.save(bundle)
+        self.bump_cache_generation('list')
+        return bundle
+
+    def obj_create_list(self, bundles, **kwargs):
+        """
+        A ORM-specific implementation of ``obj_create_list``.
+
+        With ``Meta.bulk_create = True``, every bundle is hydrated, validated
+        & authorized before anything is written, then the objects are saved
+        in a single transaction by ``bulk_save``.
+        """
+        if not self._meta.bulk_create:
+            return super(BaseModelResource, self).obj_create_list(bundles, **kwargs)
+
+        bundles = list(bundles)
+
+        for bundle in bundles:
+            bundle.obj = self._meta.object_class()
+
+            for key, value in kwargs.items():
+                setattr(bundle.obj, key, value)
+
+            bundle = self.full_hydrate(bundle)
+            self.is_valid(bundle)
+
+            if bundle.errors:
+                raise ImmediateHttpResponse(response=self.error_response(bundle.request, bundle.errors))
+
+        if bundles:
+            object_list = self.get_object_list(bundles[0].request)
+
+            for bundle in bundles:
+                self.authorized_create_detail(object_list, bundle)
+
+        with self.atomic():
+            self.bulk_save(bundles)
+
+        self.bump_cache_generation('list')
+        return bundles
+
+    def can_bulk_create(self, bundles):
+        """
+        Checks whether the (hydrated) bundles can be written by ``bulk_save``
+        using ``bulk_create``.
+
+        Multi-table inheritance isn't supported by ``bulk_create``. If the
+        primary keys are needed afterwards (for M2M data or
+        ``Meta.always_return_data``), they have to either be set already or
+        be returned by the database from the insert. M2M fields must point to
+        forward ``ManyToManyField`` relations without a custom ``through``
+        model.
+        """
+        model = self._meta.object_class
+        opts = model._meta
+
+        if opts.parents:
+            return False
+
+        m2m_fields = []
+
+        for field_name, field_object in self.fields.items():
+            if not getattr(field_object, 'is_m2m', False):
+                continue
+
+            if not field_object.attribute or field_object.readonly:
+                continue
+
+            if not isinstance(field_object.attribute, six.string_types):
+                return False
+
+            try:
+                model_field = opts.get_field(field_object.attribute)
+            except FieldDoesNotExist:
+                return False
+
+            # Only forward relations through an automatic table can be
+            # written row by row.
+            if not model_field in opts.many_to_many or not model_field.rel.through._meta.auto_created:
+                return False
+
+            m2m_fields.append(field_name)
+
+        needs_pks = self._meta.always_return_data or any(bundle.data.get(field_name) for bundle in bundles for field_name in m2m_fields)
+
+        if not needs_pks or all(bundle.obj.pk is not None for bundle in bundles):
+            return True
+
+        features = connections[router.db_for_write(model)].features
+        return getattr(features, 'can_return_rows_from_bulk_insert', getattr(features, 'can_return_ids_from_bulk_insert', False))
+
+    def bulk_save(self, bundles):
+        """
+        Saves the (hydrated, validated & authorized) bundles.
+
+        Objects are inserted with ``bulk_create``, in batches of
+        ``Meta.bulk_batch_size``, and M2M data with ``bulk_save_m2m``. Note
+        that neither ``Model.save`` nor the ``pre_save``/``post_save`` &
+        ``m2m_changed`` signals are called for them.
+
+        Falls back to saving each object in turn if ``can_bulk_create``
+        says the bundles can't be bulk inserted.
+        """
+        for bundle in bundles:
+            # Save FKs just in case.
+            self.save_related(bundle)
+
+        if not self.can_bulk_create(bundles):
+            for bundle in bundles:
+                bundle.obj.save()
+                bundle.objects_saved.add(self.create_identifier(bundle.obj))
+                m2m_bundle = self.hydrate_m2m(bundle)
+                self.save_m2m(m2m_bundle)
+
+            return bundles
+
+        model = self._meta.object_class
+        db = router.db_for_write(model)
+        model._default_manager.db_manager(db).bulk_create([bundle.obj for bundle in bundles], batch_size=self._meta.bulk_batch_size)
+
+        for bundle in bundles:
+            bundle.obj._state.adding = False
+            bundle.obj._state.db = db
+
+            if bundle.obj.pk is not None:
+                bundle.objects_saved.add(self.create_identifier(bundle.obj))
+
+            self.hydrate_m2m(bundle)
+
+        self.bulk_save_m2m(bundles)
+        return bundles
+
+    def bulk_save_m2m(self, bundles):
+        """
+        Handles the saving of related M2M data for many newly created
+        objects at once.
+
+        Rather than calling ``add`` for each object, the rows for the
+        intermediate tables are collected & written with ``bulk_create``.
+        """
+        opts = self._meta.object_class._meta
+
+        for field_name, field_object in self.fields.items():
+            if not getattr(field_object, 'is_m2m', False):
+                continue
+
+            if not field_object.attribute or field_object.readonly:
+                continue
+
+            model_field = opts.get_field(field_object.attribute)
+            through = model_field.rel.through
+            source_attname = through._meta.get_field(model_field.m2m_field_name()).attname
+            target_attname = through._meta.get_field(model_field.m2m_reverse_field_name()).attname
+            symmetrical = model_field.rel.symmetrical and model_field.rel.to == self._meta.object_class
+            pairs = set()
+
+            for bundle in bundles:
+                related_resource = field_object.get_related_resource(bundle.obj)
+
+                for related_bundle in bundle.data.get(field_name) or []:
+                    related_obj = related_bundle.obj
+
+                    #Only save related models if they're newly added.
+                    if related_obj._state.adding and not self.create_identifier(related_obj) in bundle.objects_saved:
+                        updated_related_bundle = related_resource.build_bundle(
+                            obj=related_obj,
+                            data=related_bundle.data,
+                            request=bundle.request,
+                            objects_saved=bundle.objects_saved
+                        )
+                        related_resource.save(updated_related_bundle)
+
+                    pairs.add((bundle.obj.pk, related_obj.pk))
+
+                    if symmetrical and bundle.obj.pk != related_obj.pk:
+                        pairs.add((related_obj.pk, bundle.obj.pk))
+
+            if pairs:
+                rows = [through(**{source_attname: source_pk, target_attname: target_pk}) for source_pk, target_pk in pairs]
+                through._default_manager.db_manager(router.db_for_write(through)).bulk_create(rows, batch_size=self._meta.bulk_batch_size)
 
     def lookup_kwargs_with_identifiers(self, bundle, kwargs):
         """
@@ -2162,8 +4254,11 @@ class BaseModelResource(Resource):
             except ObjectDoesNotExist:
                 raise NotFound("A model instance matching the provided arguments could not be found.")
 
+        identifier = getattr(bundle.obj, self._meta.detail_uri_name, None)
         bundle = self.full_hydrate(bundle)
-        return self.save(bundle, skip_errors=skip_errors)
+        bundle = self.save(bundle, skip_errors=skip_errors)
+        self.bump_object_cache_generations(identifier, getattr(bundle.obj, self._meta.detail_uri_name, None))
+        return bundle
 
     def obj_delete_list(self, bundle, **kwargs):
         """
@@ -2179,6 +4274,8 @@ class BaseModelResource(Resource):
             for authed_obj in deletable_objects:
                 authed_obj.delete()
 
+        self.bump_cache_generation()
+
     def obj_delete_list_for_update(self, bundle, **kwargs):
         """
         A ORM-specific implementation of ``obj_delete_list_for_update``.
@@ -2193,6 +4290,8 @@ class BaseModelResource(Resource):
             for authed_obj in deletable_objects:
                 authed_obj.delete()
 
+        self.bump_cache_generation()
+
     def obj_delete(self, bundle, **kwargs):
         """
         A ORM-specific implementation of ``obj_delete``.
@@ -2207,9 +4306,65 @@ class BaseModelResource(Resource):
                 raise NotFound("A model instance matching the provided arguments could not be found.")
 
         self.authorized_delete_detail(self.get_object_list(bundle.request), bundle)
+        identifier = getattr(bundle.obj, self._meta.detail_uri_name, None)
         bundle.obj.delete()
+        self.bump_object_cache_generations(identifier)
+
+    def obj_delete_many(self, bundles):
+        """
+        A ORM-specific implementation of ``obj_delete_many``.
+
+        The objects are checked with ``authorized_delete_list`` (all of them
+        must be allowed), then deleted with a single ``QuerySet.delete``, so
+        any custom ``Model.delete`` isn't called.
+        """
+        if not bundles:
+            return
+
+        pks = set([bundle.obj.pk for bundle in bundles])
+        objects_to_delete = self.get_object_list(bundles[0].request).filter(pk__in=pks)
+        deletable_objects = self.authorized_delete_list(objects_to_delete, bundles[0])
+
+        if len(deletable_objects) != len(pks):
+            self.unauthorized_result(Unauthorized("You are not allowed to delete all of those objects."))
+
+        objects_to_delete.delete()
+        self.bump_cache_generation()
+
+    @contextmanager
+    def atomic(self):
+        """
+        Runs a block in ``transaction.atomic``. The cache generations bumped
+        in it are bumped again once the outermost such block has committed,
+        since a concurrent request may have cached the old data under the
+        new generation in the meantime.
+        """
+        outermost = getattr(_atomic_blocks, 'cache_bumps', None) is None
+
+        if outermost:
+            _atomic_blocks.cache_bumps = set()
+
+        try:
+            with transaction.atomic():
+                yield
+
+            if outermost:
+                pending, _atomic_blocks.cache_bumps = _atomic_blocks.cache_bumps, None
+
+                for resource, args in pending:
+                    resource.bump_cache_generation(*args)
+        finally:
+            if outermost:
+                _atomic_blocks.cache_bumps = None
+
+    def writes_are_atomic(self):
+        """
+        A ORM-specific implementation of ``writes_are_atomic``.
+
+        ``True`` inside an ``atomic`` block.
+        """
+        return getattr(_atomic_blocks, 'cache_bumps', None) is not None
 
-    @transaction.atomic()
     def patch_list(self, request, **kwargs):
         """
         An ORM-specific implementation of ``patch_list``.
@@ -2217,7 +4372,22 @@ class BaseModelResource(Resource):
         Necessary because PATCH should be atomic (all-success or all-fail)
         and the only way to do this neatly is at the database level.
         """
-        return super(BaseModelResource, self).patch_list(request, **kwargs)
+        with self.atomic():
+            return super(BaseModelResource, self).patch_list(request, **kwargs)
+
+    def put_list(self, request, **kwargs):
+        """
+        An ORM-specific implementation of ``put_list``.
+
+        With ``Meta.bulk_create = True`` (or ``Meta.stream_deserialize =
+        True``), the removal of the old collection & the creation of the new
+        one happen in a single transaction.
+        """
+        if not self._meta.bulk_create and not self._meta.stream_deserialize:
+            return super(BaseModelResource, self).put_list(request, **kwargs)
+
+        with self.atomic():
+            return super(BaseModelResource, self).put_list(request, **kwargs)
 
     def rollback(self, bundles):
         """
@@ -2230,6 +4400,8 @@ class BaseModelResource(Resource):
             if bundle.obj and self.get_bundle_detail_data(bundle):
                 bundle.obj.delete()
 
+        self.bump_cache_generation('list')
+
     def create_identifier(self, obj):
         return u"%s.%s.%s" % (obj._meta.app_label, obj._meta.model_name, obj.pk)
 
@@ -2328,8 +4500,10 @@ class BaseModelResource(Resource):
         Due to the way Django works, the M2M data must be handled after the
         main instance, which is why this isn't a part of the main ``save`` bits.
 
-        Currently slightly inefficient in that it will clear out the whole
-        relation and recreate the related data as needed.
+        For many-to-many relations, the current related keys are read with
+        a single query & only the differences are removed/added. With
+        ``Meta.clear_m2m_on_save = True`` (& for other relations), the whole
+        relation is cleared out & the related data is added back.
         """
         for field_name, field_object in self.fields.items():
             if not getattr(field_object, 'is_m2m', False):
@@ -2346,27 +4520,13 @@ class BaseModelResource(Resource):
 
             if isinstance(field_object.attribute, six.string_types):
                 # Check for `__` in the field for looking through the relation.
-                attrs = field_object.attribute.split('__')
-                current_object = bundle.obj
-
-                for attr in attrs:
-                    previous_object = current_object
-                    current_object = getattr(current_object, attr)
-
-                related_mngr = current_object
+                related_mngr = field_object.get_attribute_accessor(strict=True)(bundle.obj)[0]
             elif callable(field_object.attribute):
                 related_mngr = field_object.attribute(bundle)
 
             if not related_mngr:
                 continue
 
-            if hasattr(related_mngr, 'clear'):
-                # FIXME: Dupe the original bundle, copy in the new object &
-                #        check the perms on that (using the related resource)?
-
-                # Clear it out, just to be safe.
-                related_mngr.clear()
-
             related_objs = []
 
             for related_bundle in bundle.data[field_name]:
@@ -2393,7 +4553,30 @@ class BaseModelResource(Resource):
                     related_resource.save(updated_related_bundle)
                 related_objs.append(updated_related_bundle.obj)
 
-            related_mngr.add(*related_objs)
+            if self._meta.clear_m2m_on_save or not hasattr(related_mngr, 'through'):
+                # FIXME: Dupe the original bundle, copy in the new object &
+                #        check the perms on that (using the related resource)?
+                if hasattr(related_mngr, 'clear'):
+                    # Clear it out, just to be safe.
+                    related_mngr.clear()
+
+                related_mngr.add(*related_objs)
+                continue
+
+            # Read the current keys straight from the intermediate table, so
+            # rows hidden by the related model's default manager count too.
+            through = related_mngr.through
+            target_attname = through._meta.get_field(related_mngr.target_field_name).attname
+            current_pks = set(through._default_manager.filter(**{related_mngr.source_field_name: related_mngr.instance}).values_list(target_attname, flat=True))
+            desired_pks = set(related_obj.pk for related_obj in related_objs)
+            removed_pks = current_pks - desired_pks
+            added_objs = [related_obj for related_obj in related_objs if not related_obj.pk in current_pks]
+
+            if removed_pks:
+                related_mngr.remove(*removed_pks)
+
+            if added_objs:
+                related_mngr.add(*added_objs)
 
     def detail_uri_kwargs(self, bundle_or_obj):
         """
@@ -1,12 +1,14 @@
 from __future__ import unicode_literals
+import codecs
 import datetime
+from io import BytesIO
+from itertools import chain
 import re
 import django
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.utils import six
+from django.utils import importlib, six
 from django.utils.encoding import force_text, smart_bytes
-from django.core.serializers import json as djangojson
 
 from tastypie.bundle import Bundle
 from tastypie.exceptions import BadRequest, UnsupportedFormat
@@ -15,8 +17,8 @@ from tastypie.utils import format_datetime, format_date, format_time, make_naive
 try:
     import defusedxml.lxml as lxml
     from defusedxml.common import DefusedXmlException
-    from defusedxml.lxml import parse as parse_xml
-    from lxml.etree import Element, tostring, LxmlError, XMLParser
+    from defusedxml.lxml import check_docinfo, parse as parse_xml
+    from lxml.etree import Element, tostring, iterparse, LxmlError, XMLParser, xmlfile
 except ImportError:
     lxml = None
 
@@ -31,9 +33,22 @@ try:
 except ImportError:
     biplist = None
 
+try:
+    import simplejson
+except ImportError:
+    simplejson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 import json
 
 
+# Types ``Serializer.to_simple`` returns untouched, checked on the exact type.
+SIMPLE_NATIVE_TYPES = frozenset((six.text_type, bool, float, type(None)) + six.integer_types)
+
 XML_ENCODING = re.compile('<\?xml.*?\?>', re.IGNORECASE)
 
 
@@ -65,6 +80,209 @@ if yaml is not None:
             Resolver.__init__(self)
 
 
+class JSONBackend(object):
+    """
+    Encodes & decodes JSON with the standard library's ``json`` module.
+
+    Backends that call ``default`` for the values they can't encode natively
+    set ``supports_default``, which lets ``Serializer.to_json`` skip the
+    ``to_simple`` pass over the whole structure.
+
+    ``separators`` are the ``(item, key)`` separators in the output, which
+    ``Serializer.stream_json`` matches.
+    """
+    available = True
+    supports_default = True
+    separators = (', ', ': ')
+
+    def dumps(self, data, default=None, sort_keys=True):
+        return json.dumps(data, default=default, sort_keys=sort_keys, ensure_ascii=False)
+
+    def loads(self, content):
+        return json.loads(content)
+
+
+class SimpleJSONBackend(JSONBackend):
+    """
+    Uses ``simplejson`` (& its C speedups), which produces the same output as
+    the standard library.
+    """
+    available = simplejson is not None
+
+    def dumps(self, data, default=None, sort_keys=True):
+        # Leave ``Decimal`` & namedtuples to ``default``/``to_simple``, like
+        # the standard library does.
+        return simplejson.dumps(data, default=default, sort_keys=sort_keys, ensure_ascii=False, use_decimal=False, namedtuple_as_object=False)
+
+    def loads(self, content):
+        # Decoding text makes sure strings come back as text on Python 2.
+        return simplejson.loads(force_text(content))
+
+
+class UJSONBackend(JSONBackend):
+    """
+    Uses ``ujson``, the fastest of the lot.
+
+    The output is compact (no spaces after separators), so it isn't
+    byte-for-byte the same as the standard library's. ``ujson`` has no
+    ``default`` hook, so the data goes through ``to_simple`` first.
+    """
+    available = ujson is not None
+    supports_default = False
+    separators = (',', ':')
+
+    def dumps(self, data, default=None, sort_keys=True):
+        return ujson.dumps(data, sort_keys=sort_keys, ensure_ascii=False, escape_forward_slashes=False)
+
+    def loads(self, content):
+        return ujson.loads(content)
+
+
+JSON_BACKENDS = {
+    'json': JSONBackend,
+    'simplejson': SimpleJSONBackend,
+    'ujson': UJSONBackend,
+}
+
+
+def get_json_backend(backend):
+    """
+    Returns a JSON backend instance, given either an instance, one of the
+    names in ``JSON_BACKENDS`` or the dotted path to a backend class.
+    """
+    if not isinstance(backend, six.string_types):
+        return backend
+
+    if backend in JSON_BACKENDS:
+        backend_class = JSON_BACKENDS[backend]
+    else:
+        try:
+            module_path, class_name = backend.rsplit('.', 1)
+            backend_class = getattr(importlib.import_module(module_path), class_name)
+        except (ValueError, ImportError, AttributeError):
+            raise ImproperlyConfigured("JSON backend '%s' not found. Please use one of %s or the path to a backend class." % (backend, ', '.join(sorted(JSON_BACKENDS))))
+
+    if not getattr(backend_class, 'available', True):
+        raise ImproperlyConfigured("JSON backend '%s' requires a library that isn't installed." % backend)
+
+    return backend_class()
+
+
+class IncrementalJSONReader(object):
+    """
+    Reads JSON values off a file-like ``stream`` of UTF-8 bytes (or text), a
+    chunk at a time, so the document never needs to be in memory at once.
+
+    Each value is decoded with the standard library's ``raw_decode`` once
+    enough of it has been read.
+    """
+    whitespace = ' \t\n\r'
+    number_start = '-0123456789'
+    number_characters = '+-.0123456789eE'
+
+    def __init__(self, stream, chunk_size=64 * 1024):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.finished = False
+
+    def read_chunk(self):
+        """
+        Adds the next chunk of the stream to the buffer (dropping what's
+        already been read). Returns ``False`` at the end of the stream.
+        """
+        if self.finished:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+
+        if not chunk:
+            self.finished = True
+
+        if isinstance(chunk, six.binary_type):
+            # Part of a character may be held back until the next chunk.
+            chunk = self.text_decoder.decode(chunk, final=self.finished)
+
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return not self.finished
+
+    def peek(self):
+        """
+        Skips any whitespace & returns the next character, or ``''`` at the
+        end of the stream.
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in self.whitespace:
+                self.position += 1
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.read_chunk():
+                return ''
+
+    def expect(self, characters):
+        """
+        Reads the next character, which has to be one of ``characters``.
+        """
+        character = self.peek()
+
+        if not character or character not in characters:
+            raise BadRequest("Invalid JSON data sent.")
+
+        self.position += 1
+        return character
+
+    def expect_end(self):
+        """
+        Checks there's nothing but whitespace left in the stream.
+        """
+        if self.peek():
+            raise BadRequest("Invalid JSON data sent.")
+
+    def read_value(self):
+        """
+        Reads & decodes the next whole JSON value.
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                if self.read_chunk():
+                    continue
+
+                raise BadRequest("Invalid JSON data sent.")
+
+            # A number at the end of the buffer (or a prefix of one, like
+            # ``1.5`` of ``1.5e3``) might carry on in the next chunk.
+            if end == len(self.buffer) or (self.buffer[self.position] in self.number_start and self.buffer[end] in self.number_characters):
+                if self.read_chunk():
+                    continue
+
+            self.position = end
+            return value
+
+    def iter_array(self):
+        """
+        Yields the items of an array, whose ``[`` has already been read.
+        """
+        if self.peek() == ']':
+            self.position += 1
+            return
+
+        while True:
+            yield self.read_value()
+
+            if self.expect(',]') == ']':
+                return
+
+
 class Serializer(object):
     """
     A swappable class for serialization.
@@ -85,20 +303,50 @@ class Serializer(object):
 
     formats = ['json', 'xml', 'yaml', 'html', 'plist']
 
+    # Maps types (& their subclasses) to the method ``to_simple`` hands them
+    # to. Subclasses can extend it to simplify other types.
+    simple_handlers = dict.fromkeys(six.integer_types + (bool, float, type(None)), '_simple_native')
+    simple_handlers.update({
+        list: '_simple_list',
+        tuple: '_simple_list',
+        dict: '_simple_dict',
+        Bundle: '_simple_bundle',
+        datetime.datetime: '_simple_datetime',
+        datetime.date: '_simple_date',
+        datetime.time: '_simple_time',
+    })
+
     content_types = {'json': 'application/json',
                      'jsonp': 'text/javascript',
                      'xml': 'application/xml',
                      'yaml': 'text/yaml',
                      'html': 'text/html',
-                     'plist': 'application/x-plist'}
+                     'plist': 'application/x-plist',
+                     'ndjson': 'application/x-ndjson'}
 
-    def __init__(self, formats=None, content_types=None, datetime_formatting=None):
+    def __init__(self, formats=None, content_types=None, datetime_formatting=None, json_backend=None, json_sort_keys=None, xml_sort_elements=None):
         if datetime_formatting is not None:
             self.datetime_formatting = datetime_formatting
         else:
             self.datetime_formatting = getattr(settings, 'TASTYPIE_DATETIME_FORMATTING', 'iso-8601')
 
+        if json_backend is None:
+            json_backend = getattr(settings, 'TASTYPIE_JSON_BACKEND', 'json')
+
+        self.json_backend = get_json_backend(json_backend)
+
+        if json_sort_keys is not None:
+            self.json_sort_keys = json_sort_keys
+        else:
+            self.json_sort_keys = getattr(settings, 'TASTYPIE_JSON_SORT_KEYS', True)
+
+        if xml_sort_elements is not None:
+            self.xml_sort_elements = xml_sort_elements
+        else:
+            self.xml_sort_elements = getattr(settings, 'TASTYPIE_XML_SORT_ELEMENTS', True)
+
         self.supported_formats = []
+        self._simple_handler_cache = {}
 
         if content_types is not None:
             self.content_types = content_types
@@ -120,6 +368,8 @@ class Serializer(object):
             except KeyError:
                 raise ImproperlyConfigured("Content type for specified type '%s' not found. Please provide it at either the class level or via the arguments." % format)
 
+        self.format_methods = self.build_format_methods()
+
     def get_mime_for_format(self, format):
         """
         Given a format, attempts to determine the correct MIME type.
@@ -181,41 +431,86 @@ class Serializer(object):
 
         return data.isoformat()
 
+    def build_format_methods(self):
+        """
+        Maps each ``(prefix, MIME type)`` pair to the name of the method that
+        handles it (like ``('to', 'application/json')`` to ``to_json``), for
+        the ``to``, ``from``, ``stream`` & ``stream_from`` methods available.
+
+        Names rather than bound methods are kept, so later overrides still
+        apply.
+        """
+        format_methods = {}
+
+        for short_format, long_format in self.content_types.items():
+            for prefix in ('to', 'from', 'stream', 'stream_from'):
+                method_name = "%s_%s" % (prefix, short_format)
+
+                if hasattr(self, method_name):
+                    format_methods.setdefault((prefix, long_format), method_name)
+
+        return format_methods
+
+    def get_format_method(self, prefix, format):
+        """
+        Returns the name of the ``prefix`` method (``to``, ``from``, ``stream``
+        or ``stream_from``) for the ``format`` MIME type, or ``None``.
+        """
+        return self.format_methods.get((prefix, format))
+
     def serialize(self, bundle, format='application/json', options=None):
         """
         Given some data and a format, calls the correct method to serialize
         the data and returns the result.
         """
-        desired_format = None
         if options is None:
             options = {}
 
-        for short_format, long_format in self.content_types.items():
-            if format == long_format:
-                if hasattr(self, "to_%s" % short_format):
-                    desired_format = short_format
-                    break
+        desired_format = self.get_format_method('to', format)
 
         if desired_format is None:
             raise UnsupportedFormat("The format indicated '%s' had no available serialization method. Please check your ``formats`` and ``content_types`` on your Serializer." % format)
 
-        serialized = getattr(self, "to_%s" % desired_format)(bundle, options)
+        serialized = getattr(self, desired_format)(bundle, options)
         return serialized
 
+    def can_stream(self, format):
+        """
+        Returns whether the given format can be serialized a piece at a time
+        by ``serialize_stream``.
+        """
+        return self.get_format_method('stream', format) is not None
+
+    def serialize_stream(self, data, format='application/json', options=None):
+        """
+        Given some data and a format, calls the correct method to serialize
+        the data a piece at a time & returns an iterator of the serialized
+        chunks.
+
+        Any iterators found at the top level of a ``dict`` are only consumed
+        as the output is written, so the whole collection never needs to be
+        in memory.
+        """
+        if options is None:
+            options = {}
+
+        desired_format = self.get_format_method('stream', format)
+
+        if desired_format is None:
+            raise UnsupportedFormat("The format indicated '%s' had no available streaming serialization method. Please check your ``formats`` and ``content_types`` on your Serializer." % format)
+
+        return getattr(self, desired_format)(data, options)
+
+    def _is_stream(self, value):
+        return not isinstance(value, (list, tuple, dict, six.string_types)) and hasattr(value, '__iter__') and iter(value) is value
+
     def deserialize(self, content, format='application/json'):
         """
         Given some data and a format, calls the correct method to deserialize
         the data and returns the result.
         """
-        desired_format = None
-
         format = format.split(';')[0]
-
-        for short_format, long_format in self.content_types.items():
-            if format == long_format:
-                if hasattr(self, "from_%s" % short_format):
-                    desired_format = short_format
-                    break
+        desired_format = self.get_format_method('from', format)
 
         if desired_format is None:
             raise UnsupportedFormat("The format indicated '%s' had no available deserialization method. Please check your ``formats`` and ``content_types`` on your Serializer." % format)
@@ -223,9 +518,36 @@ class Serializer(object):
         if isinstance(content, six.binary_type):
             content = force_text(content)
 
-        deserialized = getattr(self, "from_%s" % desired_format)(content)
+        deserialized = getattr(self, desired_format)(content)
         return deserialized
 
+    def can_deserialize_stream(self, format):
+        """
+        Returns whether the given format can be deserialized a piece at a time
+        by ``deserialize_stream``.
+        """
+        format = format.split(';')[0]
+        return self.get_format_method('stream_from', format) is not None
+
+    def deserialize_stream(self, stream, format='application/json'):
+        """
+        Given a file-like ``stream`` of data and a format, calls the correct
+        method to deserialize the data a piece at a time.
+
+        The data has to be a ``dict`` (an object/hash). Returns an iterator of
+        its ``(key, value)`` pairs, in the order they're sent. Lists are
+        handed over as iterators of their items, which are only read as
+        they're consumed. Whatever's left of them is skipped on to the next
+        pair.
+        """
+        format = format.split(';')[0]
+        desired_format = self.get_format_method('stream_from', format)
+
+        if desired_format is None:
+            raise UnsupportedFormat("The format indicated '%s' had no available streaming deserialization method. Please check your ``formats`` and ``content_types`` on your Serializer." % format)
+
+        return getattr(self, desired_format)(stream)
+
     def to_simple(self, data, options):
         """
         For a piece of data, attempts to recognize it and provide a simplified
@@ -233,40 +555,77 @@ class Serializer(object):
 
         This brings complex Python data structures down to native types of the
         serialization format(s).
+
+        Text, numbers, booleans & ``None`` are returned as they are. Anything
+        else is handled by the method that ``get_simple_handler`` picks for
+        its type, which is cached per type.
         """
-        if isinstance(data, (list, tuple)):
-            return [self.to_simple(item, options) for item in data]
-        if isinstance(data, dict):
-            return dict((key, self.to_simple(val, options)) for (key, val) in data.items())
-        elif isinstance(data, Bundle):
-            return dict((key, self.to_simple(val, options)) for (key, val) in data.data.items())
-        elif hasattr(data, 'dehydrated_type'):
-            if getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == False:
-                if data.full:
-                    return self.to_simple(data.fk_resource, options)
-                else:
-                    return self.to_simple(data.value, options)
-            elif getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == True:
-                if data.full:
-                    return [self.to_simple(bundle, options) for bundle in data.m2m_bundles]
-                else:
-                    return [self.to_simple(val, options) for val in data.value]
+        data_type = type(data)
+
+        if data_type in SIMPLE_NATIVE_TYPES:
+            return data
+
+        try:
+            handler = self._simple_handler_cache[data_type]
+        except KeyError:
+            handler = self._simple_handler_cache[data_type] = self.get_simple_handler(data_type)
+
+        return handler(data, options)
+
+    def get_simple_handler(self, data_type):
+        """
+        Returns the method ``to_simple`` uses for values of ``data_type``.
+
+        Fields (anything with a ``dehydrated_type``) come first. Otherwise,
+        the type's MRO is looked up in ``simple_handlers``, falling back to
+        converting the value to text.
+        """
+        if hasattr(data_type, 'dehydrated_type') and not issubclass(data_type, (list, tuple, dict, Bundle)):
+            return self._simple_field
+
+        for klass in data_type.__mro__:
+            if klass in self.simple_handlers:
+                return getattr(self, self.simple_handlers[klass])
+
+        return self._simple_text
+
+    def _simple_list(self, data, options):
+        return [self.to_simple(item, options) for item in data]
+
+    def _simple_dict(self, data, options):
+        return dict((key, self.to_simple(val, options)) for (key, val) in data.items())
+
+    def _simple_bundle(self, data, options):
+        return self._simple_dict(data.data, options)
+
+    def _simple_field(self, data, options):
+        if getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == False:
+            if data.full:
+                return self.to_simple(data.fk_resource, options)
             else:
                 return self.to_simple(data.value, options)
-        elif isinstance(data, datetime.datetime):
-            return self.format_datetime(data)
-        elif isinstance(data, datetime.date):
-            return self.format_date(data)
-        elif isinstance(data, datetime.time):
-            return self.format_time(data)
-        elif isinstance(data, bool):
-            return data
-        elif isinstance(data, (six.integer_types, float)):
-            return data
-        elif data is None:
-            return None
+        elif getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == True:
+            if data.full:
+                return [self.to_simple(bundle, options) for bundle in data.m2m_bundles]
+            else:
+                return [self.to_simple(val, options) for val in data.value]
         else:
-            return force_text(data)
+            return self.to_simple(data.value, options)
+
+    def _simple_datetime(self, data, options):
+        return self.format_datetime(data)
+
+    def _simple_date(self, data, options):
+        return self.format_date(data)
+
+    def _simple_time(self, data, options):
+        return self.format_time(data)
+
+    def _simple_native(self, data, options):
+        return data
+
+    def _simple_text(self, data, options):
+        return force_text(data)
 
     def to_etree(self, data, options=None, name=None, depth=0):
         """
@@ -282,7 +641,7 @@ class Serializer(object):
                 element = Element('objects')
             for item in data:
                 element.append(self.to_etree(item, options, depth=depth+1))
-                element[:] = sorted(element, key=lambda x: x.tag)
+            self.sort_elements(element)
         elif isinstance(data, dict):
             if depth == 0:
                 element = Element(name or 'response')
@@ -291,12 +650,12 @@ class Serializer(object):
                 element.set('type', 'hash')
             for (key, value) in data.items():
                 element.append(self.to_etree(value, options, name=key, depth=depth+1))
-                element[:] = sorted(element, key=lambda x: x.tag)
+            self.sort_elements(element)
         elif isinstance(data, Bundle):
             element = Element(name or 'object')
             for field_name, field_object in data.data.items():
                 element.append(self.to_etree(field_object, options, name=field_name, depth=depth+1))
-                element[:] = sorted(element, key=lambda x: x.tag)
+            self.sort_elements(element)
         elif hasattr(data, 'dehydrated_type'):
             if getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == False:
                 if data.full:
@@ -330,6 +689,14 @@ class Serializer(object):
 
         return element
 
+    def sort_elements(self, element):
+        """
+        Sorts the children of ``element`` by tag (keeping the order of equal
+        tags), unless ``xml_sort_elements`` is off.
+        """
+        if self.xml_sort_elements:
+            element[:] = sorted(element, key=lambda x: x.tag)
+
     def from_etree(self, data):
         """
         Not the smartest deserializer on the planet. At the request level,
@@ -367,21 +734,176 @@ class Serializer(object):
     def to_json(self, data, options=None):
         """
         Given some Python data, produces JSON output.
+
+        If the ``json_backend`` supports a ``default`` hook (& ``to_simple``
+        isn't overridden), only the values it can't encode natively go
+        through ``json_default``, rather than the whole structure through
+        ``to_simple`` up front.
         """
         options = options or {}
+        backend = self.json_backend
+
+        if backend.supports_default and six.get_unbound_function(type(self).to_simple) is six.get_unbound_function(Serializer.to_simple):
+            return backend.dumps(data, default=lambda value: self.json_default(value, options), sort_keys=self.json_sort_keys)
+
         data = self.to_simple(data, options)
+        return backend.dumps(data, sort_keys=self.json_sort_keys)
+
+    def json_default(self, data, options):
+        """
+        The ``default`` hook ``to_json`` hands the ``json_backend``, for the
+        values it can't encode natively.
+
+        Only converts the value itself, leaving the encoder to recurse into
+        what it holds: a ``Bundle`` becomes its ``data`` & a field its value.
+        Anything else (dates, times, ``Decimal``, ...) goes through
+        ``to_simple``.
+        """
+        if isinstance(data, Bundle):
+            return data.data
+
+        if getattr(data, 'dehydrated_type', None) is not None and not isinstance(data, (list, tuple, dict)):
+            if data.dehydrated_type == 'related' and data.full:
+                return data.m2m_bundles if data.is_m2m else data.fk_resource
 
-        return djangojson.json.dumps(data, cls=djangojson.DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+            return data.value
+
+        return self.to_simple(data, options)
 
     def from_json(self, content):
         """
         Given some JSON data, returns a Python dictionary of the decoded data.
         """
         try:
-            return json.loads(content)
+            return self.json_backend.loads(content)
         except ValueError:
             raise BadRequest
 
+    def stream_from_json(self, stream):
+        """
+        Given a file-like ``stream`` of a JSON object, yields its
+        ``(key, value)`` pairs a piece at a time, with arrays as iterators
+        of their items. See ``deserialize_stream``.
+
+        Always decodes with the standard library, whatever the
+        ``json_backend``.
+        """
+        reader = IncrementalJSONReader(stream)
+        reader.expect('{')
+
+        if reader.peek() == '}':
+            reader.position += 1
+            reader.expect_end()
+            return
+
+        while True:
+            key = reader.read_value()
+
+            if not isinstance(key, six.string_types):
+                raise BadRequest("Invalid JSON data sent.")
+
+            reader.expect(':')
+
+            if reader.peek() == '[':
+                reader.position += 1
+                items = reader.iter_array()
+                yield key, items
+
+                # Skip whatever wasn't consumed.
+                for item in items:
+                    pass
+            else:
+                yield key, reader.read_value()
+
+            if reader.expect(',}') == '}':
+                reader.expect_end()
+                return
+
+    def stream_json(self, data, options=None):
+        """
+        Given some Python data, produces JSON output a piece at a time.
+
+        The output matches ``to_json`` (using the ``separators`` of the
+        ``json_backend`` & ``json_sort_keys``), with iterators at the top
+        level of a ``dict`` written out as arrays.
+        """
+        options = options or {}
+
+        if not isinstance(data, dict):
+            yield self.to_json(data, options)
+            return
+
+        item_separator, key_separator = getattr(self.json_backend, 'separators', JSONBackend.separators)
+        keys = sorted(data.keys()) if self.json_sort_keys else data.keys()
+        yield '{'
+
+        for i, key in enumerate(keys):
+            value = data[key]
+
+            if i:
+                yield item_separator
+
+            yield self.to_json(key, options) + key_separator
+
+            if not self._is_stream(value):
+                yield self.to_json(value, options)
+                continue
+
+            yield '['
+
+            for j, item in enumerate(value):
+                if j:
+                    yield item_separator
+
+                yield self.to_json(item, options)
+
+            yield ']'
+
+        yield '}'
+
+    def to_ndjson(self, data, options=None):
+        """
+        Given some Python data, produces newline-delimited JSON output.
+
+        Lists have one item per line. Anything else is a single line.
+        """
+        options = options or {}
+
+        if isinstance(data, (list, tuple)):
+            return ''.join('%s\n' % self.to_json(item, options) for item in data)
+
+        return '%s\n' % self.to_json(data, options)
+
+    def stream_ndjson(self, data, options=None):
+        """
+        Given some Python data, produces newline-delimited JSON output a
+        piece at a time.
+
+        For a ``dict`` holding iterators at the top level (like a list
+        response), the first line holds the rest of the ``dict`` (i.e. the
+        ``meta``) & each item from the iterators follows on its own line.
+        """
+        options = options or {}
+
+        if not isinstance(data, dict):
+            yield self.to_ndjson(data, options)
+            return
+
+        streams = []
+        header = {}
+
+        for key in sorted(data.keys()):
+            if self._is_stream(data[key]):
+                streams.append(data[key])
+            else:
+                header[key] = data[key]
+
+        yield '%s\n' % self.to_json(header, options)
+
+        for stream in streams:
+            for item in stream:
+                yield '%s\n' % self.to_json(item, options)
+
     def to_jsonp(self, data, options=None):
         """
         Given some Python data, produces JSON output wrapped in the provided
@@ -406,7 +928,68 @@ class Serializer(object):
         if lxml is None:
             raise ImproperlyConfigured("Usage of the XML aspects requires lxml and defusedxml.")
 
-        return tostring(self.to_etree(data, options), xml_declaration=True, encoding='utf-8')
+        return b''.join(self.stream_xml(data, options))
+
+    def stream_xml(self, data, options=None):
+        """
+        Given some Python data, produces XML output a piece at a time.
+
+        The children of a top-level ``dict`` are built & written out one at a
+        time (with lxml's incremental ``xmlfile``), rather than as a whole
+        tree. Iterators among them are written out as lists, an item at a
+        time & in the order they come.
+        """
+        options = options or {}
+
+        if lxml is None:
+            raise ImproperlyConfigured("Usage of the XML aspects requires lxml and defusedxml.")
+
+        if not isinstance(data, dict) or not data:
+            yield tostring(self.to_etree(data, options), xml_declaration=True, encoding='utf-8')
+            return
+
+        keys = list(data.keys())
+
+        if self.xml_sort_elements:
+            keys.sort()
+
+        output = BytesIO()
+
+        def flush():
+            chunk = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return chunk
+
+        with xmlfile(output, encoding='utf-8') as xf:
+            xf.write_declaration()
+
+            with xf.element('response'):
+                for key in keys:
+                    value = data[key]
+
+                    if not self._is_stream(value):
+                        xf.write(self.to_etree(value, options, name=key, depth=1))
+                        xf.flush()
+                        yield flush()
+                        continue
+
+                    items = iter(value)
+
+                    try:
+                        first = next(items)
+                    except StopIteration:
+                        # Empty lists self-close, as they do in ``to_etree``.
+                        xf.write(Element(key, type='list'))
+                        continue
+
+                    with xf.element(key, type='list'):
+                        for item in chain([first], items):
+                            xf.write(self.to_etree(item, options, depth=2))
+                            xf.flush()
+                            yield flush()
+
+        yield flush()
 
     def from_xml(self, content, forbid_dtd=True, forbid_entities=True):
         """
@@ -433,6 +1016,80 @@ class Serializer(object):
 
         return self.from_etree(parsed.getroot())
 
+    def stream_from_xml(self, stream, forbid_dtd=True, forbid_entities=True):
+        """
+        Given a file-like ``stream`` of an XML document, yields the
+        ``(tag, value)`` pairs of the root's children a piece at a time. See
+        ``deserialize_stream``.
+
+        The root has to deserialize to a ``dict`` in ``from_etree``. Children
+        that are lists are handed over as iterators of their items, each one
+        deserialized with ``from_etree`` & dropped from the tree once read.
+
+        The document is read with ``iterparse``, which ``defusedxml`` can't
+        wrap, so entities are never resolved & the network is never used.
+        Like ``from_xml``, DTDs & entity declarations raise ``BadRequest``
+        by default.
+        """
+        if lxml is None:
+            raise ImproperlyConfigured("Usage of the XML aspects requires lxml and defusedxml.")
+
+        events = self._iterparse_xml(stream, forbid_dtd, forbid_entities)
+        root = next(events, (None, None))[1]
+
+        if root is None or not (root.tag in ('object', 'request') or root.get('type') == 'hash'):
+            raise BadRequest("Invalid XML data sent.")
+
+        for event, element in events:
+            if element is root:
+                return
+
+            if root.tag == 'request' and element.tag in ('object', 'objects'):
+                # ``from_etree`` would only return this element, not a dict.
+                raise BadRequest("Invalid XML data sent.")
+
+            if element.tag == 'objects' or element.get('type') == 'list':
+                items = self._iter_xml_items(events, element)
+                yield element.tag, items
+
+                # Skip whatever wasn't consumed.
+                for item in items:
+                    pass
+            else:
+                self._skip_xml_element(events, element)
+                yield element.tag, self.from_etree(element)
+
+            element.clear()
+            root.remove(element)
+
+    def _iterparse_xml(self, stream, forbid_dtd, forbid_entities):
+        checked = False
+
+        try:
+            for event, element in iterparse(stream, events=('start', 'end'), resolve_entities=False, no_network=True):
+                if not checked:
+                    check_docinfo(element.getroottree(), forbid_dtd=forbid_dtd, forbid_entities=forbid_entities)
+                    checked = True
+
+                yield event, element
+        except (LxmlError, DefusedXmlException):
+            raise BadRequest()
+
+    def _skip_xml_element(self, events, element):
+        for event, current in events:
+            if event == 'end' and current is element:
+                return
+
+    def _iter_xml_items(self, events, parent):
+        for event, element in events:
+            if element is parent:
+                return
+
+            self._skip_xml_element(events, element)
+            yield self.from_etree(element)
+            element.clear()
+            parent.remove(element)
+
     def to_yaml(self, data, options=None):
         """
         Given some Python data, produces YAML output.
@@ -1,6 +1,14 @@
+import threading
+
 from django.utils.encoding import smart_bytes
 from django.utils import six
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Python 2.6.
+    from django.utils.datastructures import SortedDict as OrderedDict
+
 
 def dict_strip_unicode_keys(uni_dict):
     """
@@ -17,3 +25,44 @@ def dict_strip_unicode_keys(uni_dict):
         data[smart_bytes(key)] = value
 
     return data
+
+
+class LRUCache(object):
+    """
+    A small in-process cache holding at most ``max_size`` items, which drops
+    the least recently used item when it's full.
+
+    Safe to share between threads.
+    """
+    def __init__(self, max_size=100):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+
+            # Move it to the most recently used end.
+            self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+
+            while len(self._data) > self.max_size:
+                # The least recently used is first (``SortedDict`` has no
+                # ``popitem(last=False)``).
+                del self._data[next(iter(self._data))]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -3,12 +3,45 @@ from __future__ import unicode_literals
 import mimeparse
 
 from tastypie.exceptions import BadRequest
+from tastypie.utils.dict import LRUCache
+
+
+# How many negotiated formats are remembered per ``Serializer``.
+FORMAT_CACHE_SIZE = 100
 
 
 def determine_format(request, serializer, default_format='application/json'):
     """
     Tries to "smartly" determine which output format is desired.
 
+    Clients tend to send the same few ``Accept`` headers, so the result is
+    cached on the ``serializer`` (see ``FORMAT_CACHE_SIZE``), keyed on the
+    ``format`` & ``callback`` parameters, the ``Accept`` header & the
+    ``default_format``.
+
+    NOTE: callers *must* be prepared to handle BadRequest exceptions due to
+          malformed HTTP request headers!
+    """
+    key = (request.GET.get('format'), 'callback' in request.GET, request.META.get('HTTP_ACCEPT', '*/*'), default_format)
+    cache = getattr(serializer, '_format_cache', None)
+
+    if cache is None:
+        cache = serializer._format_cache = LRUCache(FORMAT_CACHE_SIZE)
+
+    desired_format = cache.get(key)
+
+    if desired_format is None:
+        desired_format = negotiate_format(request, serializer, default_format=default_format)
+        cache.set(key, desired_format)
+
+    return desired_format
+
+
+def negotiate_format(request, serializer, default_format='application/json'):
+    """
+    Works out which output format is desired, without any caching. See
+    ``determine_format``.
+
     First attempts to find a ``format`` override from the request and supplies
     that if found.
 
@@ -1,3 +1,4 @@
+from django.conf.urls import url
 from django.contrib.auth.models import User
 from tastypie.cache import SimpleCache
 from tastypie import fields
@@ -64,6 +65,19 @@ class SlugBasedNoteResource(ModelResource):
         authorization = Authorization()
 
 
+class RestrictedSlugBasedNoteResource(ModelResource):
+    class Meta:
+        queryset = SlugBasedNote.objects.all()
+        resource_name = 'restrictedslugbased'
+        detail_uri_name = 'slug'
+
+    def base_urls(self):
+        return [
+            url(r"^(?P<resource_name>%s)/$" % self._meta.resource_name, self.wrap_view('dispatch_list'), name="api_dispatch_list"),
+            url(r"^(?P<resource_name>%s)/(?P<slug>[\w-]+)/$" % self._meta.resource_name, self.wrap_view('dispatch_detail'), name="api_dispatch_detail"),
+        ]
+
+
 class SessionUserResource(ModelResource):
     class Meta:
         resource_name = 'sessionusers'
@@ -1,10 +1,12 @@
 from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse, set_script_prefix
 from django.http import HttpRequest
 from django.test import TestCase
+from mock import patch
 from tastypie.bundle import Bundle
 from tastypie.fields import ToOneField, ToManyField
 from tastypie.resources import ModelResource
-from basic.api.resources import SlugBasedNoteResource
+from basic.api.resources import SlugBasedNoteResource, RestrictedSlugBasedNoteResource, NoteResource as RegisteredNoteResource
 from basic.models import Note, AnnotatedNote, SlugBasedNote
 
 
@@ -186,3 +188,55 @@ class SlugBasedResourceTestCase(TestCase):
         # Make sure it's gone.
         self.assertRaises(SlugBasedNote.DoesNotExist, SlugBasedNote.objects.get, pk='first-post')
 
+
+class URITemplateTestCase(TestCase):
+    def setUp(self):
+        super(URITemplateTestCase, self).setUp()
+        self.note = Note.objects.get(pk=1)
+        self.slug_note = SlugBasedNote.objects.get(pk='first-post')
+
+    def test_matches_reverse(self):
+        list_uri = reverse('api_dispatch_list', kwargs={'api_name': 'v1', 'resource_name': 'notes'})
+        detail_uri = reverse('api_dispatch_detail', kwargs={'api_name': 'v1', 'resource_name': 'notes', 'pk': 1})
+
+        resource = RegisteredNoteResource()
+        self.assertEqual(resource.get_resource_uri(), list_uri)
+        self.assertEqual(resource.get_resource_uri(self.note), detail_uri)
+
+        bundle = resource.build_bundle(obj=self.note)
+        self.assertEqual(resource.dehydrate_resource_uri(bundle), '/api/v1/notes/1/')
+
+        slug_resource = SlugBasedNoteResource()
+        self.assertEqual(slug_resource.get_resource_uri(self.slug_note), '/api/v2/slugbased/first-post/')
+
+        # Values get quoted just like ``reverse`` does.
+        self.slug_note.slug = 'with space/and?query'
+        self.assertEqual(slug_resource.get_resource_uri(self.slug_note), reverse('api_dispatch_detail', kwargs={'api_name': 'v2', 'resource_name': 'slugbased', 'slug': 'with space/and?query'}))
+
+    def test_reverses_once(self):
+        resource = RegisteredNoteResource()
+        resource.get_resource_uri(self.note)
+
+        with patch.object(RegisteredNoteResource, '_build_reverse_url') as mock_reverse:
+            self.assertEqual(resource.get_resource_uri(self.note), '/api/v1/notes/1/')
+            self.assertEqual(RegisteredNoteResource().get_resource_uri(Note.objects.get(pk=2)), '/api/v1/notes/2/')
+            self.assertFalse(mock_reverse.called)
+
+    def test_script_prefix(self):
+        resource = RegisteredNoteResource()
+        resource.get_resource_uri(self.note)
+
+        set_script_prefix('/prefix/')
+
+        try:
+            self.assertEqual(resource.get_resource_uri(self.note), '/prefix/api/v1/notes/1/')
+        finally:
+            set_script_prefix('/')
+
+    def test_restricted_pattern_falls_back(self):
+        resource = RestrictedSlugBasedNoteResource()
+        self.assertEqual(resource.get_resource_uri(self.slug_note), '/api/v2/restrictedslugbased/first-post/')
+
+        # Values the pattern doesn't accept still fail to reverse.
+        self.slug_note.slug = 'not/valid'
+        self.assertEqual(resource.get_resource_uri(self.slug_note), '')
@@ -41,6 +41,12 @@ class ViewsTestCase(TestCase):
         self.assertEqual(len(deserialized['objects']), 2)
         self.assertEqual([obj['title'] for obj in deserialized['objects']], [u'Another Post', u'First Post!'])
 
+        resp = self.client.post('/api/v1/notes/set/?format=json', data='{"pk_list": [2, 1, 3]}', content_type='application/json')
+        self.assertEqual(resp.status_code, 200)
+        deserialized = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([obj['title'] for obj in deserialized['objects']], [u'Another Post', u'First Post!'])
+        self.assertEqual(deserialized['not_found'], [u'3'])
+
     def test_get_test_client_error(self):
         # The test server should re-raise exceptions to make debugging easier.
         self.assertRaises(Exception, self.client.get, '/api/v2/busted/', data={'format': 'json'})
@@ -114,7 +120,7 @@ class ViewsTestCase(TestCase):
 
         resp = self.client.options('/api/v1/notes/set/2;1/')
         self.assertEqual(resp.status_code, 200)
-        allows = 'GET'
+        allows = 'GET,POST'
         self.assertEqual(resp['Allow'], allows)
         self.assertEqual(resp.content.decode('utf-8'), allows)
 
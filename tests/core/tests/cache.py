@@ -28,6 +28,15 @@ class NoCacheTestCase(TestCase):
         self.assertEqual(cache.get('foo'), None)
         self.assertEqual(cache.get('moof'), None)
 
+    def test_get_many(self):
+        cache.set('foo', 'bar', 60)
+        self.assertEqual(NoCache().get_many(['foo', 'moof']), {})
+
+    def test_set_many(self):
+        NoCache().set_many({'foo': 'bar', 'moof': 'baz'})
+        self.assertEqual(cache.get('foo'), None)
+        self.assertEqual(cache.get('moof'), None)
+
 
 class SimpleCacheTestCase(TestCase):
     def tearDown(self):
@@ -44,6 +53,17 @@ class SimpleCacheTestCase(TestCase):
         self.assertEqual(simple_cache.get('moof'), 'baz')
         self.assertEqual(simple_cache.get(''), None)
 
+    def test_get_many(self):
+        cache.set('foo', 'bar', 60)
+
+        simple_cache = SimpleCache()
+        self.assertEqual(simple_cache.get_many(['foo', 'moof']), {'foo': 'bar'})
+
+    def test_set_many(self):
+        simple_cache = SimpleCache()
+        simple_cache.set_many({'foo': 'bar', 'moof': 'baz'})
+        self.assertEqual(cache.get_many(['foo', 'moof']), {'foo': 'bar', 'moof': 'baz'})
+
     def test_set(self):
         simple_cache = SimpleCache(timeout=1)
         simple_cache.set('foo', 'bar', timeout=10)
@@ -93,6 +93,45 @@ class ApiFieldTestCase(TestCase):
         field_6 = ApiField(attribute='what_time_is_it', default=True)
         self.assertEqual(field_6.dehydrate(bundle), aware_datetime(2010, 4, 1, 0, 48))
 
+    def test_dehydrate_traversed(self):
+        note = Note.objects.get(pk=1)
+        bundle = Bundle(obj=note)
+
+        field_1 = ApiField(attribute='author__username')
+        self.assertEqual(field_1.dehydrate(bundle), u'johndoe')
+
+        # An empty hop stops the walk.
+        note.author = None
+        self.assertRaises(ApiFieldError, field_1.dehydrate, bundle)
+
+        field_2 = ApiField(attribute='author__username', default='anonymous')
+        self.assertEqual(field_2.dehydrate(bundle), 'anonymous')
+
+        field_3 = ApiField(attribute='author__username', null=True)
+        self.assertEqual(field_3.dehydrate(bundle), None)
+
+    def test_get_attribute_accessor(self):
+        note = Note.objects.get(pk=1)
+
+        field_1 = ApiField(attribute='title')
+        accessor = field_1.get_attribute_accessor()
+        self.assertEqual(accessor(note), (u'First Post!', note, 'title'))
+        self.assertEqual(accessor(object())[0], None)
+
+        # Compiled once per ``attribute``.
+        self.assertTrue(field_1.get_attribute_accessor() is accessor)
+        field_1.attribute = 'slug'
+        self.assertEqual(field_1.get_attribute_accessor()(note)[0], u'first-post')
+
+        field_2 = ApiField(attribute='author__username')
+        self.assertEqual(field_2.get_attribute_accessor()(note), (u'johndoe', note.author, 'username'))
+
+        note.author = None
+        self.assertEqual(field_2.get_attribute_accessor()(note), (None, note, 'author'))
+
+        # Strict lets errors through.
+        self.assertRaises(AttributeError, field_2.get_attribute_accessor(strict=True), note)
+
     def test_convert(self):
         field_1 = ApiField()
         self.assertEqual(field_1.convert('foo'), 'foo')
@@ -2,12 +2,17 @@
 from django.conf import settings
 from django.test import TestCase
 from tastypie.exceptions import BadRequest
-from tastypie.paginator import Paginator
+from tastypie.paginator import Paginator, CursorPaginator
 from core.models import Note
 from core.tests.resources import NoteResource
 from django.db import reset_queries
 from django.http import QueryDict
 
+try:
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from urlparse import urlparse, parse_qs
+
 
 class PaginatorTestCase(TestCase):
     fixtures = ['note_testdata.json']
@@ -275,9 +280,186 @@ class PaginatorTestCase(TestCase):
         meta = paginator.page()['meta']
         self.assertEqual(meta['limit'], 10)
 
+    def test_count_mode_none(self):
+        reset_queries()
+        paginator = Paginator({}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=2, count_mode='none')
+        page = paginator.page()
+        self.assertEqual(len(self._get_query_count()), 1)
+        self.assertFalse('total_count' in page['meta'])
+        self.assertEqual(len(page['objects']), 2)
+        self.assertTrue('offset=0' in page['meta']['previous'])
+        self.assertTrue('offset=4' in page['meta']['next'])
+
+        paginator = Paginator({}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=4, count_mode='none')
+        page = paginator.page()
+        self.assertEqual(len(page['objects']), 2)
+        self.assertEqual(page['meta']['next'], None)
+
+        # Users may opt out of the count per request.
+        paginator = Paginator({'count_mode': 'none'}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=0)
+        page = paginator.page()
+        self.assertFalse('total_count' in page['meta'])
+        self.assertTrue('count_mode=none' in page['meta']['next'])
+
+        # But can't opt in to more expensive ones.
+        paginator = Paginator({'count_mode': 'exact'}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=0, count_mode='none')
+        self.assertRaises(BadRequest, paginator.page)
+
+        paginator = Paginator({'count_mode': 'foo'}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=0)
+        self.assertRaises(BadRequest, paginator.page)
+
+    def test_count_mode_cached(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        paginator = Paginator({}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=0, count_mode='cached')
+        self.assertEqual(paginator.page()['meta']['total_count'], 6)
+        self.assertEqual(cache.get(paginator.get_count_cache_key()), 6)
+
+        reset_queries()
+        paginator = Paginator({}, Note.objects.all(), resource_uri='/api/v1/notes/', limit=2, offset=0, count_mode='cached')
+        meta = paginator.page()['meta']
+        self.assertEqual(meta['total_count'], 6)
+        self.assertTrue('offset=2' in meta['next'])
+        # Only the page itself was fetched.
+        self.assertEqual(len(self._get_query_count()), 1)
+
+        # Different filters get a different count.
+        paginator = Paginator({}, Note.objects.filter(is_active=True), resource_uri='/api/v1/notes/', limit=2, offset=0, count_mode='cached')
+        self.assertEqual(paginator.page()['meta']['total_count'], 4)
+
+        # Lists just get counted.
+        paginator = Paginator({}, ['foo', 'bar', 'baz'], limit=2, offset=0, count_mode='cached')
+        self.assertEqual(paginator.page()['meta']['total_count'], 3)
+
+    def test_count_mode_estimated(self):
+        # SQLite has no estimate, so this falls back to the exact count.
+        paginator = Paginator({}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=0, count_mode='estimated')
+        meta = paginator.page()['meta']
+        self.assertEqual(meta['total_count'], 6)
+        self.assertFalse('total_count_estimated' in meta)
+
+        class EstimatingPaginator(Paginator):
+            estimate_threshold = 100
+
+            def get_estimated_count(self):
+                return 1234
+
+        paginator = EstimatingPaginator({}, self.data_set, resource_uri='/api/v1/notes/', limit=2, offset=4, count_mode='estimated')
+        meta = paginator.page()['meta']
+        self.assertEqual(meta['total_count'], 1234)
+        self.assertEqual(meta['total_count_estimated'], True)
+        # The next link doesn't trust the estimate.
+        self.assertEqual(meta['next'], None)
+
     def test_max_limit_none(self):
         paginator = Paginator({'limit': 0}, self.data_set, max_limit=None,
                               resource_uri='/api/v1/notes/')
         meta = paginator.page()['meta']
         self.assertEqual(meta['limit'], 0)
 
+
+
+class CursorPaginatorTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def setUp(self):
+        super(CursorPaginatorTestCase, self).setUp()
+        self.data_set = Note.objects.order_by('-created')
+        self.old_debug = settings.DEBUG
+        settings.DEBUG = True
+
+    def tearDown(self):
+        settings.DEBUG = self.old_debug
+        super(CursorPaginatorTestCase, self).tearDown()
+
+    def _page(self, data_set, request_data, limit=2, max_limit=1000):
+        paginator = CursorPaginator(request_data, data_set, resource_uri='/api/v1/notes/', limit=limit, max_limit=max_limit)
+        return paginator.page()
+
+    def _get_queries(self):
+        from django.db import connection
+        return connection.queries
+
+    def _params(self, uri):
+        return dict((k, v[0]) for k, v in parse_qs(urlparse(uri).query).items())
+
+    def test_get_ordering(self):
+        paginator = CursorPaginator({}, Note.objects.all())
+        self.assertEqual(paginator.get_ordering(), [('pk', False)])
+
+        paginator = CursorPaginator({}, Note.objects.order_by('-created', 'title'))
+        self.assertEqual(paginator.get_ordering(), [('created', True), ('title', False), ('pk', False)])
+
+        paginator = CursorPaginator({}, Note.objects.order_by('-id', 'title'))
+        self.assertEqual(paginator.get_ordering(), [('pk', True)])
+
+        paginator = CursorPaginator({}, Note.objects.order_by('?'))
+        self.assertRaises(BadRequest, paginator.get_ordering)
+
+    def test_forwards_and_backwards(self):
+        expected = list(Note.objects.order_by('-created', 'pk').values_list('pk', flat=True))
+        seen = []
+        pages = []
+        request_data = {'format': 'json'}
+
+        while True:
+            reset_queries()
+            page = self._page(self.data_set, request_data)
+            queries = self._get_queries()
+            self.assertFalse([query for query in queries if 'OFFSET' in query['sql']])
+            self.assertEqual(page['meta']['total_count'], 6)
+            self.assertFalse('offset' in page['meta'])
+
+            seen.extend([note.pk for note in page['objects']])
+            pages.append([note.pk for note in page['objects']])
+
+            if len(pages) == 1:
+                self.assertEqual(page['meta']['previous'], None)
+            else:
+                self.assertNotEqual(page['meta']['previous'], None)
+
+            if page['meta']['next'] is None:
+                break
+
+            request_data = self._params(page['meta']['next'])
+            self.assertEqual(request_data['format'], 'json')
+            self.assertEqual(request_data['limit'], '2')
+
+        # Several notes share a ``created``, so the pk has to break the ties.
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(pages), 3)
+
+        # Now walk back from the last page.
+        back = []
+        previous = page['meta']['previous']
+
+        while previous is not None:
+            page = self._page(self.data_set, self._params(previous))
+            back.insert(0, [note.pk for note in page['objects']])
+            self.assertNotEqual(page['meta']['next'], None)
+            previous = page['meta']['previous']
+
+        self.assertEqual(back, pages[:-1])
+
+    def test_filtered(self):
+        data_set = self.data_set.filter(is_active=True)
+        page = self._page(data_set, {}, limit=3)
+        self.assertEqual([note.pk for note in page['objects']], [6, 4, 2])
+
+        page = self._page(data_set, self._params(page['meta']['next']), limit=3)
+        self.assertEqual([note.pk for note in page['objects']], [1])
+        self.assertEqual(page['meta']['next'], None)
+
+    def test_no_limit(self):
+        page = self._page(self.data_set, {'limit': 0}, limit=0, max_limit=None)
+        self.assertEqual(len(page['objects']), 6)
+        self.assertFalse('next' in page['meta'])
+
+    def test_invalid_cursor(self):
+        self.assertRaises(BadRequest, self._page, self.data_set, {'cursor': 'not-a-cursor'})
+
+        # Cursors from a different ordering don't fit.
+        paginator = CursorPaginator({}, self.data_set)
+        cursor = paginator.encode_cursor([1])
+        self.assertRaises(BadRequest, self._page, self.data_set, {'cursor': cursor})
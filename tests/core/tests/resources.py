@@ -1,6 +1,8 @@
 import base64
 import copy
 import datetime
+import hashlib
+from io import BytesIO
 from decimal import Decimal
 import django
 import json
@@ -12,6 +14,7 @@ from django.core.cache import cache
 from django.core.exceptions import FieldError, MultipleObjectsReturned
 from django.core import mail
 from django.core.urlresolvers import reverse
+from django.db.models import Count
 from django import forms
 from django.http import HttpRequest, QueryDict, Http404
 from django.test import TestCase
@@ -21,19 +24,36 @@ from django.utils import six
 from tastypie.authentication import BasicAuthentication
 from tastypie.authorization import Authorization
 from tastypie.bundle import Bundle
+from tastypie.cache import NoCache, SimpleCache
 from tastypie.exceptions import InvalidFilterError, InvalidSortError, ImmediateHttpResponse, BadRequest, NotFound
 from tastypie import fields
-from tastypie.paginator import Paginator
-from tastypie.resources import Resource, ModelResource, ALL, ALL_WITH_RELATIONS, convert_post_to_put, convert_post_to_patch
+from tastypie.paginator import Paginator, CursorPaginator
+from tastypie.resources import Resource, ModelResource, ALL, ALL_WITH_RELATIONS, convert_post_to_put, convert_post_to_patch, ValuesRow
 from tastypie.serializers import Serializer
 from tastypie.throttle import CacheThrottle
 from tastypie.utils import aware_datetime, make_naive
-from tastypie.validation import FormValidation
+from tastypie.validation import FormValidation, Validation
 from core.models import Note, NoteWithEditor, Subject, MediaBit, AutoNowNote, DateRecord, Counter
 from core.tests.mocks import MockRequest
 from core.utils import SimpleHandler
 
 
+def build_get_request(meta=None, **params):
+    """
+    Builds a ``GET`` request with the given query parameters (``format``
+    defaults to ``json``, lists are repeated parameters) & ``META`` entries.
+    """
+    request = HttpRequest()
+    request.method = 'GET'
+    request.GET = QueryDict('', mutable=True)
+
+    for key, value in dict({'format': 'json'}, **params).items():
+        request.GET.setlist(key, value if isinstance(value, list) else [value])
+
+    request.META.update(meta or {})
+    return request
+
+
 class CustomSerializer(Serializer):
     pass
 
@@ -387,6 +407,54 @@ class ResourceTestCase(TestCase):
         self.assertEqual(bundle_2.data['view_count'], 12)
         self.assertEqual(bundle_2.data.get('date_joined'), None)
 
+    def test_get_dehydration_plan(self):
+        basic = BasicResourceWithDifferentListAndDetailFields()
+        detail_plan = basic.get_dehydration_plan()
+        self.assertEqual(sorted(field_name for field_name, field_object, use_in, method in detail_plan), ['name', 'resource_uri', 'view_count'])
+
+        list_plan = basic.get_dehydration_plan(for_list=True)
+        self.assertEqual(sorted(field_name for field_name, field_object, use_in, method in list_plan), ['date_joined', 'name', 'resource_uri'])
+
+        for field_name, field_object, use_in, method in list_plan:
+            self.assertTrue(field_object is basic.fields[field_name])
+            self.assertEqual(use_in, None)
+
+            if field_name == 'name':
+                self.assertEqual(method, None)
+            else:
+                self.assertEqual(method, getattr(basic, 'dehydrate_%s' % field_name))
+
+        # Cached on the instance & shared with other instances of the class.
+        self.assertTrue(basic.get_dehydration_plan() is detail_plan)
+        self.assertEqual(len(BasicResourceWithDifferentListAndDetailFields._meta._dehydration_plans), 2)
+
+        other = BasicResourceWithDifferentListAndDetailFields()
+        other_plan = other.get_dehydration_plan()
+        self.assertEqual(len(BasicResourceWithDifferentListAndDetailFields._meta._dehydration_plans), 2)
+        self.assertTrue(other_plan[0][1] is other.fields[other_plan[0][0]])
+
+        # Callable ``use_in`` is kept for checking per bundle.
+        callable_basic = BasicResourceWithDifferentListAndDetailFieldsCallable()
+        callable_use_in = dict((field_name, use_in) for field_name, field_object, use_in, method in callable_basic.get_dehydration_plan(for_list=True))
+        self.assertEqual(callable_use_in['name'], None)
+        self.assertTrue(callable(callable_use_in['view_count']))
+        self.assertTrue(callable(callable_use_in['date_joined']))
+
+    def test_get_dehydration_plan_instance_fields(self):
+        basic = BasicResource()
+        basic.fields['extra'] = fields.CharField(default='extra')
+
+        test_object_1 = TestObject()
+        test_object_1.name = 'Daniel'
+        test_object_1.view_count = 12
+        test_object_1.date_joined = aware_datetime(2010, 3, 30, 9, 0, 0)
+
+        bundle = basic.full_dehydrate(basic.build_bundle(obj=test_object_1))
+        self.assertEqual(bundle.data['extra'], 'extra')
+
+        bundle = BasicResource().full_dehydrate(BasicResource().build_bundle(obj=test_object_1))
+        self.assertFalse('extra' in bundle.data)
+
     def test_full_dehydrate(self):
         test_object_1 = TestObject()
         test_object_1.name = 'Daniel'
@@ -908,6 +976,10 @@ class AutoNowNoteResource(ModelResource):
 
 
 class CustomPaginator(Paginator):
+    # The signature from before ``count_mode`` was added.
+    def __init__(self, request_data, objects, resource_uri=None, limit=None, offset=0, max_limit=1000, collection_name='objects'):
+        super(CustomPaginator, self).__init__(request_data, objects, resource_uri=resource_uri, limit=limit, offset=offset, max_limit=max_limit, collection_name=collection_name)
+
     def page(self):
         data = super(CustomPaginator, self).page()
         data['extra'] = 'Some extra stuff here.'
@@ -1229,6 +1301,21 @@ class PerObjectNoteResource(NoteResource):
 # End per object authorization bits.
 
 
+class QuerySetOnlyAuthorization(Authorization):
+    def read_list(self, object_list, bundle):
+        return object_list.exclude(pk=4)
+
+    def delete_list(self, object_list, bundle):
+        return object_list.exclude(pk=6)
+
+
+class QuerySetAuthorizedNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        queryset = Note.objects.filter(is_active=True)
+        authorization = QuerySetOnlyAuthorization()
+
+
 class CounterResource(ModelResource):
     count = fields.IntegerField('count', default=0, null=True)
 
@@ -1535,6 +1622,21 @@ class ModelResourceTestCase(TestCase):
         note_1 = resource.get_via_uri('/api/v1/notes/1/', request=request)
         self.assertEqual(note_1.pk, 1)
 
+    def test_get_via_uris(self):
+        resource = NoteResource(api_name='v1')
+
+        # Note 3 isn't active & the list URI matches several objects. The
+        # third query checks whether the missing ones are just unreadable.
+        with self.assertNumQueries(3):
+            objects = resource.get_via_uris(['/api/v1/notes/1/', '/api/v1/notes/2/', '/api/v1/notes/02/', '/api/v1/notes/3/', '/api/v1/notes/'])
+
+        self.assertEqual(sorted(objects.keys()), ['/api/v1/notes/02/', '/api/v1/notes/1/', '/api/v1/notes/2/'])
+        self.assertEqual(objects['/api/v1/notes/1/'].pk, 1)
+        self.assertEqual(objects['/api/v1/notes/02/'].pk, 2)
+
+        self.assertRaises(NotFound, resource.get_via_uris, ['/api/v1/notes/1/', 'http://example.com/'])
+        self.assertRaises(NotFound, resource.get_via_uris, ['/api/v1/notes/abc/'])
+
     def test_create_identifier(self):
         resource = NoteResource()
         new_note = Note.objects.get(pk=1)
@@ -2704,6 +2806,50 @@ class ModelResourceTestCase(TestCase):
         new_note = Note.objects.get(slug='invalid-uri')
         self.assertEqual(new_note.content, "This is an invalid resource_uri")
 
+    def test_patch_list_batched_lookups(self):
+        resource = NoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        request.method = 'PATCH'
+        request._read_started = False
+        request._raw_post_data = request._body = '{"objects": [{"resource_uri": "/api/v1/notes/2/", "content": "This is note 2."}, {"resource_uri": "/api/v1/notes/4/", "content": "This is note 4."}], "deleted_objects": ["/api/v1/notes/1/", "/api/v1/notes/6/", "/api/v1/notes/1/"]}'
+
+        with patch.object(NoteResource, 'obj_get') as mock_obj_get:
+            with patch.object(NoteResource, 'obj_delete') as mock_obj_delete:
+                resp = resource.patch_list(request)
+
+        self.assertEqual(resp.status_code, 202)
+        self.assertFalse(mock_obj_get.called)
+        self.assertFalse(mock_obj_delete.called)
+        self.assertEqual(sorted(Note.objects.values_list('pk', flat=True)), [2, 3, 4, 5])
+        self.assertEqual(Note.objects.get(pk=4).content, "This is note 4.")
+
+        request._raw_post_data = request._body = '{"objects": [], "deleted_objects": ["/api/v1/notes/2/", "/api/v1/notes/6/"]}'
+        self.assertRaises(NotFound, resource.patch_list, request)
+        self.assertEqual(Note.objects.count(), 4)
+
+    def test_patch_list_batched_authorization(self):
+        resource = QuerySetAuthorizedNoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        request.method = 'PATCH'
+        request._read_started = False
+
+        # Unreadable objects aren't treated as missing (& created anew).
+        request._raw_post_data = request._body = '{"objects": [{"resource_uri": "/api/v1/notes/4/", "content": "This is note 4."}]}'
+        self.assertRaises(ImmediateHttpResponse, resource.patch_list, request)
+        self.assertEqual(Note.objects.count(), 6)
+        self.assertNotEqual(Note.objects.get(pk=4).content, "This is note 4.")
+
+        # ``delete_list`` gets a ``QuerySet``.
+        request._raw_post_data = request._body = '{"objects": [], "deleted_objects": ["/api/v1/notes/1/", "/api/v1/notes/6/"]}'
+        self.assertRaises(ImmediateHttpResponse, resource.patch_list, request)
+        self.assertEqual(Note.objects.count(), 6)
+
+        request._raw_post_data = request._body = '{"objects": [], "deleted_objects": ["/api/v1/notes/1/", "/api/v1/notes/2/"]}'
+        self.assertEqual(resource.patch_list(request).status_code, 202)
+        self.assertEqual(sorted(Note.objects.values_list('pk', flat=True)), [3, 4, 5, 6])
+
     def test_patch_list_with_request_data(self):
         """
         Verify that request data is accessible in a Resource's hydrate method after patch_list.
@@ -3149,6 +3295,43 @@ class ModelResourceTestCase(TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.content.decode('utf-8'), '{"objects": [{"content": "This is my very first post using my shiny new API. Pretty sweet, huh?", "created": "2010-03-30T20:05:00", "id": 1, "is_active": true, "resource_uri": "/api/v1/notes/1/", "slug": "first-post", "title": "First Post!", "updated": "2010-03-30T20:05:00"}, {"content": "The dog ate my cat today. He looks seriously uncomfortable.", "created": "2010-03-31T20:05:00", "id": 2, "is_active": true, "resource_uri": "/api/v1/notes/2/", "slug": "another-post", "title": "Another Post", "updated": "2010-03-31T20:05:00"}, {"content": "My neighborhood\'s been kinda weird lately, especially after the lava flow took out the corner store. Granny can hardly outrun the magma with her walker.", "created": "2010-04-01T20:05:00", "id": 4, "is_active": true, "resource_uri": "/api/v1/notes/4/", "slug": "recent-volcanic-activity", "title": "Recent Volcanic Activity.", "updated": "2010-04-01T20:05:00"}, {"content": "Man, the second eruption came on fast. Granny didn\'t have a chance. On the upshot, I was able to save her walker and I got a cool shawl out of the deal!", "created": "2010-04-02T10:05:00", "id": 6, "is_active": true, "resource_uri": "/api/v1/notes/6/", "slug": "grannys-gone", "title": "Granny\'s Gone", "updated": "2010-04-02T10:05:00"}]}')
 
+    def test_get_multiple_single_query(self):
+        resource = NoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        request.method = 'GET'
+
+        with self.assertNumQueries(1):
+            resp = resource.get_multiple(request, pk_list='6;3;1;6')
+
+        self.assertEqual(resp.status_code, 200)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([note['id'] for note in content['objects']], [6, 1, 6])
+        self.assertEqual(content['not_found'], ['3'])
+
+        self.assertRaises(NotFound, resource.get_multiple, request, pk_list='1;abc')
+
+    def test_get_multiple_post(self):
+        resource = NoteResource()
+        request = MockRequest()
+        request.GET = {'format': 'json'}
+        request.method = 'POST'
+
+        request.set_body('{"pk_list": [4, 2]}')
+        resp = resource.get_multiple(request)
+        self.assertEqual(resp.status_code, 200)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([note['id'] for note in content['objects']], [4, 2])
+
+        request.set_body('["2", 3]')
+        resp = resource.get_multiple(request)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([note['id'] for note in content['objects']], [2])
+        self.assertEqual(content['not_found'], ['3'])
+
+        request.set_body('{"pk": 2}')
+        self.assertRaises(BadRequest, resource.get_multiple, request)
+
     def test_get_multiple_use_in(self):
         resource = AlwaysDataNoteResourceUseIn()
         request = HttpRequest()
@@ -3229,10 +3412,12 @@ class ModelResourceTestCase(TestCase):
 
     def test_generate_cache_key(self):
         resource = NoteResource()
-        self.assertEqual(resource.generate_cache_key(), 'None:notes::')
-        self.assertEqual(resource.generate_cache_key('abc', '123'), 'None:notes:abc:123:')
-        self.assertEqual(resource.generate_cache_key(foo='bar', moof='baz'), 'None:notes::foo=bar:moof=baz')
-        self.assertEqual(resource.generate_cache_key('abc', '123', foo='bar', moof='baz'), 'None:notes:abc:123:foo=bar:moof=baz')
+
+        with patch.object(NoteResource, 'get_cache_generation', return_value='1a2b'):
+            self.assertEqual(resource.generate_cache_key(), 'None:notes:1a2b::')
+            self.assertEqual(resource.generate_cache_key('abc', '123'), 'None:notes:1a2b:abc:123:')
+            self.assertEqual(resource.generate_cache_key(foo='bar', moof='baz'), 'None:notes:1a2b::foo=bar:moof=baz')
+            self.assertEqual(resource.generate_cache_key('abc', '123', foo='bar', moof='baz'), 'None:notes:1a2b:abc:123:foo=bar:moof=baz')
 
     def test_cached_fetch_list(self):
         resource = NoteResource()
@@ -4222,3 +4407,1395 @@ class ObjectlessResourceTestCase(TestCase):
 
         self.assertTrue(bundle is not None)
 
+
+
+class PlannedMediaBitResource(ModelResource):
+    class Meta:
+        queryset = MediaBit.objects.all()
+        resource_name = 'plannedmediabits'
+
+
+class PlannedNoteResource(ModelResource):
+    author = fields.ForeignKey(UserResource, 'author', null=True)
+    subjects = fields.ManyToManyField(SubjectResource, 'subjects', null=True)
+    media_bits = fields.ToManyField(PlannedMediaBitResource, 'media_bits', full=True, null=True)
+
+    class Meta:
+        queryset = Note.objects.filter(is_active=True)
+        resource_name = 'plannednotes'
+        fields = ['id', 'title', 'slug']
+
+    def get_resource_uri(self, bundle_or_obj=None, url_name='api_dispatch_list'):
+        if bundle_or_obj is None:
+            return '/api/v1/plannednotes/'
+
+        return '/api/v1/plannednotes/%s/' % bundle_or_obj.obj.id
+
+
+class PlannedSubjectResource(ModelResource):
+    notes = fields.ToManyField(PlannedNoteResource, 'notes', full=True, full_list=False)
+
+    class Meta:
+        queryset = Subject.objects.all()
+        resource_name = 'plannedsubjects'
+
+
+class UnplannedNoteResource(PlannedNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True)
+        resource_name = 'unplannednotes'
+        fields = ['title', 'slug', 'author', 'subjects', 'media_bits']
+        plan_related_queries = False
+
+
+class QueryPlanTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def setUp(self):
+        super(QueryPlanTestCase, self).setUp()
+        subject = Subject.objects.create(name='News', url='/news/')
+
+        for note in Note.objects.all():
+            note.subjects.add(subject)
+            MediaBit.objects.create(note=note, title='Bit for %s' % note.pk)
+
+    def test_build_query_plan(self):
+        resource = PlannedNoteResource()
+        self.assertEqual(resource.build_query_plan(), {
+            'select_related': ['author'],
+            'prefetch_related': ['media_bits', 'subjects'],
+        })
+
+    def test_build_query_plan_nested(self):
+        resource = PlannedSubjectResource()
+        self.assertEqual(resource.build_query_plan(for_list=True), {
+            'select_related': [],
+            'prefetch_related': ['notes'],
+        })
+        self.assertEqual(resource.build_query_plan(for_list=False), {
+            'select_related': [],
+            'prefetch_related': ['notes', 'notes__author', 'notes__media_bits', 'notes__subjects'],
+        })
+
+    def test_apply_query_plan_keeps_existing_select_related(self):
+        resource = PlannedNoteResource()
+        object_list = resource.apply_query_plan(MediaBit.objects.select_related('note'))
+        self.assertEqual(object_list.query.select_related, {'author': {}, 'note': {}})
+
+    def test_apply_query_plan_opt_out(self):
+        resource = UnplannedNoteResource()
+        object_list = Note.objects.all()
+        self.assertTrue(resource.apply_query_plan(object_list) is object_list)
+
+    def test_get_list_query_count(self):
+        resource = PlannedNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+
+        # One count, one page & one per prefetched relation.
+        for limit in ('1', '4'):
+            request.GET = {'format': 'json', 'limit': limit}
+
+            with self.assertNumQueries(4):
+                resp = resource.get_list(request)
+
+            self.assertEqual(resp.status_code, 200)
+            data = json.loads(resp.content.decode('utf-8'))
+            self.assertEqual(len(data['objects']), int(limit))
+
+            for note in data['objects']:
+                self.assertEqual(len(note['media_bits']), MediaBit.objects.filter(note=note['id']).count())
+                self.assertEqual(len(note['subjects']), 1)
+
+    def test_get_list_unplanned_query_count(self):
+        resource = UnplannedNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json', 'limit': '4'}
+
+        # One count, one page & three per object.
+        with self.assertNumQueries(14):
+            resp = resource.get_list(request)
+
+        self.assertEqual(resp.status_code, 200)
+
+
+class StreamingNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        serializer = Serializer(formats=['json', 'jsonp', 'xml', 'yaml', 'ndjson'])
+        stream_list = True
+        stream_chunk_size = 3
+
+
+class StreamingPlannedNoteResource(PlannedNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True)
+        resource_name = 'plannednotes'
+        fields = ['id', 'title', 'slug', 'author', 'subjects', 'media_bits']
+        stream_list = True
+        stream_chunk_size = 2
+
+
+class StreamingListTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def test_get_list_json(self):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+
+        resp = StreamingNoteResource().get_list(request)
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp['Content-Type'], 'application/json')
+
+        expected = NoteResource().get_list(request)
+        self.assertEqual(b''.join(resp.streaming_content), expected.content)
+
+    def test_get_list_ndjson(self):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'ndjson', 'limit': '2'}
+
+        resp = StreamingNoteResource().get_list(request)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp['Content-Type'], 'application/x-ndjson; charset=utf-8')
+
+        lines = b''.join(resp.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)
+        meta = json.loads(lines[0])
+        self.assertEqual(list(meta.keys()), ['meta'])
+        self.assertEqual(meta['meta']['total_count'], 4)
+        self.assertEqual([json.loads(line)['id'] for line in lines[1:]], [1, 2])
+
+    def test_get_list_xml(self):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'xml'}
+
+        resp = StreamingNoteResource().get_list(request)
+        self.assertTrue(resp.streaming)
+
+        expected = NoteResource().get_list(request)
+        self.assertEqual(b''.join(resp.streaming_content), expected.content)
+
+    def test_get_list_unstreamable_format(self):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'yaml'}
+
+        resp = StreamingNoteResource().get_list(request)
+        self.assertFalse(resp.streaming)
+        self.assertEqual(resp['Content-Type'], 'text/yaml; charset=utf-8')
+
+    def test_prefetch_per_chunk(self):
+        subject = Subject.objects.create(name='News', url='/news/')
+
+        for note in Note.objects.all():
+            note.subjects.add(subject)
+
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+
+        with self.assertNumQueries(1):
+            resp = StreamingPlannedNoteResource().get_list(request)
+
+        # The page, then both prefetches for each of the two chunks.
+        with self.assertNumQueries(5):
+            content = b''.join(resp.streaming_content)
+
+        data = json.loads(content.decode('utf-8'))
+        self.assertEqual(len(data['objects']), 4)
+
+        for note in data['objects']:
+            self.assertEqual(len(note['subjects']), 1)
+
+
+class ValuesNoteResource(ModelResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True).order_by('-created')
+        resource_name = 'notes'
+        fields = ['id', 'title', 'slug', 'content', 'created', 'is_active']
+        ordering = ['title', 'created']
+        use_values = True
+
+
+class SlugValuesNoteResource(ValuesNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True).order_by('-created')
+        resource_name = 'notes'
+        fields = ['title', 'slug', 'is_active']
+        ordering = ['is_active']
+        detail_uri_name = 'slug'
+        use_values = True
+
+
+class HookedValuesNoteResource(ValuesNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True).order_by('-created')
+        resource_name = 'notes'
+        fields = ['id', 'title', 'slug', 'content', 'created', 'is_active']
+        use_values = True
+
+    def dehydrate_title(self, bundle):
+        return bundle.obj.title.upper()
+
+
+class ValuesListTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def _get_list(self, resource, **params):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = dict(format='json', **params)
+        resp = resource.get_list(request)
+        self.assertEqual(resp.status_code, 200)
+        return json.loads(resp.content.decode('utf-8'))
+
+    def test_get_values_plan(self):
+        plan = ValuesNoteResource().get_values_plan()
+        self.assertEqual(sorted(column for field_name, field_object, use_in, method, column in plan), [None, 'content', 'created', 'id', 'is_active', 'slug', 'title'])
+
+        # Needs the instance for the hook.
+        self.assertEqual(HookedValuesNoteResource().get_values_plan(), None)
+        # Related fields.
+        self.assertEqual(PlannedNoteResource().get_values_plan(), None)
+
+    def test_apply_values(self):
+        resource = ValuesNoteResource()
+        objects = resource.apply_values(resource.get_object_list(None))
+        row = list(objects)[0]
+        self.assertTrue(isinstance(row, ValuesRow))
+        self.assertEqual(sorted(row.keys()), ['content', 'created', 'id', 'is_active', 'pk', 'slug', 'title'])
+        self.assertEqual(row.title, 'Granny\'s Gone')
+        self.assertRaises(AttributeError, getattr, row, 'author')
+
+        objects = HookedValuesNoteResource().apply_values(Note.objects.all())
+        self.assertFalse(isinstance(list(objects)[0], ValuesRow))
+
+        resource._meta.use_values = False
+
+        try:
+            objects = resource.apply_values(Note.objects.all())
+            self.assertFalse(isinstance(list(objects)[0], ValuesRow))
+        finally:
+            resource._meta.use_values = True
+
+    def test_get_list_matches(self):
+        resource = ValuesNoteResource()
+        data = self._get_list(resource)
+        self.assertEqual([note['id'] for note in data['objects']], [6, 4, 2, 1])
+
+        resource._meta.use_values = False
+
+        try:
+            self.assertEqual(self._get_list(resource), data)
+        finally:
+            resource._meta.use_values = True
+
+        self.assertEqual(data['objects'][0]['resource_uri'], resource.get_resource_uri(Note.objects.get(pk=6)))
+        self.assertEqual(data['objects'][0]['created'], '2010-04-02T10:05:00')
+
+        data = self._get_list(HookedValuesNoteResource())
+        self.assertEqual(data['objects'][0]['title'], 'GRANNY\'S GONE')
+
+    def test_get_list_sorted_and_cursor(self):
+        resource = ValuesNoteResource()
+        data = self._get_list(resource, order_by='title')
+        self.assertEqual([note['title'] for note in data['objects']], ['Another Post', 'First Post!', 'Granny\'s Gone', 'Recent Volcanic Activity.'])
+
+        resource._meta.paginator_class = CursorPaginator
+
+        try:
+            data = self._get_list(resource, limit='3')
+            self.assertEqual([note['id'] for note in data['objects']], [6, 4, 2])
+            data = self._get_list(resource, limit='3', cursor=QueryDict(data['meta']['next'].split('?', 1)[1])['cursor'])
+            self.assertEqual([note['id'] for note in data['objects']], [1])
+        finally:
+            resource._meta.paginator_class = Paginator
+
+    def test_cursor_without_pk_detail_uri(self):
+        resource = SlugValuesNoteResource()
+        resource._meta.paginator_class = CursorPaginator
+
+        try:
+            # Every row ties on ``is_active``, so paging relies on the primary key.
+            data = self._get_list(resource, limit='3', order_by='is_active')
+            self.assertEqual([note['slug'] for note in data['objects']], ['first-post', 'another-post', 'recent-volcanic-activity'])
+            data = self._get_list(resource, limit='3', order_by='is_active', cursor=QueryDict(data['meta']['next'].split('?', 1)[1])['cursor'])
+            self.assertEqual([note['slug'] for note in data['objects']], ['grannys-gone'])
+        finally:
+            resource._meta.paginator_class = Paginator
+
+
+class BulkValidation(Validation):
+    def is_valid(self, bundle, request=None):
+        if not bundle.data.get('name'):
+            return {'name': 'This field is required.'}
+
+        return {}
+
+
+class BulkSubjectResource(ModelResource):
+    notes = fields.ToManyField(NoteResource, 'notes', null=True)
+
+    class Meta:
+        queryset = Subject.objects.all()
+        resource_name = 'subjects'
+        authorization = Authorization()
+        validation = BulkValidation()
+        bulk_create = True
+
+
+class BulkNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        bulk_create = True
+
+
+class BulkCreateTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def _request(self, method, body):
+        request = MockRequest()
+        request.GET = {'format': 'json'}
+        request.method = method
+        request.set_body(body)
+        return request
+
+    def test_post_list_bulk(self):
+        resource = BulkSubjectResource()
+        request = self._request('POST', '{"objects": [{"id": 10, "name": "Science", "url": "/science/", "notes": ["/api/v1/notes/1/", "/api/v1/notes/2/"]}, {"id": 11, "name": "Sports", "url": "/sports/", "notes": ["/api/v1/notes/2/"]}]}')
+
+        # The three note lookups, the savepoint, one insert for the subjects
+        # & one for the relations.
+        with self.assertNumQueries(7):
+            resp = resource.post_list(request)
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp['Location'], resource.get_resource_uri())
+        self.assertEqual(sorted(Subject.objects.values_list('name', flat=True)), ['Science', 'Sports'])
+        self.assertEqual(sorted(Subject.objects.get(pk=10).notes.values_list('pk', flat=True)), [1, 2])
+        self.assertEqual(sorted(Subject.objects.get(pk=11).notes.values_list('pk', flat=True)), [2])
+
+    def test_post_list_bulk_without_pks(self):
+        resource = BulkSubjectResource()
+        request = self._request('POST', '{"objects": [{"name": "Science", "url": "/science/"}, {"name": "Sports", "url": "/sports/"}]}')
+        resp = resource.post_list(request)
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(Subject.objects.count(), 2)
+
+        # The new primary keys are needed for the relations, so each object
+        # is saved in turn.
+        request = self._request('POST', '{"objects": [{"name": "Music", "url": "/music/", "notes": ["/api/v1/notes/1/"]}]}')
+        self.assertFalse(resource.can_bulk_create([resource.build_bundle(obj=Subject(), data={'notes': ['/api/v1/notes/1/']})]))
+        resp = resource.post_list(request)
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual([subject.name for subject in Note.objects.get(pk=1).subjects.all()], ['Music'])
+
+    def test_post_list_bulk_invalid(self):
+        resource = BulkSubjectResource()
+        request = self._request('POST', '{"objects": [{"name": "Science", "url": "/science/"}, {"url": "/sports/"}]}')
+
+        with self.assertRaises(ImmediateHttpResponse) as cm:
+            resource.post_list(request)
+
+        self.assertEqual(cm.exception.response.status_code, 400)
+        self.assertEqual(Subject.objects.count(), 0)
+
+    def test_post_list_single(self):
+        resource = BulkSubjectResource()
+        request = self._request('POST', '{"name": "Science", "url": "/science/"}')
+        resp = resource.post_list(request)
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp['Location'], resource.get_resource_uri(Subject.objects.get()))
+
+    def test_put_list_bulk(self):
+        resource = BulkNoteResource()
+        request = self._request('PUT', '{"objects": [{"content": "The cat is back.", "created": "2010-04-03 20:05:00", "is_active": true, "slug": "cat-is-back-again", "title": "The Cat Is Back"}, {"content": "So is the dog.", "created": "2010-04-03 20:05:00", "is_active": true, "slug": "dog-is-back", "title": "The Dog Is Back"}]}')
+
+        with patch.object(Note, 'save') as mock_save:
+            resp = resource.put_list(request)
+
+        self.assertEqual(resp.status_code, 204)
+        self.assertFalse(mock_save.called)
+        self.assertEqual(Note.objects.count(), 4)
+        self.assertEqual(sorted(Note.objects.filter(is_active=True).values_list('slug', flat=True)), ['cat-is-back-again', 'dog-is-back'])
+
+    def test_put_list_bulk_invalid(self):
+        resource = BulkSubjectResource()
+        Subject.objects.create(name='Old', url='/old/')
+        request = self._request('PUT', '{"objects": [{"name": "Science", "url": "/science/"}, {"url": "/sports/"}]}')
+        self.assertRaises(ImmediateHttpResponse, resource.put_list, request)
+        # The removal of the old collection is undone too.
+        self.assertEqual([subject.name for subject in Subject.objects.all()], ['Old'])
+
+
+class ConditionalNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        last_modified_field = 'updated'
+
+
+class ContentETagNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        etag_from_content = True
+
+
+class ConditionalGetTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def test_get_detail(self):
+        resource = ConditionalNoteResource()
+        resp = resource.get_detail(build_get_request(), pk=1)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['Last-Modified'], 'Wed, 31 Mar 2010 01:05:00 GMT')
+        etag = resp['ETag']
+
+        with patch.object(ConditionalNoteResource, 'full_dehydrate') as mock_full_dehydrate:
+            resp = resource.get_detail(build_get_request(meta={'HTTP_IF_NONE_MATCH': etag}), pk=1)
+            self.assertEqual(resp.status_code, 304)
+            self.assertEqual(resp['ETag'], etag)
+            self.assertEqual(resp.content, b'')
+
+            resp = resource.get_detail(build_get_request(meta={'HTTP_IF_MODIFIED_SINCE': 'Wed, 31 Mar 2010 01:05:00 GMT'}), pk=1)
+            self.assertEqual(resp.status_code, 304)
+
+            self.assertFalse(mock_full_dehydrate.called)
+
+        # Another object, an older copy & another format all miss.
+        self.assertEqual(resource.get_detail(build_get_request(meta={'HTTP_IF_NONE_MATCH': etag}), pk=2).status_code, 200)
+        self.assertEqual(resource.get_detail(build_get_request(meta={'HTTP_IF_MODIFIED_SINCE': 'Wed, 31 Mar 2010 01:04:59 GMT'}), pk=1).status_code, 200)
+        request = build_get_request(meta={'HTTP_IF_NONE_MATCH': etag})
+        request.GET = {'format': 'xml'}
+        self.assertEqual(resource.get_detail(request, pk=1).status_code, 200)
+
+        # Nothing is added without a version source.
+        resp = NoteResource().get_detail(build_get_request(), pk=1)
+        self.assertFalse(resp.has_header('ETag'))
+        self.assertFalse(resp.has_header('Last-Modified'))
+
+    def test_get_list(self):
+        resource = ConditionalNoteResource()
+        resp = resource.get_list(build_get_request())
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['Last-Modified'], 'Fri, 02 Apr 2010 15:05:00 GMT')
+        etag = resp['ETag']
+
+        # Only the aggregate query is needed.
+        with self.assertNumQueries(1):
+            resp = resource.get_list(build_get_request(meta={'HTTP_IF_NONE_MATCH': etag}))
+
+        self.assertEqual(resp.status_code, 304)
+
+        Note.objects.get(pk=2).save()
+        resp = resource.get_list(build_get_request(meta={'HTTP_IF_NONE_MATCH': etag}))
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp['ETag'], etag)
+
+        Note.objects.filter(pk=1).delete()
+        self.assertEqual(resource.get_list(build_get_request(meta={'HTTP_IF_NONE_MATCH': resp['ETag']})).status_code, 200)
+
+    def test_get_list_if_modified_since(self):
+        resource = ConditionalNoteResource()
+        last_modified = resource.get_list(build_get_request())['Last-Modified']
+        Note.objects.filter(pk=1).delete()
+
+        # The latest modification time is the same, but the list isn't.
+        self.assertEqual(resource.get_list(build_get_request())['Last-Modified'], last_modified)
+        self.assertEqual(resource.get_list(build_get_request(meta={'HTTP_IF_MODIFIED_SINCE': last_modified})).status_code, 200)
+
+        # Unless the field tracks deletes.
+        with patch.object(resource._meta, 'last_modified_tracks_deletes', True):
+            self.assertEqual(resource.get_list(build_get_request(meta={'HTTP_IF_MODIFIED_SINCE': last_modified})).status_code, 304)
+
+    def test_etag_from_content(self):
+        resource = ContentETagNoteResource()
+        resp = resource.get_detail(build_get_request(), pk=1)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['ETag'], '"%s"' % hashlib.md5(resp.content).hexdigest())
+        self.assertFalse(resp.has_header('Last-Modified'))
+
+        resp = resource.get_detail(build_get_request(meta={'HTTP_IF_NONE_MATCH': '"abc", %s' % resp['ETag']}), pk=1)
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.content, b'')
+
+        resp = resource.get_list(build_get_request(meta={'HTTP_IF_NONE_MATCH': '*'}))
+        self.assertEqual(resp.status_code, 304)
+
+
+class CachedResponseNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        cache = SimpleCache(timeout=3600)
+        cache_responses = True
+        last_modified_field = 'updated'
+
+
+class ResponseCacheTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def tearDown(self):
+        cache.clear()
+        super(ResponseCacheTestCase, self).tearDown()
+
+    def test_cached_list(self):
+        resource = CachedResponseNoteResource()
+        resp = resource.dispatch('list', build_get_request())
+        self.assertEqual(resp.status_code, 200)
+
+        with self.assertNumQueries(0):
+            cached_resp = resource.dispatch('list', build_get_request())
+
+        self.assertEqual(cached_resp.status_code, 200)
+        self.assertEqual(cached_resp.content, resp.content)
+        self.assertEqual(cached_resp['Content-Type'], resp['Content-Type'])
+        self.assertEqual(cached_resp['ETag'], resp['ETag'])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.dispatch('list', build_get_request(meta={'HTTP_IF_NONE_MATCH': resp['ETag']})).status_code, 304)
+
+        # Writes to the model expire the cached responses.
+        note = Note.objects.get(pk=2)
+        note.title = 'Cached No More'
+        note.save()
+        resp = resource.dispatch('list', build_get_request())
+        self.assertTrue(b'Cached No More' in resp.content)
+
+        Note.objects.get(pk=2).delete()
+        resp = resource.dispatch('list', build_get_request())
+        self.assertFalse(b'Cached No More' in resp.content)
+
+    def test_cached_detail(self):
+        resource = CachedResponseNoteResource()
+        resp = resource.dispatch('detail', build_get_request(), pk=1)
+        self.assertEqual(resp.status_code, 200)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.dispatch('detail', build_get_request(), pk=1).content, resp.content)
+
+        # Other objects & missing ones aren't served from it.
+        self.assertNotEqual(resource.dispatch('detail', build_get_request(), pk=2).content, resp.content)
+        self.assertEqual(resource.dispatch('detail', build_get_request(), pk=1000).status_code, 404)
+        self.assertEqual(resource.dispatch('detail', build_get_request(), pk=1000).status_code, 404)
+
+    def test_invalidation_connected_on_creation(self):
+        resource = CachedResponseNoteResource()
+        generation = resource.get_cache_generation()
+
+        # Writes expire the responses even if none were served yet.
+        Note.objects.get(pk=1).save()
+        self.assertNotEqual(resource.get_cache_generation(), generation)
+
+        # Writes to unrelated models don't.
+        generation = resource.get_cache_generation()
+        User.objects.get(username='johndoe').save()
+        self.assertEqual(resource.get_cache_generation(), generation)
+
+        # The receivers are bound to the models.
+        from django.db.models.signals import post_save
+        senders = [lookup_key[1] for lookup_key, receiver in post_save.receivers if 'CachedResponseNoteResource' in str(lookup_key[0])]
+        self.assertEqual(senders, [id(Note)])
+
+        # It's only done once per resource class.
+        with patch.object(CachedResponseNoteResource, 'connect_response_cache_invalidation') as mock_connect:
+            CachedResponseNoteResource()
+            self.assertFalse(mock_connect.called)
+
+    def test_get_response_cache_key(self):
+        resource = CachedResponseNoteResource()
+        key = resource.get_response_cache_key(build_get_request(), 'list')
+        self.assertEqual(resource.get_response_cache_key(build_get_request(), 'list'), key)
+        self.assertNotEqual(resource.get_response_cache_key(build_get_request(), 'detail', pk=1), key)
+
+        request = build_get_request()
+        request.GET = {'format': 'xml'}
+        self.assertNotEqual(resource.get_response_cache_key(request, 'list'), key)
+
+        # The order of the parameters doesn't matter.
+        first = build_get_request()
+        first.GET = QueryDict('format=json&limit=1&offset=1')
+        second = build_get_request()
+        second.GET = QueryDict('offset=1&format=json&limit=1')
+        self.assertEqual(resource.get_response_cache_key(first, 'list'), resource.get_response_cache_key(second, 'list'))
+
+        request = build_get_request()
+        request.user = User.objects.get(username='johndoe')
+        self.assertNotEqual(resource.get_response_cache_key(request, 'list'), key)
+
+        resource.invalidate_cached_responses()
+        self.assertNotEqual(resource.get_response_cache_key(build_get_request(), 'list'), key)
+
+
+class CachedNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        cache = SimpleCache(timeout=3600)
+
+
+class CacheGenerationTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def tearDown(self):
+        cache.clear()
+        super(CacheGenerationTestCase, self).tearDown()
+
+    def test_generations(self):
+        resource = CachedNoteResource()
+        generation = resource.get_cache_generation()
+        self.assertEqual(resource.get_cache_generation(), generation)
+        key = resource.generate_cache_key('abc')
+        self.assertTrue(generation in key)
+
+        new_generation = resource.bump_cache_generation()
+        self.assertNotEqual(new_generation, generation)
+        self.assertEqual(resource.get_cache_generation(), new_generation)
+        self.assertNotEqual(resource.generate_cache_key('abc'), key)
+
+        # The scopes are independent of each other.
+        list_generation = resource.get_cache_generation('list')
+        detail_generation = resource.get_cache_generation('detail', 1)
+        resource.bump_object_cache_generations(2)
+        self.assertNotEqual(resource.get_cache_generation('list'), list_generation)
+        self.assertEqual(resource.get_cache_generation('detail', 1), detail_generation)
+        self.assertEqual(resource.get_cache_generation(), new_generation)
+
+    def test_writes_expire_cached_objects(self):
+        resource = CachedNoteResource()
+        request = HttpRequest()
+        bundle = resource.build_bundle(request=request)
+
+        self.assertEqual(resource.cached_obj_get(bundle, pk=1).title, u'First Post!')
+        self.assertEqual(resource.cached_obj_get(bundle, pk=2).title, u'Another Post')
+        self.assertEqual(len(resource.cached_obj_get_list(bundle)), 4)
+
+        with self.assertNumQueries(0):
+            resource.cached_obj_get(bundle, pk=1)
+            resource.cached_obj_get(bundle, pk=2)
+            resource.cached_obj_get_list(bundle)
+
+        update_bundle = resource.build_bundle(data={'title': 'Updated Post'}, request=request)
+        resource.obj_update(update_bundle, pk=1)
+        self.assertEqual(resource.cached_obj_get(bundle, pk=1).title, u'Updated Post')
+        self.assertEqual([note.title for note in resource.cached_obj_get_list(bundle)], [u'Updated Post', u'Another Post', u'Recent Volcanic Activity.', u"Granny's Gone"])
+
+        # Other objects stay cached.
+        with self.assertNumQueries(0):
+            resource.cached_obj_get(bundle, pk=2)
+
+        create_bundle = resource.build_bundle(data={'title': 'New Post', 'slug': 'new-post', 'content': 'New.', 'is_active': True}, request=request)
+        resource.obj_create(create_bundle)
+        self.assertEqual(len(resource.cached_obj_get_list(bundle)), 5)
+
+        resource.obj_delete(Bundle(request=request), pk=2)
+        self.assertRaises(Note.DoesNotExist, resource.cached_obj_get, bundle, pk=2)
+        self.assertEqual(len(resource.cached_obj_get_list(bundle)), 4)
+
+        resource.obj_delete_list(Bundle(request=request))
+        self.assertEqual(len(resource.cached_obj_get_list(bundle)), 0)
+        self.assertRaises(Note.DoesNotExist, resource.cached_obj_get, bundle, pk=1)
+
+    def test_round_trips(self):
+        resource = CachedNoteResource()
+        bundle = resource.build_bundle(request=HttpRequest())
+        resource.cached_obj_get(bundle, pk=1)
+
+        with patch.object(SimpleCache, 'get', wraps=resource._meta.cache.get) as mock_get:
+            with patch.object(SimpleCache, 'get_many', wraps=resource._meta.cache.get_many) as mock_get_many:
+                self.assertEqual(resource.cached_obj_get(bundle, pk=1).pk, 1)
+
+        # One for the generations & one for the object.
+        self.assertEqual(mock_get_many.call_count, 1)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_no_cache(self):
+        resource = NoteResource()
+        self.assertFalse(resource.uses_cache_generations())
+        self.assertTrue(CachedNoteResource().uses_cache_generations())
+
+        with patch.object(NoCache, 'set') as mock_set:
+            self.assertEqual(resource.get_cache_generation('detail', 1), '0')
+            self.assertEqual(resource.bump_cache_generation('list'), '0')
+            resource.bump_object_cache_generations(1, 2)
+
+        self.assertFalse(mock_set.called)
+
+    def test_atomic_bumps_after_commit(self):
+        resource = CachedNoteResource()
+
+        with resource.atomic():
+            resource.bump_cache_generation('list')
+            # A concurrent request caches the old data under the new generation.
+            generation = resource.get_cache_generation('list')
+
+        self.assertNotEqual(resource.get_cache_generation('list'), generation)
+
+        # Nothing is bumped again if the block fails.
+        generation = resource.get_cache_generation('list')
+
+        try:
+            with resource.atomic():
+                resource.bump_cache_generation('list')
+                generation = resource.get_cache_generation('list')
+                raise ValueError()
+        except ValueError:
+            pass
+
+        self.assertEqual(resource.get_cache_generation('list'), generation)
+
+
+class DehydratedCacheNoteResource(DetailedNoteResource):
+    user = fields.ForeignKey(UserResource, 'author', full=True)
+
+    class Meta:
+        resource_name = 'detailednotes'
+        queryset = Note.objects.filter(is_active=True)
+        authorization = Authorization()
+        cache = SimpleCache(timeout=3600)
+        cache_dehydrated = True
+
+
+class CachedFullDehydrateTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def tearDown(self):
+        cache.clear()
+        super(CachedFullDehydrateTestCase, self).tearDown()
+
+    def test_get_detail(self):
+        resource = DehydratedCacheNoteResource()
+        json_resp = resource.get_detail(build_get_request(), pk=1)
+        xml_resp = resource.get_detail(build_get_request(format='xml'), pk=1)
+        self.assertEqual(json_resp.status_code, 200)
+
+        with patch.object(DehydratedCacheNoteResource, 'full_dehydrate') as mock_full_dehydrate:
+            self.assertEqual(resource.get_detail(build_get_request(), pk=1).content, json_resp.content)
+            # Nested related data serializes the same way.
+            self.assertEqual(resource.get_detail(build_get_request(format='xml'), pk=1).content, xml_resp.content)
+            self.assertFalse(mock_full_dehydrate.called)
+
+        # Updates expire that object's entries only.
+        resource.obj_update(resource.build_bundle(data={'title': 'Updated Post'}, request=HttpRequest()), pk=1)
+        self.assertTrue(b'Updated Post' in resource.get_detail(build_get_request(), pk=1).content)
+
+        # Without the option, nothing is stored.
+        self.assertEqual(DetailedNoteResource().get_detail(build_get_request(), pk=1).status_code, 200)
+
+    def test_get_multiple(self):
+        resource = DehydratedCacheNoteResource()
+        request = build_get_request()
+        resp = resource.get_multiple(request, pk_list='1;2')
+        self.assertEqual(resp.status_code, 200)
+
+        with patch.object(DehydratedCacheNoteResource, 'full_dehydrate') as mock_full_dehydrate:
+            self.assertEqual(resource.get_multiple(build_get_request(), pk_list='1;2').content, resp.content)
+            self.assertFalse(mock_full_dehydrate.called)
+
+        # The list & detail representations are kept apart.
+        detail = json.loads(resource.get_detail(build_get_request(), pk=2).content.decode('utf-8'))
+        self.assertEqual(detail['title'], u'Another Post')
+
+    def test_round_trips(self):
+        resource = DehydratedCacheNoteResource()
+        backend = resource._meta.cache
+        request = build_get_request()
+
+        for expected_set_many in (1, 0):
+            bundles = [resource.build_bundle(obj=obj, request=request) for obj in Note.objects.filter(is_active=True)]
+
+            with patch.object(backend, 'get_many', wraps=backend.get_many) as mock_get_many:
+                with patch.object(backend, 'get', wraps=backend.get) as mock_get:
+                    with patch.object(backend, 'set_many', wraps=backend.set_many) as mock_set_many:
+                        resource.cached_full_dehydrate_list(bundles, for_list=True)
+
+            # One for the generations & one for the entries, whatever the
+            # number of objects.
+            self.assertEqual(mock_get_many.call_count, 2)
+            self.assertEqual(mock_get.call_count, 0)
+            self.assertEqual(mock_set_many.call_count, expected_set_many)
+            self.assertEqual([bundle.data['title'] for bundle in bundles], [u'First Post!', u'Another Post', u'Recent Volcanic Activity.', u'Granny\'s Gone'])
+
+    def test_varies_by_user(self):
+        resource = DehydratedCacheNoteResource()
+        bundle = resource.build_bundle(obj=Note.objects.get(pk=1), request=build_get_request())
+        anonymous_key = resource.get_dehydrated_cache_key(bundle)
+
+        user_bundle = resource.build_bundle(obj=bundle.obj, request=build_get_request())
+        user_bundle.request.user = User.objects.get(username='johndoe')
+        user_key = resource.get_dehydrated_cache_key(user_bundle)
+        self.assertNotEqual(user_key, anonymous_key)
+        self.assertEqual(resource.get_dehydrated_cache_key(user_bundle), user_key)
+
+        # Without anything to vary on, the entries are shared.
+        with patch.object(DehydratedCacheNoteResource, 'get_dehydrated_cache_vary', return_value=[]):
+            self.assertEqual(resource.get_dehydrated_cache_key(bundle), resource.get_dehydrated_cache_key(user_bundle))
+
+    def test_cacheable_dehydrated_data(self):
+        resource = DehydratedCacheNoteResource()
+        bundle = resource.full_dehydrate(resource.build_bundle(obj=Note.objects.get(pk=1), request=HttpRequest()))
+        data = resource.cacheable_dehydrated_data(bundle.data)
+        self.assertTrue(isinstance(data['user'], Bundle))
+        self.assertEqual(data['user'].obj, None)
+        self.assertEqual(data['user'].request, None)
+        self.assertEqual(data['user'].data['username'], u'johndoe')
+        self.assertEqual(data['title'], u'First Post!')
+
+
+class SparseNoteResource(PlannedNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True)
+        resource_name = 'plannednotes'
+        fields = ['id', 'title', 'slug', 'author', 'subjects', 'media_bits']
+        sparse_fields_param = 'fields'
+
+
+class SparseValuesNoteResource(ValuesNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True).order_by('-created')
+        resource_name = 'notes'
+        fields = ['id', 'title', 'slug', 'content', 'created', 'is_active']
+        use_values = True
+        sparse_fields_param = 'fields'
+        sparse_fields_allowed = ['title', 'slug']
+
+
+class SparseFieldsTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def test_get_sparse_fields(self):
+        resource = SparseNoteResource()
+        self.assertEqual(resource.get_sparse_fields(build_get_request()), None)
+        self.assertEqual(resource.get_sparse_fields(build_get_request(fields='title, slug')), frozenset(['title', 'slug', 'resource_uri']))
+
+        request = build_get_request(fields='title')
+        request.GET.appendlist('fields', 'author')
+        self.assertEqual(resource.get_sparse_fields(request), frozenset(['title', 'author', 'resource_uri']))
+
+        self.assertRaises(BadRequest, resource.get_sparse_fields, build_get_request(fields='title,nope'))
+        self.assertRaises(BadRequest, SparseValuesNoteResource().get_sparse_fields, build_get_request(fields='content'))
+
+        # Off unless there's a parameter name.
+        self.assertEqual(PlannedNoteResource().get_sparse_fields(build_get_request(fields='title')), None)
+
+    def test_get_list(self):
+        resource = SparseNoteResource()
+        resp = resource.get_list(build_get_request(fields='title'))
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(len(data['objects']), 4)
+        self.assertEqual(sorted(data['objects'][0].keys()), ['resource_uri', 'title'])
+        self.assertEqual(data['objects'][0]['resource_uri'], '/api/v1/plannednotes/1/')
+
+        # Neither the relations nor the other columns are loaded.
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.get_list(build_get_request(fields='title'))
+
+        self.assertEqual(len(queries), 2)
+        self.assertFalse('"content"' in queries[1]['sql'])
+        self.assertFalse('"slug"' in queries[1]['sql'])
+
+        resp = resource.get_list(build_get_request(fields='title,media_bits'))
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(sorted(data['objects'][0].keys()), ['media_bits', 'resource_uri', 'title'])
+
+    def test_plans_not_kept_per_sparse_fields(self):
+        resource = SparseNoteResource()
+        plan = resource.get_dehydration_plan(for_list=True)
+        self.assertEqual([entry[0] for entry in resource.get_dehydration_plan(for_list=True, sparse_fields=frozenset(['title', 'resource_uri']))], ['title', 'resource_uri'])
+        resource.get_dehydration_plan(for_list=True, sparse_fields=frozenset(['slug', 'resource_uri']))
+
+        # Only the full plan is kept, whatever the client asks for.
+        self.assertEqual(list(resource._bound_dehydration_plans.values()), [plan])
+
+        resource = SparseValuesNoteResource()
+        plan = resource.get_values_plan()
+        self.assertEqual([entry[0] for entry in resource.get_values_plan(sparse_fields=frozenset(['title', 'resource_uri']))], ['title', 'resource_uri'])
+        self.assertEqual(resource._bound_dehydration_plans[('values', True, resource._meta.api_name, resource._meta.resource_name)], plan)
+        self.assertEqual(len(resource._bound_dehydration_plans), 2)
+
+    def test_build_query_plan(self):
+        resource = SparseNoteResource()
+        self.assertEqual(resource.build_query_plan(sparse_fields=frozenset(['title'])), {
+            'select_related': [],
+            'prefetch_related': [],
+        })
+        self.assertEqual(resource.build_query_plan(sparse_fields=frozenset(['title', 'author'])), {
+            'select_related': ['author'],
+            'prefetch_related': [],
+        })
+
+    def test_apply_sparse_fields(self):
+        resource = SparseNoteResource()
+        object_list = resource.apply_sparse_fields(Note.objects.all(), sparse_fields=frozenset(['title', 'author', 'subjects', 'resource_uri']))
+        self.assertEqual(object_list.query.deferred_loading, (set(['author', 'id', 'title']), False))
+
+        object_list = Note.objects.all()
+        self.assertTrue(resource.apply_sparse_fields(object_list) is object_list)
+        self.assertTrue(HookedValuesNoteResource().apply_sparse_fields(object_list, sparse_fields=frozenset(['title'])) is object_list)
+
+    def test_get_detail(self):
+        resource = SparseNoteResource()
+        resp = resource.get_detail(build_get_request(fields='slug'), pk=1)
+        self.assertEqual(json.loads(resp.content.decode('utf-8')), {'resource_uri': '/api/v1/plannednotes/1/', 'slug': 'first-post'})
+
+        # Only the needed columns are loaded, in a single query.
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.get_detail(build_get_request(fields='slug'), pk=1)
+
+        self.assertEqual(len(queries), 1)
+        self.assertFalse('"content"' in queries[0]['sql'])
+        self.assertFalse('"title"' in queries[0]['sql'])
+
+        # The validators are loaded for conditional requests.
+        object_list = ConditionalNoteResource().apply_sparse_fields(Note.objects.all(), sparse_fields=frozenset(['title']))
+        self.assertEqual(object_list.query.deferred_loading, (set(['id', 'title', 'updated']), False))
+
+    def test_values(self):
+        resource = SparseValuesNoteResource()
+        objects = resource.apply_values(resource.get_object_list(None), sparse_fields=frozenset(['title', 'resource_uri']))
+        row = list(objects)[0]
+        self.assertEqual(sorted(row.keys()), ['created', 'pk', 'title'])
+
+        resp = resource.get_list(build_get_request(fields='title'))
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(data['objects'][0], {'resource_uri': resource.get_resource_uri(Note.objects.get(pk=6)), 'title': "Granny's Gone"})
+
+
+class ExpandNoteResource(PlannedNoteResource):
+    class Meta:
+        queryset = Note.objects.filter(is_active=True)
+        resource_name = 'plannednotes'
+        fields = ['id', 'title', 'slug', 'author', 'subjects', 'media_bits']
+        expand_param = 'expand'
+        expand_allowed = ['author', 'subjects']
+        max_expand_depth = 1
+
+
+class ExpandSubjectResource(ModelResource):
+    notes = fields.ToManyField(PlannedNoteResource, 'notes')
+
+    class Meta:
+        queryset = Subject.objects.all().order_by('pk')
+        resource_name = 'plannedsubjects'
+        expand_param = 'expand'
+        expand_allowed = ALL
+
+
+class ExpansionTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def setUp(self):
+        super(ExpansionTestCase, self).setUp()
+
+        for name in ('News', 'Sports'):
+            subject = Subject.objects.create(name=name, url='/%s/' % name.lower())
+
+            for note in Note.objects.filter(is_active=True):
+                note.subjects.add(subject)
+
+    def test_get_expansions(self):
+        resource = ExpandSubjectResource()
+        self.assertEqual(resource.get_expansions(build_get_request()), None)
+        self.assertEqual(resource.get_expansions(build_get_request(expand='notes')), {'notes': {}})
+        self.assertEqual(resource.get_expansions(build_get_request(expand='notes.author, notes.subjects')), {'notes': {'author': {}, 'subjects': {}}})
+        self.assertRaises(BadRequest, resource.get_expansions, build_get_request(expand='name'))
+        self.assertRaises(BadRequest, resource.get_expansions, build_get_request(expand='notes.title'))
+        self.assertRaises(BadRequest, resource.get_expansions, build_get_request(expand='notes.subjects.notes'))
+
+        resource = ExpandNoteResource()
+        self.assertEqual(resource.get_expansions(build_get_request(expand='author')), {'author': {}})
+        self.assertRaises(BadRequest, resource.get_expansions, build_get_request(expand='media_bits'))
+
+        # Nothing can be expanded unless it's allowed.
+        resource._meta.expand_allowed = []
+
+        try:
+            self.assertRaises(BadRequest, resource.get_expansions, build_get_request(expand='author'))
+        finally:
+            resource._meta.expand_allowed = ['author', 'subjects']
+
+        # Off unless there's a parameter name.
+        self.assertEqual(PlannedNoteResource().get_expansions(build_get_request(expand='author')), None)
+
+    def test_build_query_plan(self):
+        resource = ExpandSubjectResource()
+        self.assertEqual(resource.build_query_plan(), {
+            'select_related': [],
+            'prefetch_related': ['notes'],
+        })
+        self.assertEqual(resource.build_query_plan(expand={'notes': {'author': {}}}), {
+            'select_related': [],
+            'prefetch_related': ['notes', 'notes__author', 'notes__media_bits', 'notes__subjects'],
+        })
+
+    def test_get_list(self):
+        resource = ExpandNoteResource()
+        data = json.loads(resource.get_list(build_get_request()).content.decode('utf-8'))
+        self.assertEqual(data['objects'][0]['author'], '/api/v1/users/1/')
+
+        with self.assertNumQueries(4):
+            resp = resource.get_list(build_get_request(expand='author'))
+
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(data['objects'][0]['author']['username'], 'johndoe')
+        self.assertTrue(isinstance(data['objects'][0]['subjects'][0], six.string_types))
+
+    def test_get_list_nested(self):
+        resource = ExpandSubjectResource()
+
+        # The queries don't grow with the number of subjects or notes.
+        with self.assertNumQueries(6):
+            resp = resource.get_list(build_get_request(expand='notes.author'))
+
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(len(data['objects']), 2)
+        note = data['objects'][0]['notes'][0]
+        self.assertEqual(note['title'], 'First Post!')
+        self.assertEqual(note['author']['username'], 'johndoe')
+        self.assertEqual(len(note['subjects']), 2)
+        self.assertTrue(isinstance(note['subjects'][0], six.string_types))
+
+    def test_get_detail(self):
+        resource = ExpandNoteResource()
+        data = json.loads(resource.get_detail(build_get_request(expand='author'), pk=1).content.decode('utf-8'))
+        self.assertEqual(data['author']['username'], 'johndoe')
+        data = json.loads(resource.get_detail(build_get_request(), pk=1).content.decode('utf-8'))
+        self.assertEqual(data['author'], '/api/v1/users/1/')
+
+
+class BatchNoteResource(NoteResource):
+    subject_count = fields.IntegerField(readonly=True, null=True)
+
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+
+    def batch_dehydrate_subject_count(self, bundles):
+        counts = dict(Note.objects.filter(pk__in=[bundle.obj.pk for bundle in bundles]).annotate(subject_count=Count('subjects')).values_list('pk', 'subject_count'))
+        return [counts[bundle.obj.pk] for bundle in bundles]
+
+    def dehydrate_list(self, bundles):
+        for position, bundle in enumerate(bundles):
+            bundle.data['position'] = position
+
+        return bundles
+
+
+class BatchSubjectResource(ModelResource):
+    notes = fields.ToManyField(BatchNoteResource, 'notes', full=True)
+
+    class Meta:
+        queryset = Subject.objects.all().order_by('pk')
+        resource_name = 'subjects'
+
+
+class BatchDehydrateTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def setUp(self):
+        super(BatchDehydrateTestCase, self).setUp()
+        subject = Subject.objects.create(name='News', url='/news/')
+
+        for note in Note.objects.filter(pk__in=[1, 2]):
+            note.subjects.add(subject)
+
+    def test_get_list(self):
+        resource = BatchNoteResource()
+
+        # One count, one page & one for the whole page's subject counts.
+        for limit in ('1', '4'):
+            with self.assertNumQueries(3):
+                resp = resource.get_list(build_get_request(limit=limit))
+
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([note['subject_count'] for note in data['objects']], [1, 1, 0, 0])
+        self.assertEqual([note['position'] for note in data['objects']], [0, 1, 2, 3])
+
+    def test_get_detail_and_multiple(self):
+        resource = BatchNoteResource()
+        data = json.loads(resource.get_detail(build_get_request(), pk=1).content.decode('utf-8'))
+        self.assertEqual(data['subject_count'], 1)
+        self.assertEqual(data['position'], 0)
+
+        data = json.loads(resource.get_multiple(build_get_request(), pk_list='4;2').content.decode('utf-8'))
+        self.assertEqual([(note['id'], note['subject_count'], note['position']) for note in data['objects']], [(4, 0, 0), (2, 1, 1)])
+
+    def test_nested(self):
+        resource = BatchSubjectResource()
+
+        with patch.object(BatchNoteResource, 'dehydrate_list', side_effect=lambda bundles: bundles) as mock_dehydrate_list:
+            resp = resource.get_detail(build_get_request(), pk=Subject.objects.get().pk)
+
+        # Once for all the nested notes.
+        self.assertEqual(mock_dehydrate_list.call_count, 1)
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([note['subject_count'] for note in data['notes']], [1, 1])
+
+    def test_nested_list(self):
+        resource = BatchSubjectResource()
+        subject = Subject.objects.create(name='Sports', url='/sports/')
+        Note.objects.get(pk=4).subjects.add(subject)
+
+        def number_bundles(bundles):
+            return [Bundle(obj=bundle.obj, data=dict(bundle.data, number=number)) for number, bundle in enumerate(bundles)]
+
+        # Once for the nested notes of the whole page, using the bundles it
+        # returns.
+        with patch.object(BatchNoteResource, 'dehydrate_list', side_effect=number_bundles) as mock_dehydrate_list:
+            with patch.object(BatchNoteResource, 'batch_dehydrate_subject_count', side_effect=lambda bundles: [len(bundles)] * len(bundles)) as mock_batch:
+                resp = resource.get_list(build_get_request())
+
+        self.assertEqual(mock_dehydrate_list.call_count, 1)
+        self.assertEqual(mock_batch.call_count, 1)
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual([[(note['id'], note['number'], note['subject_count']) for note in subject['notes']] for subject in data['objects']], [[(1, 0, 3), (2, 1, 3)], [(4, 2, 3)]])
+
+    def test_full_dehydrate_list(self):
+        resource = BatchNoteResource()
+        bundles = [resource.build_bundle(obj=note) for note in Note.objects.filter(pk__in=[1, 4]).order_by('pk')]
+
+        with self.assertNumQueries(1):
+            bundles = resource.full_dehydrate_list(bundles)
+
+        self.assertEqual([bundle.data['subject_count'] for bundle in bundles], [1, 0])
+
+        # Unless it's picked through the sparse fields.
+        bundles = [resource.build_bundle(obj=note, sparse_fields=frozenset(['title'])) for note in Note.objects.filter(pk__in=[1, 4])]
+
+        with self.assertNumQueries(0):
+            bundles = resource.full_dehydrate_list(bundles)
+
+        self.assertFalse('subject_count' in bundles[0].data)
+
+
+class AggregateNoteResource(NoteResource):
+    subject_count = fields.CountField('subjects')
+    has_media = fields.ExistsField('media_bits')
+    last_subject = fields.MaxField('subjects__name')
+
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        filtering = {
+            'subject_count': ALL,
+            'has_media': ['exact'],
+        }
+        ordering = ['subject_count', 'id']
+
+
+class AggregateFieldTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def setUp(self):
+        super(AggregateFieldTestCase, self).setUp()
+        news = Subject.objects.create(name='News', url='/news/')
+        sports = Subject.objects.create(name='Sports', url='/sports/')
+        news.notes.add(Note.objects.get(pk=1), Note.objects.get(pk=2))
+        sports.notes.add(Note.objects.get(pk=1))
+        MediaBit.objects.create(note=Note.objects.get(pk=1), title='Picture')
+        MediaBit.objects.create(note=Note.objects.get(pk=1), title='Another')
+        MediaBit.objects.create(note=Note.objects.get(pk=4), title='Volcano')
+
+    def _get_list(self, **params):
+        resp = AggregateNoteResource().get_list(build_get_request(**params))
+        self.assertEqual(resp.status_code, 200)
+        return json.loads(resp.content.decode('utf-8'))['objects']
+
+    def test_fields(self):
+        field = AggregateNoteResource.base_fields['subject_count']
+        self.assertEqual(field.attribute, 'subject_count')
+        self.assertTrue(field.readonly)
+        self.assertEqual(field.get_aggregate().extra, {'distinct': True})
+        self.assertEqual(sorted(AggregateNoteResource().get_annotations().keys()), ['has_media', 'last_subject', 'subject_count'])
+
+    def test_get_list(self):
+        # The aggregates come with the page's own query.
+        with self.assertNumQueries(2):
+            objects = self._get_list()
+
+        # Joining both relations doesn't inflate the distinct counts.
+        self.assertEqual([(note['id'], note['subject_count'], note['has_media'], note['last_subject']) for note in objects], [
+            (1, 2, True, 'Sports'),
+            (2, 1, False, 'News'),
+            (4, 0, True, None),
+            (6, 0, False, None),
+        ])
+
+    def test_get_detail(self):
+        resp = AggregateNoteResource().get_detail(build_get_request(), pk=1)
+        data = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(data['subject_count'], 2)
+        self.assertEqual(data['has_media'], True)
+
+    def test_filtering(self):
+        self.assertEqual([note['id'] for note in self._get_list(subject_count__gte='1')], [1, 2])
+        self.assertEqual([note['id'] for note in self._get_list(has_media='true')], [1, 4])
+        self.assertEqual([note['id'] for note in self._get_list(has_media='false')], [2, 6])
+        self.assertEqual(AggregateNoteResource().build_filters({'has_media': 'true'}), {'has_media__gt': 0})
+
+        with self.assertRaises(InvalidFilterError):
+            AggregateNoteResource().build_filters({'last_subject': 'News'})
+
+    def test_ordering(self):
+        self.assertEqual([note['id'] for note in self._get_list(order_by=['-subject_count', 'id'])], [1, 2, 4, 6])
+        self.assertEqual([note['id'] for note in self._get_list(order_by=['subject_count', 'id'])], [4, 6, 2, 1])
+
+    def test_delete(self):
+        resource = AggregateNoteResource()
+        resource.obj_delete(Bundle(request=build_get_request()), pk=2)
+        self.assertEqual([note['id'] for note in self._get_list()], [1, 4, 6])
+
+
+class StreamDeserializeNoteResource(NoteResource):
+    class Meta:
+        resource_name = 'notes'
+        authorization = Authorization()
+        queryset = Note.objects.filter(is_active=True)
+        stream_deserialize = True
+        stream_chunk_size = 1
+
+
+class AlteredStreamDeserializeNoteResource(StreamDeserializeNoteResource):
+    def alter_deserialized_list_data(self, request, data):
+        data['objects'] = data['objects'][:1]
+        return data
+
+
+class StreamDeserializeTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+    urls = 'core.tests.field_urls'
+
+    def _request(self, method, body, content_type='application/json'):
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        request.method = method
+        request.META['CONTENT_TYPE'] = content_type
+        request._stream = BytesIO(body.encode('utf-8'))
+        request._read_started = False
+        return request
+
+    def test_patch_list(self):
+        resource = StreamDeserializeNoteResource()
+        request = self._request('PATCH', u'{"deleted_objects": ["/api/v1/notes/1/"], "objects": [{"content": "The cat is back.", "is_active": true, "slug": "cat-is-back-again", "title": "The Cat \u2603"}, {"resource_uri": "/api/v1/notes/2/", "content": "This is note 2."}]}')
+
+        resp = resource.patch_list(request)
+        self.assertEqual(resp.status_code, 202)
+        # The body was only read through the stream.
+        self.assertFalse(hasattr(request, '_body'))
+
+        self.assertEqual(Note.objects.count(), 6)
+        self.assertEqual(Note.objects.filter(is_active=True).count(), 4)
+        self.assertEqual(Note.objects.get(slug='cat-is-back-again').title, u'The Cat \u2603')
+        self.assertEqual(Note.objects.get(pk=2).content, 'This is note 2.')
+
+    def test_patch_list_missing_collection(self):
+        resource = StreamDeserializeNoteResource()
+        request = self._request('PATCH', '{"deleted_objects": ["/api/v1/notes/1/"]}')
+        self.assertRaises(BadRequest, resource.patch_list, request)
+        self.assertEqual(Note.objects.filter(is_active=True).count(), 4)
+
+    def test_put_list(self):
+        resource = StreamDeserializeNoteResource()
+        request = self._request('PUT', '<?xml version="1.0" encoding="utf-8"?><object><objects type="list"><object><content>The cat is back.</content><slug>cat-is-back-again</slug><title>The Cat Is Back</title></object><object><slug>dog</slug><title>The Dog</title></object></objects></object>', content_type='application/xml')
+
+        resp = resource.put_list(request)
+        self.assertEqual(resp.status_code, 204)
+        self.assertFalse(hasattr(request, '_body'))
+        self.assertEqual(sorted(Note.objects.filter(is_active=True).values_list('slug', flat=True)), ['cat-is-back-again', 'dog'])
+
+    def test_put_list_invalid(self):
+        resource = StreamDeserializeNoteResource()
+
+        # Nothing is deleted without the collection.
+        request = self._request('PUT', '{"meta": {}}')
+        self.assertRaises(BadRequest, resource.put_list, request)
+        self.assertEqual(Note.objects.filter(is_active=True).count(), 4)
+
+        # Broken data part way through undoes the whole request.
+        request = self._request('PUT', '{"objects": [{"slug": "cat", "title": "The Cat"}, {"slug": ')
+        self.assertRaises(BadRequest, resource.put_list, request)
+        self.assertEqual(Note.objects.filter(is_active=True).count(), 4)
+        self.assertFalse(Note.objects.filter(slug='cat').exists())
+
+        # So does anything after the object.
+        request = self._request('PUT', '{"objects": [{"slug": "cat", "title": "The Cat"}]} garbage')
+        self.assertRaises(BadRequest, resource.put_list, request)
+        self.assertEqual(Note.objects.filter(is_active=True).count(), 4)
+        self.assertFalse(Note.objects.filter(slug='cat').exists())
+
+    def test_put_list_chunks(self):
+        resource = StreamDeserializeNoteResource()
+        request = self._request('PUT', '{"objects": [{"slug": "cat", "title": "The Cat"}, {"slug": "dog", "title": "The Dog"}]}')
+
+        with patch.object(resource, 'obj_create_list', wraps=resource.obj_create_list) as mocked:
+            resp = resource.put_list(request)
+
+        self.assertEqual(resp.status_code, 204)
+        # The objects are created ``stream_chunk_size`` at a time.
+        self.assertEqual([len(args[0]) for args, kwargs in mocked.call_args_list], [1, 1])
+        self.assertEqual(sorted(Note.objects.filter(is_active=True).values_list('slug', flat=True)), ['cat', 'dog'])
+
+    def test_not_atomic(self):
+        class StreamDeserializeResource(Resource):
+            class Meta:
+                stream_deserialize = True
+
+        resource = StreamDeserializeResource()
+        request = self._request('PUT', '{"objects": []}')
+        # Without a transaction, the data is read as a whole.
+        self.assertFalse(resource.can_stream_deserialize(request))
+
+        resource = StreamDeserializeNoteResource()
+        self.assertFalse(resource.can_stream_deserialize(request))
+
+        with resource.atomic():
+            self.assertTrue(resource.can_stream_deserialize(request))
+
+    def test_altered_list_data(self):
+        resource = AlteredStreamDeserializeNoteResource()
+        request = self._request('PUT', '{"objects": [{"slug": "cat", "title": "The Cat"}, {"slug": "dog", "title": "The Dog"}]}')
+
+        resp = resource.put_list(request)
+        self.assertEqual(resp.status_code, 204)
+        # ``alter_deserialized_list_data`` gets the whole list.
+        self.assertTrue(hasattr(request, '_body'))
+        self.assertEqual(list(Note.objects.filter(is_active=True).values_list('slug', flat=True)), ['cat'])
+
+    def test_already_read(self):
+        resource = StreamDeserializeNoteResource()
+        request = self._request('PUT', '{"objects": [{"slug": "cat", "title": "The Cat"}]}')
+        request.body
+
+        resp = resource.put_list(request)
+        self.assertEqual(resp.status_code, 204)
+        self.assertEqual(list(Note.objects.filter(is_active=True).values_list('slug', flat=True)), ['cat'])
@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 import datetime
+from io import BytesIO
+import json
+import mock
 import yaml
 from decimal import Decimal
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
+from django.utils import six
 from tastypie.bundle import Bundle
 from tastypie import fields
-from tastypie.exceptions import BadRequest
-from tastypie.serializers import Serializer
+from tastypie.exceptions import BadRequest, UnsupportedFormat
+from tastypie.serializers import Serializer, JSONBackend, IncrementalJSONReader, lxml
 from tastypie.resources import ModelResource
 from core.models import Note
 
@@ -17,6 +21,11 @@ try:
 except ImportError:
     biplist = None
 
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 
 class UnsafeObject(object):
     pass
@@ -48,12 +57,12 @@ class SerializerTestCase(TestCase):
     def test_init(self):
         serializer_1 = Serializer()
         self.assertEqual(serializer_1.formats, ['json', 'xml', 'yaml', 'html', 'plist'])
-        self.assertEqual(serializer_1.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist'})
+        self.assertEqual(serializer_1.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist', 'ndjson': 'application/x-ndjson'})
         self.assertEqual(serializer_1.supported_formats, ['application/json', 'application/xml', 'text/yaml', 'text/html', 'application/x-plist'])
 
         serializer_2 = Serializer(formats=['json', 'xml'])
         self.assertEqual(serializer_2.formats, ['json', 'xml'])
-        self.assertEqual(serializer_2.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist'})
+        self.assertEqual(serializer_2.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist', 'ndjson': 'application/x-ndjson'})
         self.assertEqual(serializer_2.supported_formats, ['application/json', 'application/xml'])
 
         serializer_3 = Serializer(formats=['json', 'xml'], content_types={'json': 'text/json', 'xml': 'application/xml'})
@@ -80,7 +89,7 @@ class SerializerTestCase(TestCase):
             s = Serializer()
             self.assertEqual(list(s.formats), ['json', 'xml'])
             self.assertEqual(list(s.supported_formats), ['application/json', 'application/xml'])
-            self.assertEqual(s.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist'})
+            self.assertEqual(s.content_types, {'xml': 'application/xml', 'yaml': 'text/yaml', 'json': 'application/json', 'jsonp': 'text/javascript', 'html': 'text/html', 'plist': 'application/x-plist', 'ndjson': 'application/x-ndjson'})
 
             # Confirm that subclasses which set their own formats list won't be overriden:
             class JSONSerializer(Serializer):
@@ -239,6 +248,80 @@ class SerializerTestCase(TestCase):
         unicode_xml = binary_xml.decode('utf-8')
         self.assertEqual(unicode_xml, '<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<response><false type="boolean">False</false><somehash type="hash"><foo>bar</foo><pi type="float">3.14</pi></somehash><somelist type="list"><value>hello</value><value type="integer">1</value><value type="null"/></somelist><somestring>hello</somestring><true type="boolean">True</true></response>')
 
+    def test_stream_xml(self):
+        serializer = Serializer()
+        sample_2 = self.get_sample2()
+        expected = serializer.to_xml(sample_2)
+
+        sample_2['somelist'] = iter(sample_2['somelist'])
+        chunks = list(serializer.stream_xml(sample_2))
+        self.assertEqual(b''.join(chunks), expected)
+        self.assertTrue(len(chunks) > 5)
+
+        self.assertEqual(b''.join(serializer.stream_xml({'objects': iter([])})), b'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<response><objects type="list"/></response>')
+        self.assertEqual(b''.join(serializer.stream_xml([1])), b'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<objects><value type="integer">1</value></objects>')
+        self.assertEqual(serializer.to_xml({}), b'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<response/>')
+
+    def test_xml_sort_elements(self):
+        serializer = Serializer(xml_sort_elements=False)
+        binary_xml = serializer.to_xml({'objects': [{'b': 1}, [2]]})
+        self.assertEqual(binary_xml, b'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<response><objects type="list"><object type="hash"><b type="integer">1</b></object><objects><value type="integer">2</value></objects></objects></response>')
+
+        # Sorting is stable, so equal tags keep their order.
+        binary_xml = Serializer().to_xml({'objects': [{'b': 1}, [2], {'a': 3}]})
+        self.assertTrue(b'<objects type="list"><object type="hash"><b type="integer">1</b></object><object type="hash"><a type="integer">3</a></object><objects>' in binary_xml)
+
+    def _stream_to_dict(self, pairs):
+        return dict((key, value if isinstance(value, (dict, six.string_types, int, type(None))) else list(value)) for key, value in pairs)
+
+    def test_deserialize_stream_json(self):
+        serializer = Serializer()
+        content = u'{"objects": [{"title": "☃", "id": 1}, 2.5, [3]], "meta": {"limit": 20}, "deleted_objects": [], "name": null}'
+        self.assertTrue(serializer.can_deserialize_stream('application/json; charset=utf-8'))
+        self.assertFalse(serializer.can_deserialize_stream('text/yaml'))
+
+        pairs = serializer.deserialize_stream(BytesIO(content.encode('utf-8')), format='application/json')
+        self.assertEqual(self._stream_to_dict(pairs), serializer.deserialize(content))
+
+        # Items that aren't consumed are skipped.
+        pairs = serializer.deserialize_stream(BytesIO(content.encode('utf-8')))
+        self.assertEqual([key for key, value in pairs], ['objects', 'meta', 'deleted_objects', 'name'])
+        self.assertEqual(list(serializer.deserialize_stream(BytesIO(b' {} '))), [])
+
+        for content in (b'[1, 2]', b'{"objects": [1, 2}', b'{"objects": [1, 2]', b'{1: 2}', b''):
+            self.assertRaises(BadRequest, self._stream_to_dict, serializer.deserialize_stream(BytesIO(content)))
+
+        # Like ``from_json``, only whitespace may follow the object.
+        for content in (b'{"objects": []} garbage', b'{} {}', b'{"objects": []}]'):
+            self.assertRaises(BadRequest, serializer.deserialize, content)
+            self.assertRaises(BadRequest, self._stream_to_dict, serializer.deserialize_stream(BytesIO(content)))
+
+        self.assertEqual(self._stream_to_dict(serializer.deserialize_stream(BytesIO(b'{"objects": []} \n'))), {'objects': []})
+
+        self.assertRaises(UnsupportedFormat, serializer.deserialize_stream, BytesIO(b'{}'), 'text/yaml')
+
+    def test_incremental_json_reader(self):
+        # Values split over several chunks, including numbers & characters.
+        reader = IncrementalJSONReader(BytesIO(u'[12345, "☃☃", {"a": [true]}, -1.5e3]'.encode('utf-8')), chunk_size=1)
+        reader.expect('[')
+        self.assertEqual(list(reader.iter_array()), [12345, u'☃☃', {'a': [True]}, -1500.0])
+        self.assertEqual(reader.peek(), '')
+
+    def test_deserialize_stream_xml(self):
+        if lxml is None:
+            return
+
+        serializer = Serializer()
+        content = u'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<object><objects type="list"><object><title>☃</title><id type="integer">1</id></object><object><title>Two</title></object></objects><name>Daniel</name><deleted_objects type="list"><value>/api/v1/notes/1/</value></deleted_objects><empty type="list"/></object>'
+        pairs = serializer.deserialize_stream(BytesIO(content.encode('utf-8')), format='application/xml')
+        self.assertEqual(self._stream_to_dict(pairs), serializer.deserialize(content, format='application/xml'))
+
+        pairs = serializer.deserialize_stream(BytesIO(content.encode('utf-8')), format='application/xml')
+        self.assertEqual([key for key, value in pairs], ['objects', 'name', 'deleted_objects', 'empty'])
+
+        for content in (b'<request><objects type="list"></objects></request>', b'<value>1</value>', b'<object><name>', b'<!DOCTYPE bomb [<!ENTITY a "evil chars">]><object><bomb>&a;</bomb></object>'):
+            self.assertRaises(BadRequest, self._stream_to_dict, serializer.deserialize_stream(BytesIO(content), format='application/xml'))
+
     def test_from_xml(self):
         serializer = Serializer()
         data = u'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<request><snowman>☃</snowman><age type="integer">27</age><name>Daniel</name><date_joined>2010-03-27</date_joined><rocksdahouse type="boolean">True</rocksdahouse></request>'
@@ -260,6 +343,103 @@ class SerializerTestCase(TestCase):
         sample_1 = self.get_sample1()
         self.assertEqual(serializer.to_json(sample_1), u'{"age": 27, "date_joined": "2010-03-27", "name": "Daniel", "snowman": "☃"}')
 
+    def test_format_methods(self):
+        serializer = Serializer(formats=['json', 'ndjson'])
+        self.assertEqual(serializer.get_format_method('to', 'application/json'), 'to_json')
+        self.assertEqual(serializer.get_format_method('stream_from', 'application/json'), 'stream_from_json')
+        self.assertEqual(serializer.get_format_method('from', 'application/x-ndjson'), None)
+        self.assertEqual(serializer.get_format_method('to', 'text/bogus'), None)
+
+        # The methods are looked up by name, so later overrides still apply.
+        serializer.to_json = lambda data, options: 'overridden'
+        self.assertEqual(serializer.serialize({}), 'overridden')
+
+    def test_to_simple(self):
+        serializer = DecimalSerializer()
+        data = {
+            'owed': [Decimal('10.50'), 3, u'☃', None, True],
+            'seen': datetime.datetime(2010, 3, 27, 12, 30),
+            'title': Bundle(data={'tags': ('a', 'b')}),
+        }
+        self.assertEqual(serializer.to_simple(data, {}), {
+            'owed': [10.5, 3, u'☃', None, True],
+            'seen': 'SEEN',
+            'title': {'tags': ['a', 'b']},
+        })
+
+        # Handlers are looked up once per type, including subclasses.
+        self.assertEqual(serializer._simple_handler_cache[datetime.datetime], serializer._simple_datetime)
+        self.assertEqual(serializer.to_simple(SubDecimal('2'), {}), 2.0)
+        self.assertEqual(serializer.to_simple(UnsafeObject(), {})[:13], '<core.tests.s')
+
+    def test_json_backends(self):
+        sample = self.get_sample1()
+        sample.update({
+            'owed': Decimal('10.50'),
+            'bundle': Bundle(data={'tags': ('a', 'b')}),
+            'seen': datetime.datetime(2010, 3, 27, 12, 30),
+        })
+
+        # The ``default`` hook gives the same output as simplifying up front.
+        expected = json.dumps(Serializer().to_simple(sample, {}), sort_keys=True, ensure_ascii=False)
+        self.assertEqual(Serializer().to_json(sample), expected)
+        self.assertEqual(StubbedSimpleSerializer().to_json(sample), expected)
+        self.assertEqual(Serializer(json_backend='core.tests.serializers.StubbedJSONBackend').to_json(sample), expected)
+
+        serializer = Serializer(json_sort_keys=False)
+        self.assertEqual(serializer.from_json(serializer.to_json(sample)), json.loads(expected))
+
+        # Containers are left to the encoder, only the values inside them
+        # that it can't handle are simplified.
+        serializer = Serializer()
+
+        with mock.patch.object(serializer, 'to_simple', wraps=serializer.to_simple) as mock_to_simple:
+            self.assertEqual(serializer.to_json({'objects': [Bundle(data={'name': 'a', 'tags': ['b'], 'seen': sample['seen']})]}), '{"objects": [{"name": "a", "seen": "2010-03-27T12:30:00", "tags": ["b"]}]}')
+
+        self.assertEqual(mock_to_simple.call_count, 1)
+
+        self.assertRaises(ImproperlyConfigured, Serializer, json_backend='nope')
+        self.assertRaises(ImproperlyConfigured, Serializer, json_backend='core.tests.serializers.Nope')
+
+        if ujson is None:
+            self.assertRaises(ImproperlyConfigured, Serializer, json_backend='ujson')
+        else:
+            self.assertEqual(Serializer(json_backend='ujson').from_json(expected), json.loads(expected))
+
+    def test_stream_json(self):
+        serializer = Serializer()
+
+        sample_1 = self.get_sample1()
+        self.assertEqual(''.join(serializer.stream_json(sample_1)), serializer.to_json(sample_1))
+
+        sample_2 = self.get_sample2()
+        expected = serializer.to_json(sample_2)
+        sample_2['somelist'] = iter(sample_2['somelist'])
+        self.assertEqual(''.join(serializer.stream_json(sample_2)), expected)
+
+        self.assertEqual(''.join(serializer.stream_json({'objects': iter([])})), '{"objects": []}')
+        self.assertEqual(''.join(serializer.stream_json([1, 2])), '[1, 2]')
+
+        # The backend's separators & ``json_sort_keys`` are followed.
+        for serializer in (Serializer(json_backend=CompactJSONBackend()), Serializer(json_sort_keys=False), Serializer(json_backend=CompactJSONBackend(), json_sort_keys=False)):
+            sample_2 = self.get_sample2()
+            expected = serializer.to_json(sample_2)
+            sample_2['somelist'] = iter(sample_2['somelist'])
+            self.assertEqual(''.join(serializer.stream_json(sample_2)), expected)
+
+    def test_ndjson(self):
+        serializer = Serializer()
+        self.assertTrue(serializer.can_stream('application/x-ndjson'))
+        self.assertFalse(serializer.can_stream('text/yaml'))
+
+        self.assertEqual(serializer.to_ndjson([1, {'a': 2}]), '1\n{"a": 2}\n')
+        self.assertEqual(serializer.to_ndjson({'a': 2}), '{"a": 2}\n')
+
+        data = {'meta': {'limit': 2}, 'objects': iter([{'id': 1}, {'id': 2}])}
+        self.assertEqual(''.join(serializer.serialize_stream(data, 'application/x-ndjson')), '{"meta": {"limit": 2}}\n{"id": 1}\n{"id": 2}\n')
+
+        self.assertRaises(UnsupportedFormat, serializer.serialize_stream, data, 'text/yaml')
+
     def test_from_json(self):
         serializer = Serializer()
 
@@ -362,6 +542,37 @@ class SerializerTestCase(TestCase):
         self.assertEqual(sample_1[b'date_joined'], b'2010-03-27')
         self.assertEqual(sample_1[b'snowman'], u'☃')
 
+class SubDecimal(Decimal):
+    pass
+
+
+class DecimalSerializer(Serializer):
+    simple_handlers = dict(Serializer.simple_handlers)
+    simple_handlers[Decimal] = 'simplify_decimal'
+
+    def simplify_decimal(self, data, options):
+        return float(data)
+
+    def format_datetime(self, data):
+        return 'SEEN'
+
+
+class StubbedSimpleSerializer(Serializer):
+    def to_simple(self, data, options):
+        return super(StubbedSimpleSerializer, self).to_simple(data, options)
+
+
+class StubbedJSONBackend(JSONBackend):
+    supports_default = False
+
+
+class CompactJSONBackend(JSONBackend):
+    separators = (',', ':')
+
+    def dumps(self, data, default=None, sort_keys=True):
+        return json.dumps(data, default=default, sort_keys=sort_keys, ensure_ascii=False, separators=self.separators)
+
+
 class ResourceSerializationTestCase(TestCase):
     fixtures = ['note_testdata.json']
 
@@ -1,4 +1,5 @@
 import datetime
+import mimeparse
 import mock
 
 from django.http import HttpRequest
@@ -6,7 +7,8 @@ from django.test import TestCase
 
 from tastypie.exceptions import BadRequest
 from tastypie.serializers import Serializer
-from tastypie.utils.mime import determine_format, build_content_type
+from tastypie.utils import LRUCache
+from tastypie.utils.mime import determine_format, build_content_type, FORMAT_CACHE_SIZE
 from tastypie.utils.timezone import now
 
 try:
@@ -100,6 +102,72 @@ class MimeTestCase(TestCase):
         request.META = {'HTTP_ACCEPT': 'bogon'}
         self.assertRaises(BadRequest, determine_format, request, serializer)
 
+    def test_determine_format_cache(self):
+        serializer = Serializer()
+        request = HttpRequest()
+        request.META = {'HTTP_ACCEPT': 'text/plain,application/xml,application/json;q=0.9,*/*;q=0.8'}
+
+        with mock.patch('mimeparse.best_match', wraps=mimeparse.best_match) as mock_best_match:
+            for i in range(3):
+                self.assertEqual(determine_format(request, serializer), 'application/xml')
+
+            # The parameters & the default are part of the key.
+            request.GET = {'format': 'json'}
+            self.assertEqual(determine_format(request, serializer), 'application/json')
+            request.GET = {}
+            self.assertEqual(determine_format(request, serializer, default_format='text/yaml'), 'application/xml')
+
+            # Each serializer has its own.
+            self.assertEqual(determine_format(request, Serializer(formats=['json'])), 'application/json')
+
+        self.assertEqual(mock_best_match.call_count, 3)
+
+        # Invalid headers aren't cached.
+        request.META = {'HTTP_ACCEPT': 'bogon'}
+
+        for i in range(2):
+            self.assertRaises(BadRequest, determine_format, request, serializer)
+
+    def test_determine_format_cache_size(self):
+        serializer = Serializer()
+        request = HttpRequest()
+
+        for i in range(FORMAT_CACHE_SIZE + 10):
+            request.META = {'HTTP_ACCEPT': 'application/xml;q=0.%d' % i}
+            determine_format(request, serializer)
+
+        self.assertEqual(len(serializer._format_cache), FORMAT_CACHE_SIZE)
+
+
+class LRUCacheTestCase(TestCase):
+    def test_lru(self):
+        self._test_lru(LRUCache(max_size=2))
+
+    def test_lru_sorted_dict(self):
+        # What's used on Python 2.6, which has no ``OrderedDict``.
+        from django.utils.datastructures import SortedDict
+
+        with mock.patch('tastypie.utils.dict.OrderedDict', SortedDict):
+            cache = LRUCache(max_size=2)
+
+        self.assertTrue(isinstance(cache._data, SortedDict))
+        self._test_lru(cache)
+
+    def _test_lru(self, cache):
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        # ``b`` is the least recently used.
+        cache.set('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('b', 'missing'), 'missing')
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
 
 if TZ_AVAILABLE:
     from pytz.reference import Pacific
@@ -5,7 +5,7 @@ import django
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
-from django.db.models.signals import pre_save
+from django.db.models.signals import m2m_changed, pre_save
 from django.test import TestCase
 
 from tastypie.exceptions import NotFound
@@ -18,7 +18,7 @@ from core.tests.resources import HttpRequest
 from related_resource.api.resources import FreshNoteResource, CategoryResource, PersonResource, JobResource, NoteResource
 from related_resource.api.urls import api
 from related_resource.models import Category, Tag, Taggable, TaggableTag, ExtraData, Company, Person, Dog, DogHouse, Bone, Product, Address, Job, Payment
-from related_resource.models import Label
+from related_resource.models import Label, Post
 
 
 class RelatedResourceTest(TestCase):
@@ -640,6 +640,66 @@ class RelatedSaveCallsTest(TestCase):
         taggable_tag = tag.taggabletags.all()[0]
         self.assertEqual(taggable_tag.extra, 1234)
 
+    def _put_post_labels(self, post, labels):
+        resource = api.canonical_resource_for('post')
+        label_resource = api.canonical_resource_for('label')
+        actions = []
+
+        def _record_action(sender, **kwargs):
+            actions.append((kwargs['action'], sorted(kwargs['pk_set'] or [])))
+
+        request = MockRequest()
+        request.GET = {'format': 'json'}
+        request.method = 'PUT'
+        request.set_body(json.dumps({
+            'name': post.name,
+            'label': [label_resource.get_resource_uri(label) for label in labels],
+        }))
+
+        m2m_changed.connect(_record_action, sender=Post.label.through)
+
+        try:
+            resp = resource.put_detail(request, pk=post.pk)
+        finally:
+            m2m_changed.disconnect(_record_action, sender=Post.label.through)
+
+        self.assertEqual(resp.status_code, 204)
+        return actions
+
+    def test_save_m2m_diff(self):
+        """
+        Updating the m2m data of an object should only remove & add the
+        relations which changed.
+        """
+        l1 = Label.objects.create(name='tea')
+        l2 = Label.objects.create(name='milk')
+        l3 = Label.objects.create(name='sugar')
+        post = Post.objects.create(name='drinks')
+        post.label.add(l1, l2)
+
+        actions = self._put_post_labels(post, [l2, l3])
+        self.assertEqual(actions, [('pre_remove', [l1.pk]), ('post_remove', [l1.pk]), ('pre_add', [l3.pk]), ('post_add', [l3.pk])])
+        self.assertEqual(sorted(post.label.values_list('pk', flat=True)), [l2.pk, l3.pk])
+
+        actions = self._put_post_labels(post, [l2, l3])
+        self.assertEqual(actions, [])
+
+    def test_save_m2m_clear(self):
+        l1 = Label.objects.create(name='tea')
+        l2 = Label.objects.create(name='milk')
+        post = Post.objects.create(name='drinks')
+        post.label.add(l1)
+        resource = api.canonical_resource_for('post')
+        resource._meta.clear_m2m_on_save = True
+
+        try:
+            actions = self._put_post_labels(post, [l1, l2])
+        finally:
+            resource._meta.clear_m2m_on_save = False
+
+        self.assertEqual([action for action, pk_set in actions], ['pre_clear', 'post_clear', 'pre_add', 'post_add'])
+        self.assertEqual(sorted(post.label.values_list('pk', flat=True)), [l1.pk, l2.pk])
+
 
 class CorrectUriRelationsTestCase(TestCase):
     """